@@ -1,7 +1,9 @@
 """Enums for configuring the pipeline registry.."""
 import importlib
 from enum import Enum
-from queue import LifoQueue, Queue
+from queue import Queue
+
+from src.structures.frontier import Frontier
 
 
 class PipelineRegistryKeys(Enum):
@@ -23,7 +25,7 @@ class PipelineRegistryKeys(Enum):
 class PipelineRegistries(Enum):
     """Enum defining pipeline stages and the queue type they use."""
 
-    FETCH = ("FETCH", LifoQueue, "src.workers.pipeline_workers.CrawlerWorker")
+    FETCH = ("FETCH", Frontier, "src.workers.pipeline_workers.CrawlerWorker")
     PROCESS = ("PROCESS", Queue, "src.workers.pipeline_workers.ProcessorWorker")
     LOAD = ("LOAD", Queue, "src.workers.pipeline_workers.LoaderWorker")
 
@@ -7,8 +7,48 @@ from src.utils.paths import project_root
 # ------ GLOBAL VARS -------
 PIPELINE_STRICT = True
 cache_dir = project_root / "cache"
-state_cache_file = cache_dir / "state_cache.json"
+# Write the state cache with the binary codec to state_cache.bin instead of JSON. Each format
+# has its own file and journal, switching formats does not pick up the other one's state.
+state_snapshot_binary = False
+state_cache_file = cache_dir / ("state_cache.bin" if state_snapshot_binary else "state_cache.json")
 known_links_cache_file = cache_dir / "known_links_cache.json"
+html_store_dir = cache_dir / "html"
+# ETag / Last-Modified validators and bodies for conditional re-crawls, None to disable.
+http_cache_dir = cache_dir / "http"
+# Every fetched response is archived here. With fetch_replay the pipeline reruns from the
+# archive, with no network access and no politeness delay.
+response_archive_dir = cache_dir / "archive"
+fetch_replay = False
+# Fingerprints of loaded pages, unchanged pages skip PROCESS and LOAD. None to disable.
+change_ledger_file = cache_dir / "page_fingerprints.jsonl"
+# Drop completed non-root subtrees from the state graph, keeping url -> loaded id tombstones.
+# Off by default, pruned nodes no longer appear in the state cache.
+state_prune_completed = False
+# Fetch rate per domain: starts at one request per fetch_min_delay seconds, adapts to server
+# responses, and never exceeds fetch_max_rate requests per second. The ceiling defaults to
+# the fixed politeness rate, raising it is a deliberate choice per deployment.
+fetch_min_delay = 2.5
+fetch_max_rate = 1 / fetch_min_delay
+# Fetch workers sharing the scheduler, so politeness slots are used while others parse.
+# 1 keeps the single fetch thread of earlier releases.
+fetch_worker_count = 1
+# "thread" runs fetch_worker_count blocking workers, "async" one event loop with up to
+# fetch_async_max_in_flight requests in flight.
+fetch_engine = "thread"
+fetch_async_max_in_flight = 8
+# BeautifulSoup tree builder per PipelineRegistryKeys name, html.parser for the rest.
+# Only switch a page type once tests/unit_test/src/data_pipeline/extract/test_html_parser.py
+# shows identical output for it, e.g. {"BILL": "lxml"}.
+html_parser_backends: dict[str, str] = {}
+# Threads parsing fetched pages for links, so fetch workers only issue requests.
+# 0 parses on the fetch workers.
+link_discovery_worker_count = 0
+# Order of the FETCH queue: "lifo", "fifo", "priority" by page type, or "round_robin" by
+# session. Beyond fetch_frontier_max_in_memory nodes, queued urls spill to frontier_spill_dir.
+# "lifo" keeps the crawl order of the former FETCH LifoQueue.
+fetch_frontier = "lifo"
+fetch_frontier_max_in_memory = 50_000
+frontier_spill_dir = cache_dir / "frontier"
 seed_links = ["https://arkleg.state.ar.us"]
 project_config = {
     "strict": PIPELINE_STRICT,
@@ -0,0 +1,41 @@
+"""Async counterpart of the web crawler, for the async fetch engine."""
+
+import asyncio
+import time
+
+from src.data_pipeline.extract.webcrawler import FETCH_ERRORS, Crawler
+
+
+class AsyncCrawler(Crawler):
+    """
+    Crawler whose get_page is a coroutine.
+
+    Requests go through the same session in the default executor, so many can be in flight
+    at once, and retry backoff awaits asyncio.sleep instead of blocking a thread.
+    """
+
+    async def get_page(self, url: str) -> str:
+        """Fetch a URL with automatic retries and return HTML text."""
+        self.increment_session()
+
+        for attempt in range(1, self.max_retries + 1):
+            html = None
+            start = time.monotonic()
+            try:
+                html = await asyncio.to_thread(
+                    self.session.get,
+                    url,
+                    headers=self._request_headers(url),
+                )
+                html.raise_for_status()
+                text = await asyncio.to_thread(self._response_text, url, html)
+
+            except FETCH_ERRORS as e:
+                retry_after = self._report_response(url, html, time.monotonic() - start)
+                await asyncio.sleep(self._retry_delay(url, attempt, e, retry_after))
+            else:
+                self._report_response(url, html, time.monotonic() - start)
+                return text
+
+        msg = f"Unknown error while fetching {url}"
+        raise ConnectionError(msg)
@@ -0,0 +1,69 @@
+"""Long-lived crawlers keyed by netloc, shared by all fetch workers."""
+
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+from src.data_pipeline.extract.webcrawler import Crawler
+
+
+class CrawlerPool:
+    """
+    Create one Crawler per netloc on first use and keep it for the whole run.
+
+    Each crawler's session keeps up to pool_size connections alive, so concurrent fetch workers
+    reuse connections instead of opening new ones.
+    """
+
+    def __init__(
+        self,
+        crawler_cls: type[Crawler],
+        *,
+        pool_size: int = 10,
+        **crawler_kwargs: Any,
+    ) -> None:
+        """Initialize CrawlerPool, crawler_kwargs are passed to every crawler."""
+        self.crawler_cls = crawler_cls
+        self.pool_size = pool_size
+        self.crawler_kwargs = crawler_kwargs
+        self.crawlers: dict[str, Crawler] = {}
+        self.lock = threading.Lock()
+
+    def get(self, url: str) -> Crawler:
+        """Return the crawler for the url's netloc, creating it on first use."""
+        netloc = urlparse(url).netloc
+        crawler = self.crawlers.get(netloc)
+        if crawler is not None:
+            return crawler
+        with self.lock:
+            if netloc not in self.crawlers:
+                self.crawlers[netloc] = self.crawler_cls(
+                    url,
+                    pool_size=self.pool_size,
+                    **self.crawler_kwargs,
+                )
+            return self.crawlers[netloc]
+
+    def __getitem__(self, netloc: str) -> Crawler:
+        """Return the crawler of netloc. Raises KeyError if none was created."""
+        return self.crawlers[netloc]
+
+    def __contains__(self, netloc: str) -> bool:
+        """Return whether netloc has a crawler."""
+        return netloc in self.crawlers
+
+    def __len__(self) -> int:
+        """Return the number of crawlers."""
+        return len(self.crawlers)
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Return the connection stats of each netloc's crawler, see Crawler.connection_stats."""
+        with self.lock:
+            crawlers = dict(self.crawlers)
+        return {netloc: crawler.connection_stats() for netloc, crawler in crawlers.items()}
+
+    def close(self) -> None:
+        """Close every crawler's session."""
+        with self.lock:
+            for crawler in self.crawlers.values():
+                crawler.session.close()
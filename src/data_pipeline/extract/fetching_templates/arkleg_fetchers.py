@@ -4,6 +4,7 @@ import re
 
 from bs4 import BeautifulSoup
 
+from src.data_pipeline.extract.html_parser import compile_selector
 from src.data_pipeline.transform.utils.normalize_str import normalize_str
 
 from src.models.selector_template import SelectorTemplate
@@ -13,6 +14,9 @@ from src.structures.registries import (
 
 registry = ProcessorRegistry()
 
+VOTE_LINK_TEXT = re.compile(r"vote", re.IGNORECASE)
+COMMITTEE_CATEGORY_ROWS = compile_selector("div#content div.container div.row")
+
 
 class ArkLegSeederLinkSelector(SelectorTemplate):
     """Selector template for ArkLeg BillCategory Page."""
@@ -99,7 +103,7 @@ class BillLinkSelector(SelectorTemplate):
     @staticmethod
     def parse_vote_links(soup: BeautifulSoup) -> list[str] | None:
         """Select vote page links."""
-        alist = soup.find_all("a", string=re.compile(r"vote", re.IGNORECASE))  # type: ignore  # noqa: PGH003
+        alist = soup.find_all("a", string=VOTE_LINK_TEXT)  # type: ignore  # noqa: PGH003
         return [a.get("href") for a in alist]
 
 
@@ -136,7 +140,7 @@ class CommitteeCategories(SelectorTemplate):
         valid_categories = ["joint", "senate", "house", "task force"]
         return [
             a.get("href")
-            for a in soup.select("div#content div.container div.row")
+            for a in COMMITTEE_CATEGORY_ROWS.select(soup)
             if normalize_str(a.get_text(strip=True)) in valid_categories
         ]
 
@@ -1,25 +1,87 @@
 """Class to parse html.text using beautiful soup selectors."""
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from functools import cache
+from typing import Any
 
-from bs4 import BeautifulSoup, ResultSet, Tag
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
+from soupsieve import SoupSieve
 
 from src.utils.logger import logger
 
+# Tree builders BeautifulSoup can use. lxml and html5lib are optional installs.
+PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+DEFAULT_BACKEND = "html.parser"
+
+
+def backend_available(backend: str) -> bool:
+    """Return whether BeautifulSoup can build trees with backend."""
+    return builder_registry.lookup(backend) is not None
+
+
+@cache
+def compile_selector(selector: str) -> SoupSieve:
+    """Return the prepared matcher for a CSS selector, compiled once per process."""
+    return soupsieve.compile(selector)
+
 
 class HTMLParser:
     """Parse html.text using beautiful soup selectors."""
 
-    def __init__(self, *, strict: bool = False) -> None:
-        """Initialize HTML parser."""
+    def __init__(
+        self,
+        *,
+        strict: bool = False,
+        backend: str = DEFAULT_BACKEND,
+        backends: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Initialize HTML parser.
+
+        backends maps PipelineRegistryKeys names to the tree builder for that page type,
+        other pages use backend. A backend which is not installed falls back to html.parser.
+        """
         self.strict = strict
+        self.backend = self._usable_backend(backend)
+        self.backends = {
+            key: self._usable_backend(name) for key, name in (backends or {}).items()
+        }
+
+    @staticmethod
+    def _usable_backend(backend: str) -> str:
+        if backend not in PARSER_BACKENDS:
+            msg = f"Unknown parser backend {backend}, expected one of {PARSER_BACKENDS}"
+            raise ValueError(msg)
+        if not backend_available(backend):
+            logger.warning(f"[HTML PARSER]: {backend} is not installed, using {DEFAULT_BACKEND}")
+            return DEFAULT_BACKEND
+        return backend
+
+    def backend_for(self, key: Any = None) -> str:
+        """Return the tree builder for pages of key, a PipelineRegistryKeys or its name."""
+        return self.backends.get(getattr(key, "name", key), self.backend)
+
+    def safe_get(
+        self,
+        soup: BeautifulSoup,
+        selector: str | SoupSieve,
+        attr: str = "text",
+    ) -> list[str] | None:
+        """
+        Safely run CSS selectors and return either text or attribute values.
 
-    def safe_get(self, soup: BeautifulSoup, selector: str, attr: str = "text") -> list[str] | None:
-        """Safely run CSS selectors and return either text or attribute values."""
-        def validate_input(soup: BeautifulSoup, selector: str, attr: str) -> ResultSet[Tag] | None:
+        Selector strings are matched with their prepared form from compile_selector.
+        """
+        def validate_input(
+            soup: BeautifulSoup,
+            selector: str | SoupSieve,
+            attr: str,
+        ) -> list[Tag] | None:
             """Validate safe_get function input."""
             if (
                 not isinstance(soup, BeautifulSoup)
-                or not isinstance(selector, str)
+                or not isinstance(selector, (str, SoupSieve))
                 or not isinstance(attr, str)
             ):
                 message = (
@@ -30,10 +92,12 @@ class HTMLParser:
                 logger.error(message)
                 raise TypeError(message)
 
-            _selected_elems = soup.select(selector)
+            if isinstance(selector, str):
+                selector = compile_selector(selector)
+            _selected_elems = selector.select(soup)
 
             if not _selected_elems:
-                msg = f"[safe_get] No matches found for selector '{selector}'"
+                msg = f"[safe_get] No matches found for selector '{selector.pattern}'"
                 logger.warning(msg)
                 return None
             return _selected_elems
@@ -56,14 +120,21 @@ class HTMLParser:
                 continue
         return values if values else None
 
+    def parse(self, html_text: str, key: Any = None) -> BeautifulSoup:
+        """Parse html once with the backend for key, for several get_content calls."""
+        return BeautifulSoup(html_text, self.backend_for(key))
+
     def get_content(
         self,
         template: dict,
-        html_text: str,
+        html_text: str | BeautifulSoup,
+        key: Any = None,
     ) -> dict[str, str | list[str] | None | dict[str, str | list[str] | None]]:
         """
         Parse HTML using beautiful soup selectors.
 
+        html_text may also be a document returned by parse, which is used as is, otherwise
+        it is parsed with the backend for the page type key.
         The 'template.selectors' dict can contain:
         - key: (selector, attr, label) -> For simple, declarative scraping
         - key: callable_function(soup)      -> For complex, imperative scraping
@@ -71,23 +142,23 @@ class HTMLParser:
         self._validate_input(template, html_text)
 
         content_holder: dict = {}
-        soup = BeautifulSoup(html_text, "html.parser")
+        soup = html_text if isinstance(html_text, BeautifulSoup) else self.parse(html_text, key)
 
         if soup:
-            for key, val in template.items():
+            for field, val in template.items():
                 if callable(val):
                     # If selector is a helper function
-                    content_holder[key] = self._handle_callable_parser(soup,
-                                                               key, val)
+                    content_holder[field] = self._handle_callable_parser(soup,
+                                                               field, val)
                 else:
-                    content_holder[key] = self._handle_raw_selector(soup, val, key)
+                    content_holder[field] = self._handle_raw_selector(soup, val, field)
 
 
         return content_holder
 
-    def _validate_input(self, template:dict, html_text:str) -> None:
+    def _validate_input(self, template:dict, html_text:str | BeautifulSoup) -> None:
         """Validate input for HTML parser."""
-        if not isinstance(template, dict) or not isinstance(html_text, str):
+        if not isinstance(template, dict) or not isinstance(html_text, (str, BeautifulSoup)):
             message = (
                 f"Parameter passed of incorrect type:\n"
                 f"website: {type(template)}, path: {type(html_text)}"
@@ -6,6 +6,7 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from src.data_pipeline.extract.parsing_templates.label_index import LabelIndex, cached_on_page
 from src.data_pipeline.load.download_pdf import downloadPDF
 from src.data_pipeline.transform.utils.empty_transform import empty_transform
 from src.data_pipeline.transform.utils.normalize_str import normalize_str
@@ -16,6 +17,10 @@ from src.structures import directed_graph
 from src.structures.directed_graph import Node
 from src.utils.strings.get_url_base_path import get_url_base_path
 
+BILL_CATEGORY = re.compile(r"^([a-zA-Z]+)")
+BILL_STATUS_HEADER = re.compile("Bill Status History", re.IGNORECASE)
+VOTE_LINK_TEXT = re.compile(r"vote", re.IGNORECASE)
+
 
 class BillSelector(SelectorTemplate):
     """Selector for Arkleg bill page."""
@@ -88,7 +93,7 @@ class BillSelector(SelectorTemplate):
         if not bill_no:
             return None
         session_code = strip_session_from_link(node.url).replace("/", "_")
-        category = re.match(r"^([a-zA-Z]+)", bill_no)
+        category = BILL_CATEGORY.match(bill_no)
         if category:
             category = category.group(1)  # hb, sb, hjr, sjr
 
@@ -238,12 +243,20 @@ class _BillTransformers:
 
 class _BillParsers:
 
+    @staticmethod
+    def _label_index(soup: BeautifulSoup) -> LabelIndex:
+        """Index every div with a single string, matched case-insensitively by substring."""
+        return LabelIndex(
+            [(div.string.lower(), div) for div in soup.find_all("div") if div.string is not None],
+            lambda text, label: label.lower() in text,
+        )
+
     @staticmethod
     def parse_bill_status_history(soup: BeautifulSoup) -> list[dict | None]:
         bill_status_history: list[dict | None] = []
         bill_status_header = soup.find(
             "h3",
-            string=re.compile("Bill Status History", re.IGNORECASE),
+            string=BILL_STATUS_HEADER,
         )
         if not bill_status_header:
             return bill_status_history
@@ -282,7 +295,7 @@ class _BillParsers:
 
     @staticmethod
     def parse_vote_links(soup: BeautifulSoup) -> list[str] | None:
-        vote_links = soup.find_all("a", string=re.compile(r"vote", re.IGNORECASE))  # type: ignore  # noqa: PGH003
+        vote_links = soup.find_all("a", string=VOTE_LINK_TEXT)  # type: ignore  # noqa: PGH003
 
         return [html.unescape(link.get("href")) for link in vote_links]
 
@@ -306,7 +319,8 @@ class _BillParsers:
          - additional_attrs: List of additional attrs to return in a Tuple
 
         """
-        label_el = soup.find(name="div", string=re.compile(re.escape(label_text), re.IGNORECASE))  # type: ignore  # noqa: PGH003
+        label_index = cached_on_page(soup, "bill_detail_labels", _BillParsers._label_index)
+        label_el = label_index.find(label_text)
         if label_el is None:
             return None
         target_el = label_el.find_next_sibling("div")
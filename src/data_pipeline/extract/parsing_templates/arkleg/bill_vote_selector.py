@@ -3,6 +3,7 @@
 import html
 import re
 from datetime import datetime
+from functools import cache
 from zoneinfo import ZoneInfo
 
 from bs4 import BeautifulSoup
@@ -13,6 +14,14 @@ from src.models.selector_template import SelectorTemplate
 from src.structures import directed_graph
 from src.structures.directed_graph import Node
 
+VOTE_CHAMBER = re.compile(r"(House|Senate) Vote")
+
+
+@cache
+def _vote_count_pattern(vote_cat: str) -> re.Pattern:
+    """Return the pattern matching a vote category label with its count."""
+    return re.compile(rf"{vote_cat}\s*:\s*(\d+)", re.IGNORECASE)
+
 
 class BillVoteSelector(SelectorTemplate):
     """Selector for Arkleg Bill Vote Page."""
@@ -151,7 +160,7 @@ class _VoteListTransformers:
         text = vote_title_list[0] if isinstance(vote_title_list, list) else vote_title_list
 
         # Extract chamber (House or Senate)
-        chamber_match = re.match(r"(House|Senate) Vote", text)
+        chamber_match = VOTE_CHAMBER.match(text)
         chamber = chamber_match.group(1) if chamber_match else None
 
         # Extract timestamp part (everything after the first ' - ')
@@ -172,7 +181,7 @@ class _VoteListParsers:
         vote_cat: str,
         attr: str | None = None,
     ) -> list[str] | None:
-        regex = re.compile(rf"{vote_cat}\s*:\s*(\d+)", re.IGNORECASE)
+        regex = _vote_count_pattern(vote_cat)
         label = None
         match = None
         # Find the correct <b> tag
@@ -1,10 +1,11 @@
 """Selector template for arkleg.state.ar.us/Legislators/Detail?."""
 
 import html
-import re
 
 from bs4 import BeautifulSoup
 
+from src.data_pipeline.extract.html_parser import compile_selector
+from src.data_pipeline.extract.parsing_templates.label_index import LabelIndex, cached_on_page
 from src.data_pipeline.transform.utils.cast_to_int import cast_to_int
 from src.data_pipeline.transform.utils.empty_transform import empty_transform
 from src.data_pipeline.transform.utils.normalize_str import normalize_str
@@ -14,6 +15,9 @@ from src.models.selector_template import SelectorTemplate
 from src.structures.directed_graph import DirectionalGraph, Node
 from src.utils.logger import logger
 
+COMMITTEE_LINKS = compile_selector("div#meetingBodyWrapper a")
+DETAIL_TABLE_LABELS = compile_selector("div.row div.d-lg-block b")
+
 
 class LegislatorSelector(SelectorTemplate):
     """Selector template for Arkleg legislator page."""
@@ -62,7 +66,7 @@ class LegislatorSelector(SelectorTemplate):
 class _LegislatorParsers:
     @staticmethod
     def get_committees_links(soup: BeautifulSoup) -> list[str]:
-        els = soup.select("div#meetingBodyWrapper a")
+        els = COMMITTEE_LINKS.select(soup)
         result = []
         for el in els:
             el_link = el.get("href")
@@ -70,21 +74,26 @@ class _LegislatorParsers:
         return result
 
     @staticmethod
-    def _parse_table_val(soup: BeautifulSoup, label_str: str) -> list[str] | None:
-        label = re.compile(rf"^{label_str}\s*")
-        result = []
+    def _label_index(soup: BeautifulSoup) -> LabelIndex | None:
+        """Index the bold labels of the details table, matched by prefix."""
         table = soup.find("div", attrs={"id": "tableDataWrapper"})
         if not table:
+            return None
+        return LabelIndex(
+            [(tag.get_text().strip(), tag) for tag in DETAIL_TABLE_LABELS.select(table)],
+            lambda text, label: text.startswith(label),
+        )
+
+    @staticmethod
+    def _parse_table_val(soup: BeautifulSoup, label_str: str) -> list[str] | None:
+        result = []
+        label_index = cached_on_page(soup, "legislator_labels", _LegislatorParsers._label_index)
+        if label_index is None:
             logger.warning("table not found")
             return None
-        label_tags = table.select("div.row div.d-lg-block b")
-        label_tag = ""
-        for tag in label_tags:
-            if label.match(tag.get_text().strip()):
-                label_tag = tag
-                break
-
-        if not label_tag or label_tag == "":
+        label_tag = label_index.find(label_str)
+
+        if not label_tag:
             logger.warning("label tag not found")
             return None
         target_parent = label_tag.parent
@@ -7,6 +7,8 @@ from src.data_pipeline.transform.utils.normalize_str import normalize_str
 from src.models.selector_template import SelectorTemplate
 from src.structures.directed_graph import DirectionalGraph, Node
 
+COMMITTEE_CODE = re.compile(r"code=([0-9A-Za-z]+)")
+
 
 class CommitteeSelector(SelectorTemplate):
     """Selector for Arkleg Legislator List Page."""
@@ -31,8 +33,7 @@ class CommitteeSelector(SelectorTemplate):
         if not url:
             return None
 
-        pattern = r"code=([0-9A-Za-z]+)"
-        match = re.search(pattern, url)
+        match = COMMITTEE_CODE.search(url)
 
         if match:
             # Group 1 (index 1) contains the value captured inside the parentheses
@@ -0,0 +1,37 @@
+"""Per-page label indexes, so label/value lookups share one pass over the document."""
+
+from collections.abc import Callable
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+
+
+def cached_on_page(soup: BeautifulSoup, name: str, build: Callable[[BeautifulSoup], Any]) -> Any:
+    """
+    Return the index called name for soup, built on first use.
+
+    Indexes live in the soup's __dict__, attribute access on a soup searches for child tags.
+    """
+    indexes = vars(soup).setdefault("_page_indexes", {})
+    if name not in indexes:
+        indexes[name] = build(soup)
+    return indexes[name]
+
+
+class LabelIndex:
+    """Label elements of one page in document order, with lookups cached per label."""
+
+    def __init__(self, labels: list[tuple[str, Tag]], match: Callable[[str, str], bool]) -> None:
+        """Initialize LabelIndex from (label text, element) pairs, match(text, label)."""
+        self.labels = labels
+        self.match = match
+        self.found: dict[str, Tag | None] = {}
+
+    def find(self, label: str) -> Tag | None:
+        """Return the first element whose text matches label."""
+        if label not in self.found:
+            self.found[label] = next(
+                (tag for text, tag in self.labels if self.match(text, label)),
+                None,
+            )
+        return self.found[label]
@@ -0,0 +1,31 @@
+"""Crawler serving pages from a ResponseArchive, without network access."""
+
+from typing import Any
+
+from src.data_pipeline.extract.webcrawler import Crawler
+from src.data_pipeline.utils.response_archive import ResponseArchive
+from src.utils.logger import logger
+
+
+class ReplayCrawler(Crawler):
+    """
+    Replay archived responses in place of fetching them.
+
+    Used to rerun the pipeline after a selector change, or as a fixed corpus for benchmarks.
+    Urls missing from the archive raise ConnectionError, like a failed fetch.
+    """
+
+    def __init__(self, site: str, *, archive: ResponseArchive, **kwargs: Any) -> None:
+        """Initialize the ReplayCrawler, other kwargs as Crawler."""
+        kwargs.pop("http_cache", None)  # replayed pages never hit the network
+        super().__init__(site, **kwargs)
+        self.archive = archive
+
+    def get_page(self, url: str) -> str:
+        """Return the archived html of url."""
+        html = self.archive.body(url)
+        if html is None:
+            message = f"Url {url} is not in the response archive"
+            logger.error(f"[REPLAY CRAWLER]: {message}")
+            raise ConnectionError(message)
+        return html
@@ -1,18 +1,30 @@
 """Web Crawler for requesting and parsing HTML content."""
 
 import os
+import threading
 import time
+import zlib
+from collections.abc import Callable
+from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
 from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
 
 from src.config.settings import project_config
+from src.data_pipeline.utils.http_cache import HTTPCache
+from src.data_pipeline.utils.rate_limiter import BACKOFF_STATUSES, parse_retry_after
+from src.data_pipeline.utils.response_archive import ResponseArchive
 from src.utils.logger import logger
 from src.utils.paths import project_root
 
 load_dotenv(project_root / ".env")
 
+# Errors of one fetch attempt which are retried: failed requests, and stored bodies which
+# do not decode. Anything else is a bug and reaches the fetch worker's error handling.
+FETCH_ERRORS = (RequestException, UnicodeDecodeError, zlib.error)
+
 
 class Crawler:
     """Web Crawler for requesting and parsing HTML content."""
@@ -24,63 +36,149 @@ class Crawler:
         strict: bool | None = None,
         max_retries: int = 3,
         retry_backoff: float = 0.5,
+        response_hook: Callable[[str, int | None, float, float | None], None] | None = None,
+        http_cache: HTTPCache | None = None,
+        archive: ResponseArchive | None = None,
+        pool_size: int = 10,
     ) -> None:
-        """Initialize the Crawler with domain base-url and optional strict parameter."""
+        """
+        Initialize the Crawler with domain base-url and optional strict parameter.
+
+        response_hook is called after every request attempt with the netloc, status code
+        (None if no response), latency in seconds and the Retry-After delay if any.
+        http_cache makes requests conditional, a 304 is answered from its stored body.
+        archive records every successful response, see ReplayCrawler.
+        pool_size is the number of keep-alive connections, match it to the concurrent fetches.
+        """
         self.site = site
         self.strict = project_config["strict"] if strict is None else strict
+        self.pool_size = pool_size
         self.session = self.create_session()
         self.session_counter = 0
+        self.session_lock = threading.Lock()
 
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.response_hook = response_hook
+        self.http_cache = http_cache
+        self.archive = archive
 
     def create_session(self) -> requests.Session:
-        """Create session object."""
+        """Create a keep-alive session with a connection pool of pool_size."""
         session = Session()
         session.headers.update(
             {
                 "User-Agent": os.getenv("HTTP_HEADER_USER_AGENT"),
                 "From": os.getenv("HTTP_HEADER_FROM"),
+                "Accept-Encoding": "gzip, deflate",
             },
         )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
     def increment_session(self) -> None:
-        """Reset the session after 100 requests."""
-        self.session_counter += 1
-        if self.session_counter % 100 == 0:
-            self.session.close()
-            self.session = self.create_session()
+        """Count a page request. Safe to call from several fetch workers."""
+        with self.session_lock:
+            self.session_counter += 1
+
+    def connection_stats(self) -> dict[str, float]:
+        """Return pages and http requests sent, connections opened and the connection reuse."""
+        connections = http_requests = 0
+        for adapter in {id(a): a for a in self.session.adapters.values()}.values():
+            pools = getattr(adapter, "poolmanager", None)
+            if pools is None:
+                continue
+            for key in pools.pools.keys():  # noqa: SIM118, container has no iterator
+                pool = pools.pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+                    http_requests += pool.num_requests
+        return {
+            "pages": self.session_counter,
+            "requests": http_requests,
+            "connections": connections,
+            "reuse": 1 - connections / http_requests if http_requests else 0.0,
+        }
 
     def get_page(self, url: str) -> str:
         """Fetch a URL with automatic retries and return HTML text."""
         self.increment_session()
-        last_exc = None
 
         for attempt in range(1, self.max_retries + 1):
+            html = None
+            start = time.monotonic()
             try:
-                html = self.session.get(url)
+                html = self.session.get(url, headers=self._request_headers(url))
                 html.raise_for_status()
+                text = self._response_text(url, html)
 
-            except (RequestException, Exception) as e:
-                last_exc = e
-
-                if attempt < self.max_retries:
-                    sleep_for = self.retry_backoff * attempt
-                    logger.warning(
-                        f"[CRAWLER] Failed to fetch {url} "
-                        f"(attempt {attempt}/{self.max_retries}): {e} "
-                        f"— retrying in {sleep_for:.2f}s",
-                    )
-                    time.sleep(sleep_for)
-                else:
-                    # Final attempt failed → now treated as fatal
-                    message = f"Failed to fetch URL {url} after {self.max_retries} attempts: {e}"
-                    logger.error(message)
-                    raise ConnectionError(message) from e
+            except FETCH_ERRORS as e:
+                retry_after = self._report_response(url, html, time.monotonic() - start)
+                time.sleep(self._retry_delay(url, attempt, e, retry_after))
             else:
-                return html.text  # SUCCESS
+                self._report_response(url, html, time.monotonic() - start)
+                return text  # SUCCESS
 
         # Should never reach here
         msg = f"Unknown error while fetching {url}"
-        raise ConnectionError(msg) from last_exc
+        raise ConnectionError(msg)
+
+    def _request_headers(self, url: str) -> dict[str, str]:
+        """Return the conditional request headers for url."""
+        return self.http_cache.request_headers(url) if self.http_cache else {}
+
+    def _response_text(self, url: str, response: requests.Response) -> str:
+        """Return the body of a successful response, from the http cache on 304, and archive it."""
+        html = response.text
+        if self.http_cache is not None:
+            if response.status_code == requests.codes.not_modified:
+                html = self.http_cache.cached_body(url)
+                if html is None:  # entry was dropped, the retry is unconditional
+                    msg = f"304 Not Modified for {url} without a cached body"
+                    raise RequestException(msg)
+            else:
+                self.http_cache.store(url, response.headers, html)
+        if self.archive is not None:
+            self.archive.record(url, response.status_code, response.headers, html)
+        return html
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        exc: Exception,
+        retry_after: float | None,
+    ) -> float:
+        """Return seconds to wait before the next attempt, raise if attempts are exhausted."""
+        if attempt >= self.max_retries:
+            # Final attempt failed → now treated as fatal
+            message = f"Failed to fetch URL {url} after {self.max_retries} attempts: {exc}"
+            logger.error(message)
+            raise ConnectionError(message) from exc
+        sleep_for = max(self.retry_backoff * attempt, retry_after or 0.0)
+        logger.warning(
+            f"[CRAWLER] Failed to fetch {url} "
+            f"(attempt {attempt}/{self.max_retries}): {exc} "
+            f"— retrying in {sleep_for:.2f}s",
+        )
+        return sleep_for
+
+    def _report_response(
+        self,
+        url: str,
+        response: requests.Response | None,
+        latency: float,
+    ) -> float | None:
+        """Pass the outcome of a request to response_hook. Returns the Retry-After delay."""
+        status = getattr(response, "status_code", None)
+        if not isinstance(status, int):
+            status = None
+        retry_after = None
+        if status in BACKOFF_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if self.response_hook:
+            netloc = urlparse(url).netloc or urlparse(self.site).netloc
+            self.response_hook(netloc, status, latency, retry_after)
+        return retry_after
@@ -1,6 +1,5 @@
 """orchestrate.py."""
 
-import queue
 import time
 from itertools import zip_longest
 from pathlib import Path
@@ -10,19 +9,46 @@ import psycopg
 from urllib3.util import parse_url
 
 from src.config.pipeline_enums import PipelineRegistries
-from src.config.settings import known_links_cache_file, state_cache_file
+from src.config.settings import (
+    fetch_async_max_in_flight,
+    fetch_engine,
+    fetch_frontier,
+    fetch_frontier_max_in_memory,
+    fetch_max_rate,
+    fetch_min_delay,
+    fetch_worker_count,
+    frontier_spill_dir,
+    html_parser_backends,
+    known_links_cache_file,
+    link_discovery_worker_count,
+    state_cache_file,
+)
+from src.data_pipeline.extract.async_webcrawler import AsyncCrawler
+from src.data_pipeline.extract.crawler_pool import CrawlerPool
 from src.data_pipeline.extract.html_parser import HTMLParser
+from src.data_pipeline.extract.replay_crawler import ReplayCrawler
 from src.data_pipeline.extract.webcrawler import Crawler
 from src.data_pipeline.transform.pipeline_transformer import PipelineTransformer
+from src.data_pipeline.utils.change_ledger import ChangeLedger
 from src.data_pipeline.utils.fetch_scheduler import FetchScheduler
+from src.data_pipeline.utils.html_store import HTMLStore
+from src.data_pipeline.utils.http_cache import HTTPCache
+from src.data_pipeline.utils.parsed_pages import ParsedPages
+from src.data_pipeline.utils.response_archive import ResponseArchive
 from src.structures import directed_graph
 from src.structures.directed_graph import DirectionalGraph
+from src.structures.frontier import Frontier
 from src.structures.indexed_tree import PipelineStateEnum
 from src.structures.registries import ProcessorRegistry, get_enum_by_url
 from src.utils.json_list import load_json_list
 from src.utils.logger import logger
 from src.utils.strings.get_url_base_path import get_url_base_path
-from src.workers.base_worker import BaseWorker
+from src.workers.base_worker import BaseWorker, SentinelBarrier
+from src.workers.pipeline_workers import (
+    AsyncCrawlerWorker,
+    CrawlerWorker,
+    LinkDiscoveryWorker,
+)
 
 STRICT = False
 
@@ -45,23 +71,64 @@ class Orchestrator:
         parser: type[HTMLParser] = HTMLParser,
         transformer: type[PipelineTransformer] = PipelineTransformer,
         fetch_scheduler: type[FetchScheduler] = FetchScheduler,
+        html_store: HTMLStore | None = None,
+        http_cache: HTTPCache | None = None,
+        archive: ResponseArchive | None = None,
+        replay: bool = False,
+        change_ledger: ChangeLedger | None = None,
+        fetch_workers: int = fetch_worker_count,
+        fetch_engine: str = fetch_engine,
+        discovery_workers: int = link_discovery_worker_count,
     ) -> None:
-        """Initialize the Orchestrator."""
+        """
+        Initialize the Orchestrator.
+
+        With replay, pages are served from archive by ReplayCrawler without a politeness delay,
+        otherwise every fetched response is recorded to archive.
+        change_ledger lets pages unchanged since their last load skip PROCESS and LOAD. It is
+        ignored on replay, which is meant to rerun changed selectors on unchanged pages.
+        With discovery_workers, fetched pages are parsed for links by LinkDiscoveryWorkers
+        instead of the fetch workers.
+        """
         self.registry = registry
+        self.fetch_workers = max(1, fetch_workers)
+        self.fetch_engine = fetch_engine
+        self.discovery_workers = max(0, discovery_workers)
         self.db_conn = db_conn
         self.strict = strict
         self.fetch_scheduler_cls = fetch_scheduler
         self.transformer_cls = transformer
         self.crawler_cls = crawler
         self.parser_cls = parser
+        self.html_store = html_store
+        self.http_cache = http_cache
+        self.archive = archive
+        self.replay = replay
+        if replay:
+            if archive is None:
+                msg = "Replay needs a response archive"
+                raise ValueError(msg)
+            self.crawler_cls = ReplayCrawler
+        self.change_ledger = None if replay else change_ledger
         self.state = state
         self.visited: list[str] = []
         self.workers = []
+        self.crawler_pool: CrawlerPool | None = None
+        self.fetch_scheduler: FetchScheduler | None = None
+        self.discover_queue: Queue | None = None
+        # Pages are parsed once, data selectors run with the link selectors
+        self.parsed_pages = ParsedPages()
 
         # Organize queues dynamically by stage
         self.queues: dict[PipelineRegistries, Queue] = {
             stage: stage.queue_type() for stage in PipelineRegistries
         }
+        self.queues[PipelineRegistries.FETCH] = Frontier(
+            strategy=fetch_frontier,
+            max_in_memory=fetch_frontier_max_in_memory,
+            spill_dir=frontier_spill_dir,
+            resolve=self._find_spilled_node,
+        )
 
         # Keep enum handy for iteration
         self.pipeline_stages = list(PipelineRegistries)
@@ -84,18 +151,44 @@ class Orchestrator:
         )
 
         self.manage_workers(workers, queue_ordered_list)
+        # Fetch queue tasks are done after discovery, so joining it above covers the discover queue
+        if self.discover_queue is not None:
+            queue_ordered_list.append(self.discover_queue)
         self.shutdown_workers(queue_ordered_list, workers)
 
+    def _find_spilled_node(self, url: str) -> directed_graph.Node | None:
+        """Resolve a url spilled by the FETCH frontier back to its node."""
+        return self.state.find_node_by_url(url)
+
     def shutdown_workers(self, queues: list[Queue], workers: list[BaseWorker]) -> None:
-        """Shutdown workers."""
+        """
+        Shutdown workers, with one sentinel for each worker consuming a queue.
+
+        Queues fed by other workers get their sentinels from them once their producers stop,
+        see _share_sentinel_barriers. The fetch scheduler is closed before joining, which
+        releases fetch workers waiting on it for a node.
+        """
+        fed = {id(w.output_queue) for w in workers if getattr(w, "output_queue", None)}
         for q in queues:
-            q.put(None)
-        self._drain_sentinels(self.queues)
+            if id(q) in fed:
+                continue
+            consumers = sum(1 for w in workers if getattr(w, "input_queue", None) is q)
+            for _ in range(max(1, consumers)):
+                q.put(None)
+        if self.fetch_scheduler:
+            self.fetch_scheduler.close()
 
         for w in workers:
             w.join(timeout=5)
             if w.is_alive():
                 logger.warning(f"THREAD {w.name} FAILED SHUTDOWN")
+        if self.crawler_pool:
+            logger.info(f"[ORCHESTRATOR]: CRAWLER CONNECTIONS: {self.crawler_pool.metrics()}")
+            self.crawler_pool.close()
+        if self.fetch_scheduler:
+            utilization = self.fetch_scheduler.slot_utilization()
+            logger.info(f"[ORCHESTRATOR]: FETCH SLOT UTILIZATION: {utilization}")
+        logger.info(f"[ORCHESTRATOR]: PARSED PAGES: {self.parsed_pages.metrics()}")
         time.sleep(0.005)
 
     def _next_seed(self, match_key: str) -> str:
@@ -119,15 +212,9 @@ class Orchestrator:
         start_queue = ordered_queues[0]
 
         while any(urls for urls in self.seed_urls.values()):
-            active_root_netlocs = {
-                parse_url(node.url).netloc
-                for node in self.state.get_roots()
-                if isinstance(node, directed_graph.Node)
-            }
-
+            # seed_urls is keyed by netloc, see organize_unique_domains
             for key in list(self.seed_urls.keys()):
-                domain_netloc = parse_url(key).netloc
-                if domain_netloc not in active_root_netlocs:
+                if not self.state.has_active_root(key):
                     next_url = self._next_seed(key)
                     if next_url:
                         logger.info(f"[ORCHESTRATOR]: ADD NEW SEED: {next_url}")
@@ -163,25 +250,24 @@ class Orchestrator:
 
             worker_cls = stage.get_worker_class()
             if stage is PipelineRegistries.FETCH:
-                worker = worker_cls(
-                    input_queue=input_queue,
-                    output_queue=output_queue,
-                    state=self.state,
-                    crawler_cls=self.crawler_cls,
-                    parser=self.parser_cls(),
-                    fun_registry=self.registry,
-                    fetch_scheduler=self.fetch_scheduler_cls(),
-                    strict=self.strict,
-                    name=f"{stage.label}_WORKER",
+                *extra_workers, worker = self._setup_fetch_workers(
+                    worker_cls,
+                    input_queue,
+                    output_queue,
+                    stage.label,
                 )
+                workers.extend(extra_workers)
+                self.workers.extend(extra_workers)
             elif stage is PipelineRegistries.PROCESS:
                 worker = worker_cls(
                     input_queue=input_queue,
                     output_queue=output_queue,
                     state=self.state,
-                    parser=self.parser_cls(),
+                    parser=self._new_parser(),
                     transformer=self.transformer_cls(),
                     fun_registry=self.registry,
+                    html_store=self.html_store,
+                    parsed_pages=self.parsed_pages,
                     strict=self.strict,
                     name=f"{stage.label}_WORKER",
                 )
@@ -191,6 +277,7 @@ class Orchestrator:
                     state=self.state,
                     db_conn=self.db_conn,
                     fun_registry=self.registry,
+                    change_ledger=self.change_ledger,
                     strict=self.strict,
                     name=f"{stage.label}_WORKER",
                 )
@@ -202,20 +289,106 @@ class Orchestrator:
             self.workers.append(worker)
             last_queue = output_queue
 
+        self._share_sentinel_barriers(workers)
         return workers
 
-    def _drain_sentinels(self, queues: dict) -> None:
-        """Explicitly drains the final sentinel from all downstream queues."""
-        drain_queues = [queues[PipelineRegistries.PROCESS], queues[PipelineRegistries.LOAD]]
+    @staticmethod
+    def _share_sentinel_barriers(workers: list[BaseWorker]) -> None:
+        """Give the workers feeding each queue one barrier, so a stage gets its sentinels once."""
+        producers: dict[int, list[BaseWorker]] = {}
+        for w in workers:
+            if getattr(w, "output_queue", None) is not None:
+                producers.setdefault(id(w.output_queue), []).append(w)
+        for group in producers.values():
+            output_queue = group[0].output_queue
+            consumers = sum(1 for w in workers if getattr(w, "input_queue", None) is output_queue)
+            barrier = SentinelBarrier(len(group), max(1, consumers))
+            for w in group:
+                w.sentinel_barrier = barrier
+
+    def _setup_fetch_workers(
+        self,
+        worker_cls: type[CrawlerWorker],
+        input_queue: Queue,
+        output_queue: Queue,
+        label: str,
+    ) -> list[CrawlerWorker]:
+        """
+        Initialize fetch workers sharing one scheduler and crawler pool.
+
+        Link discovery workers come first, the last worker returned is a fetch worker.
+        """
+        self.fetch_scheduler = fetch_scheduler = self.fetch_scheduler_cls(
+            0 if self.replay else fetch_min_delay,
+            max_rate=fetch_max_rate,
+        )
+        is_async = self.fetch_engine == "async"
+        crawler_cls = self.crawler_cls
+        if is_async and crawler_cls is Crawler:
+            crawler_cls = AsyncCrawler
+        # One keep-alive connection per concurrent fetch
+        self.crawler_pool = CrawlerPool(
+            crawler_cls,
+            pool_size=fetch_async_max_in_flight if is_async else self.fetch_workers,
+            strict=self.strict,
+            response_hook=fetch_scheduler.record_response,
+            http_cache=self.http_cache,
+            archive=self.archive,
+        )
+        kwargs = {
+            "input_queue": input_queue,
+            "output_queue": output_queue,
+            "state": self.state,
+            "crawler_cls": crawler_cls,
+            "fun_registry": self.registry,
+            "fetch_scheduler": fetch_scheduler,
+            "crawlers": self.crawler_pool,
+            "html_store": self.html_store,
+            "change_ledger": self.change_ledger,
+            "parsed_pages": self.parsed_pages,
+            "strict": self.strict,
+        }
+        discovery: list[LinkDiscoveryWorker] = []
+        if self.discovery_workers:
+            self.discover_queue = kwargs["discover_queue"] = Queue()
+            discovery = [
+                LinkDiscoveryWorker(
+                    self.discover_queue,
+                    output_queue,
+                    self.state,
+                    self._new_parser(),
+                    self.registry,
+                    links_queue=input_queue,
+                    html_store=self.html_store,
+                    change_ledger=self.change_ledger,
+                    parsed_pages=self.parsed_pages,
+                    name=f"{label}_DISCOVERY_WORKER_{i}",
+                )
+                for i in range(1, self.discovery_workers + 1)
+            ]
+        if is_async:
+            return [
+                *discovery,
+                AsyncCrawlerWorker(
+                    parser=self._new_parser(),
+                    max_in_flight=fetch_async_max_in_flight,
+                    name=f"{label}_WORKER",
+                    **kwargs,
+                ),
+            ]
+
+        names = [f"{label}_WORKER_{i}" for i in range(2, self.fetch_workers + 1)]
+        return [
+            *discovery,
+            *(
+                worker_cls(parser=self._new_parser(), name=name, **kwargs)
+                for name in [*names, f"{label}_WORKER"]
+            ),
+        ]
 
-        for q in drain_queues:
-            try:
-                # We expect a sentinel, so we just consume it.
-                q.get_nowait()
-                logger.info(f"ORCHESTRATOR DRAINED SENTINEL from {q}")
-                q.task_done()
-            except queue.Empty:
-                pass  # Already drained or empty, that's fine
+    def _new_parser(self) -> HTMLParser:
+        """Return a parser for one worker, with the configured backend per page type."""
+        return self.parser_cls(backends=html_parser_backends)
 
     def _load_queues(self, unvisited_nodes: list[directed_graph.Node]) -> None:
         """Put starting values in queues."""
@@ -224,8 +397,8 @@ class Orchestrator:
         loader_queue = self.queues[PipelineRegistries.LOAD]
         if unvisited_nodes:
             for node in unvisited_nodes:
-                if not node.incoming:
-                    self.state.roots.add(node)
+                if not node.incoming and node not in self.state.roots:
+                    self.state.add_root(node)
                 if node.state in [
                     PipelineStateEnum.CREATED,
                     PipelineStateEnum.AWAITING_FETCH,
@@ -303,11 +476,10 @@ class Orchestrator:
                 url = self._next_seed(key)
                 turl = get_url_base_path(url)
                 urlenum = get_enum_by_url(turl)
+                # Nodes without incoming links are added to the graph roots
                 new_node = self.state.add_new_node(url, urlenum, None)
                 addtl_nodes.append(new_node)
                 addtl_keys.append(key)
-                if new_node:
-                    self.state.roots.add(new_node)
 
         return [
             item
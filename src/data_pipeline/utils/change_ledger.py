@@ -0,0 +1,85 @@
+"""Ledger of page fingerprints, so pages unchanged since their last load skip PROCESS and LOAD."""
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.utils.json_lines import append_json_line, load_json_lines
+
+# Markup which changes between requests of an unchanged page: scripts, comments and hidden
+# inputs such as anti-forgery tokens.
+VOLATILE_MARKUP = re.compile(
+    r"<script\b.*?</script\s*>|<!--.*?-->|<input\b[^>]*\btype=[\"']?hidden\b[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+INTER_TAG_SPACE = re.compile(r">\s+<")
+
+
+def page_fingerprint(html: str) -> str:
+    """Return the sha256 of html without volatile markup and with whitespace collapsed."""
+    stable = " ".join(INTER_TAG_SPACE.sub("><", VOLATILE_MARKUP.sub("", html)).split())
+    return hashlib.sha256(stable.encode("utf-8")).hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+class ChangeLedger:
+    """
+    Record the fingerprint of each url's last loaded body, with the loader result.
+
+    The fetch stage checks a page with unchanged, which remembers the fingerprint until
+    record_loaded confirms the load. Entries are kept as append-only JSON lines, the last
+    line for a url wins.
+
+    Each entry carries db_identity, the database it was loaded into, and entries of another
+    database are dropped on load. A database emptied in place keeps its identity, so delete
+    the ledger file after truncating its tables, or unchanged pages are never reloaded.
+    """
+
+    def __init__(self, path: Path, *, db_identity: str | None = None) -> None:
+        """Initialize ChangeLedger, loading the entries of previous runs against db_identity."""
+        self.path = path
+        self.db_identity = db_identity
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = load_json_lines(
+            path,
+            is_removal=lambda entry: entry.get("db") != db_identity,
+            default=_json_default,
+        )
+        self.pending: dict[str, str] = {}
+        self.skipped = 0
+
+    def unchanged(self, url: str, html: str) -> bool:
+        """Return True if html matches the last loaded body of url, else remember it as pending."""
+        fingerprint = page_fingerprint(html)
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is not None and entry["hash"] == fingerprint:
+                self.skipped += 1
+                return True
+            self.pending[url] = fingerprint
+            return False
+
+    def loaded_result(self, url: str) -> dict | None:
+        """Return a copy of the loader result stored for url."""
+        with self.lock:
+            entry = self.entries.get(url)
+        if entry is None or entry["result"] is None:
+            return None
+        return dict(entry["result"])
+
+    def record_loaded(self, url: str, result: dict | None) -> None:
+        """Store the pending fingerprint of url with its loader result, after a committed load."""
+        with self.lock:
+            fingerprint = self.pending.pop(url, None)
+            if fingerprint is None:
+                return
+            entry = {"url": url, "hash": fingerprint, "result": result, "db": self.db_identity}
+            self.entries[url] = entry
+            append_json_line(self.path, entry, default=_json_default)
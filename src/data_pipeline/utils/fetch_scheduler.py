@@ -1,72 +1,219 @@
 """Scheduler for fetch worker, ensure minimum time between repeated requests to a server."""
 
+import heapq
+import itertools
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass, field
-from queue import Empty, PriorityQueue
 from typing import Any
 
+from src.data_pipeline.utils.rate_limiter import RateLimiter
+
 
 @dataclass(order=True)
 class DelayedItem:
-    """Item in fetch scheduler."""
+    """Item in fetch scheduler, ordered by the time it may be fetched, then by submission."""
 
     next_time: float
+    seq: int
+    domain: str = field(compare=False)
     item: Any = field(compare=False)
 
 
 class FetchScheduler:
-    """Ensure min delay between page requests."""
-
-    def __init__(self, min_delay: float = 2.5) -> None:
+    """
+    Ensure min delay between page requests.
+
+    Items wait in a heap ordered by the earliest time they may be fetched. Workers block in
+    next_fetchable on a condition, which wakes at the next allowed slot or on a new submission.
+    Slots come from an adaptive per-domain token bucket, starting at one request per min_delay
+    and adjusted by record_response up to max_rate. A min_delay of 0 disables the politeness
+    delay, as for replayed fetches. Times are time.monotonic seconds.
+
+    While a domain has items queued, the time from its previous request until its next slot
+    opens is politeness delay, the time from the slot opening until a worker takes it is idle.
+    slot_utilization reports the share of delay in those gaps.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 2.5,
+        *,
+        max_rate: float | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize FetchScheduler."""
         self.min_delay = min_delay
-        self.last_fetch: dict[str, float] = {}
+        # Only accessed under lock
+        if rate_limiter is None and min_delay > 0:
+            rate_limiter = RateLimiter(1 / min_delay, max_rate=max_rate)
+        self.rate_limiter = rate_limiter
         self.lock = threading.Lock()
+        self.cond = threading.Condition(self.lock)
+        self.closed = False
+
+        # Delayed tasks, min-heap by next_time. Guarded by lock.
+        self.delayed: list[DelayedItem] = []
+        self._seq = itertools.count()
 
-        # Delayed tasks (min-heap by next_time). thread-safe wrapper via methods.
-        self.delayed = PriorityQueue()
+        # Slot utilization accounting. Guarded by lock.
+        self.queued: Counter[str] = Counter()
+        self.slot_open: dict[str, tuple[float, float]] = {}  # domain: (last request, next slot)
+        self.slot_delay: Counter[str] = Counter()
+        self.slot_idle: Counter[str] = Counter()
+
+    def _next_allowed_time(self, domain: str, now: float | None = None) -> float:
+        """Return the earliest allowed fetch time for domain. Caller holds lock."""
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.next_allowed_time(domain, now)
 
     def next_allowed_time(self, domain: str) -> float:
         """Return the earliest allowed fetch time for domain."""
         with self.lock:
-            return self.last_fetch.get(domain, 0.0) + self.min_delay
+            return self._next_allowed_time(domain)
 
     def can_fetch_now(self, domain: str) -> bool:
         """Fast check w/out updating state."""
-        return time.time() >= self.next_allowed_time(domain)
+        return time.monotonic() >= self.next_allowed_time(domain)
 
     def mark_fetched(self, domain: str) -> None:
-        """Mark domain as fetched right now."""
+        """Spend a slot of domain for a fetch made without next_fetchable."""
+        with self.lock:
+            self._consume(domain)
+
+    def _consume(self, domain: str, now: float | None = None) -> None:
+        """Spend a slot of domain. Caller holds lock."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.consume(domain, now)
+
+    def record_response(
+        self,
+        domain: str,
+        status: int | None,
+        latency: float,
+        retry_after: float | None = None,
+    ) -> None:
+        """Adapt the domain's rate to a server response, see TokenBucket.record_response."""
+        if self.rate_limiter is None:
+            return
+        with self.cond:
+            self.rate_limiter.record_response(domain, status, latency, retry_after)
+            if domain in self.slot_open:  # a backoff moves the next slot
+                claimed, opens = self.slot_open[domain]
+                opens = max(opens, self._next_allowed_time(domain))
+                self.slot_open[domain] = (claimed, opens)
+            self.cond.notify_all()
+
+    def current_rates(self) -> dict[str, float]:
+        """Return the current requests per second of every domain."""
         with self.lock:
-            self.last_fetch[domain] = time.time()
+            return self.rate_limiter.current_rates() if self.rate_limiter else {}
 
-    def schedule_retry(self, item: Any, when: float) -> None:
-        """Put item into the global delayed queue to be retried at 'when' (epoch seconds)."""
-        self.delayed.put(DelayedItem(when, item))
+    def slot_utilization(self) -> dict[str, float]:
+        """
+        Return per domain the share of time between backlogged requests spent in politeness delay.
 
-    def pop_due(self) -> Any | None:
+        1.0 means each request went out as soon as its slot opened, lower values mean slots
+        sat open while every worker was busy elsewhere.
         """
-        Return a delayed item if its time has come, otherwise None.
+        with self.lock:
+            return {
+                domain: delay / (delay + self.slot_idle[domain])
+                for domain, delay in self.slot_delay.items()
+                if delay + self.slot_idle[domain] > 0
+            }
+
+    def _record_claim(self, domain: str, now: float) -> None:
+        """Account the gap since the previous request to domain. Caller holds lock."""
+        if domain in self.slot_open:
+            claimed, opens = self.slot_open.pop(domain)
+            opens = min(max(opens, claimed), now)
+            self.slot_delay[domain] += opens - claimed
+            self.slot_idle[domain] += now - opens
+        self.queued[domain] -= 1
+        if self.queued[domain] > 0 and self.rate_limiter is not None:
+            self.slot_open[domain] = (now, self._next_allowed_time(domain, now))
+        elif not self.queued[domain]:
+            del self.queued[domain]
+
+    def submit(self, item: Any, domain: str, when: float = 0.0) -> None:
+        """Queue item for domain, to be fetched no earlier than when."""
+        with self.cond:
+            heapq.heappush(self.delayed, DelayedItem(when, next(self._seq), domain, item))
+            self.queued[domain] += 1
+            self.cond.notify_all()
+
+    def schedule_retry(self, item: Any, when: float, domain: str = "") -> None:
+        """Put item into the delayed queue to be retried at 'when'."""
+        self.submit(item, domain, when)
+
+    def _ready_time(self, now: float) -> float | None:
+        """
+        Return when the head item may be fetched, or None if empty. Caller holds lock.
 
-        Non-blocking by default. If timeout > 0, will wait up to timeout seconds.
+        The head is re-keyed while its domain slot is later than its queued time, so the
+        heap head is always the item which becomes fetchable first.
         """
-        try:
-            peek = self.delayed.get_nowait()
-        except Empty:
-            return None
+        while self.delayed:
+            head = self.delayed[0]
+            ready = max(head.next_time, self._next_allowed_time(head.domain, now))
+            if ready <= head.next_time:
+                return ready
+            heapq.heapreplace(
+                self.delayed,
+                DelayedItem(ready, head.seq, head.domain, head.item),
+            )
+        return None
+
+    def next_fetchable(self, timeout: float | None = None) -> Any | None:
+        """
+        Block until an item may be fetched, across all domains, and return it.
 
-        if peek.next_time <= time.time():
-            return peek.item
-        self.delayed.put(peek)
+        The item's domain slot is reserved on return. Returns None on timeout or close.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while not self.closed:
+                now = time.monotonic()
+                ready = self._ready_time(now)
+                if ready is not None and ready <= now:
+                    head = heapq.heappop(self.delayed)
+                    self._consume(head.domain, now)
+                    self._record_claim(head.domain, now)
+                    return head.item
+                if deadline is None:
+                    wait_until = ready
+                elif ready is None:
+                    wait_until = deadline
+                else:
+                    wait_until = min(ready, deadline)
+                if wait_until is not None and wait_until <= now:
+                    return None
+                self.cond.wait(None if wait_until is None else wait_until - now)
         return None
 
+    def pop_due(self) -> Any | None:
+        """Return an item which may be fetched now, otherwise None. Does not block."""
+        return self.next_fetchable(timeout=0)
+
     def time_until_next(self) -> float | None:
-        """Return seconds until the next delayed item becomes due, or None if none."""
-        try:
-            item = self.delayed.get_nowait()
-        except Empty:
+        """Return seconds until the next delayed item becomes fetchable, or None if none."""
+        with self.lock:
+            now = time.monotonic()
+            ready = self._ready_time(now)
+        if ready is None:
             return None
-        # reinsert and compute
-        self.delayed.put(item)
-        return max(0.0, item.next_time - time.time())
+        return max(0.0, ready - now)
+
+    def close(self) -> None:
+        """Wake all waiting workers, next_fetchable returns None from now on."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        with self.lock:
+            return len(self.delayed)
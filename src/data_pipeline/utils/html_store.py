@@ -0,0 +1,76 @@
+"""Content-addressed on-disk store for fetched html, so nodes only hold a reference."""
+
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from src.utils.logger import logger
+
+
+class HTMLStore:
+    """
+    Store html bodies on disk keyed by their sha256 hash.
+
+    Identical pages are written once. Reads go through a small in-memory LRU.
+    """
+
+    def __init__(self, base_dir: Path, *, compress: bool = True, cache_size: int = 16) -> None:
+        """Initialize HTMLStore."""
+        self.base_dir = base_dir
+        self.compress = compress
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _path_for(self, key: str) -> Path:
+        """Return the blob path for key, sharded by the first two hex chars."""
+        suffix = ".html.z" if self.compress else ".html"
+        return self.base_dir / key[:2] / (key + suffix)
+
+    def put(self, html: str) -> str:
+        """Write html to the store if not already present and return its key."""
+        raw = html.encode("utf-8")
+        key = hashlib.sha256(raw).hexdigest()
+        path = self._path_for(key)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(zlib.compress(raw) if self.compress else raw)
+            tmp_path.replace(path)
+        self._cache_put(key, html)
+        return key
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether a blob is stored under key."""
+        with self.lock:
+            if key in self._cache:
+                return True
+        return self._path_for(key).exists()
+
+    def get(self, key: str) -> str:
+        """Return the html stored under key. Raises FileNotFoundError if missing."""
+        with self.lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        path = self._path_for(key)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            logger.error(f"[HTML STORE]: Missing html blob {key} at {path}")
+            raise
+        html = (zlib.decompress(raw) if self.compress else raw).decode("utf-8")
+        self._cache_put(key, html)
+        return html
+
+    def _cache_put(self, key: str, html: str) -> None:
+        """Insert into the LRU, evicting the least recently used entry."""
+        if self.cache_size <= 0:
+            return
+        with self.lock:
+            self._cache[key] = html
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
@@ -0,0 +1,85 @@
+"""Conditional request cache, so unchanged pages are answered with 304 on re-crawls."""
+
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from src.data_pipeline.utils.html_store import HTMLStore
+from src.utils.json_lines import append_json_line, load_json_lines
+
+
+class HTTPCache:
+    """
+    Persist ETag / Last-Modified validators per url, with the body they belong to.
+
+    Validators are kept in an append-only JSON lines file, the last line for a url wins.
+    Bodies are kept in an HTMLStore, so identical pages share one blob.
+    """
+
+    def __init__(self, base_dir: Path, *, body_store: HTMLStore | None = None) -> None:
+        """Initialize HTTPCache, loading validators saved by previous runs."""
+        self.base_dir = base_dir
+        self.path = base_dir / "validators.jsonl"
+        self.body_store = body_store or HTMLStore(base_dir / "bodies")
+        self.lock = threading.Lock()
+        # Forgotten urls are appended with a None body
+        self.entries: dict[str, dict] = load_json_lines(
+            self.path, is_removal=lambda record: record["body"] is None,
+        )
+        self.hits = 0
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Return conditional request headers for url, empty if no usable entry."""
+        with self.lock:
+            record = self.entries.get(url)
+        if record is None or record["body"] not in self.body_store:
+            return {}
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def cached_body(self, url: str) -> str | None:
+        """Return the body stored for url after a 304, or None if it is gone."""
+        with self.lock:
+            record = self.entries.get(url)
+        if record is None:
+            return None
+        try:
+            html = self.body_store.get(record["body"])
+        except FileNotFoundError:
+            self.forget(url)
+            return None
+        with self.lock:
+            self.hits += 1
+        return html
+
+    def store(self, url: str, headers: Mapping[str, str], html: str) -> None:
+        """Remember the validators of a full response, if it sent any."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        record = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": self.body_store.put(html),
+        }
+        with self.lock:
+            if self.entries.get(url) == record:
+                return
+            self.entries[url] = record
+            self._append(record)
+
+    def forget(self, url: str) -> None:
+        """Drop the entry for url, so the next request is unconditional."""
+        with self.lock:
+            if self.entries.pop(url, None) is not None:
+                self._append({"url": url, "etag": None, "last_modified": None, "body": None})
+
+    def _append(self, record: dict) -> None:
+        """Append one record to the validators file. Caller holds lock."""
+        append_json_line(self.path, record)
@@ -0,0 +1,50 @@
+"""In-memory handoff of extracted page data, so a page is parsed once for links and data."""
+
+import threading
+
+
+class ParsedPages:
+    """
+    Hold data extracted at fetch time for pages awaiting PROCESS, keyed by url.
+
+    Entries live only in memory. The processor reads an entry with get, which keeps it for a
+    retry of a node waiting on dependencies, and discards it once the node is processed or
+    failed. A page without an entry, e.g. after a restart, is parsed again from its stored html.
+    """
+
+    def __init__(self) -> None:
+        """Initialize ParsedPages."""
+        self.lock = threading.Lock()
+        self.pages: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, url: str, data: dict) -> None:
+        """Store the extracted data of url."""
+        with self.lock:
+            self.pages[url] = data
+
+    def get(self, url: str) -> dict | None:
+        """Return a copy of the extracted data of url, keeping the entry, or None if none."""
+        with self.lock:
+            data = self.pages.get(url)
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(data)
+
+    def discard(self, url: str) -> None:
+        """Remove the extracted data of url, if any."""
+        with self.lock:
+            self.pages.pop(url, None)
+
+    def metrics(self) -> dict[str, int]:
+        """Return how often the processor reused extracted data, and the pages still held."""
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "held": len(self.pages)}
+
+    def __len__(self) -> int:
+        """Return the number of pages held."""
+        with self.lock:
+            return len(self.pages)
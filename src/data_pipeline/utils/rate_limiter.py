@@ -0,0 +1,176 @@
+"""Adaptive per-domain token buckets, driven by server responses."""
+
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+from src.utils.logger import logger
+
+BACKOFF_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: object, now: float | None = None) -> float | None:
+    """
+    Return the Retry-After header value as seconds to wait, or None if absent or invalid.
+
+    Accepts both delay seconds and an HTTP date.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket for one domain whose refill rate adapts to the server.
+
+    Rates are requests per second. The rate is halved on 429/503 and eased off when latency
+    rises well above its moving average. After success_window fast clean responses in a row
+    it grows by increase_step, up to max_rate.
+    """
+
+    rate: float
+    min_rate: float
+    max_rate: float
+    capacity: float = 1.0
+    increase_step: float = 0.05
+    backoff_factor: float = 0.5
+    latency_factor: float = 2.0
+    success_window: int = 10
+    tokens: float = field(init=False)
+    updated: float = field(default=0.0, init=False)
+    blocked_until: float = field(default=0.0, init=False)
+    latency_avg: float | None = field(default=None, init=False)
+    clean_streak: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = self.capacity
+
+    def _refill(self, now: float) -> None:
+        if self.updated and now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+
+    def next_allowed_time(self, now: float) -> float:
+        """Return the earliest time a token is available."""
+        self._refill(now)
+        # Tolerate float error from refilling at exactly the computed time
+        ready = now if self.tokens >= 1 - 1e-9 else now + (1 - self.tokens) / self.rate
+        return max(ready, self.blocked_until)
+
+    def consume(self, now: float) -> None:
+        """Take one token for a request starting now."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def record_response(
+        self,
+        status: int | None,
+        latency: float,
+        retry_after: float | None,
+        now: float,
+    ) -> None:
+        """Adapt the rate to one response. status None means no response was received."""
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self.tokens = min(self.tokens, 0.0)
+        if status is None or status in BACKOFF_STATUSES:
+            self._set_rate(self.rate * self.backoff_factor)
+            self.clean_streak = 0
+            return
+
+        slow = self.latency_avg is not None and latency > self.latency_avg * self.latency_factor
+        self.latency_avg = (
+            latency if self.latency_avg is None else 0.8 * self.latency_avg + 0.2 * latency
+        )
+        if slow:
+            self._set_rate(self.rate * 0.75)
+            self.clean_streak = 0
+        elif status < 400:  # noqa: PLR2004
+            self.clean_streak += 1
+            if self.clean_streak >= self.success_window:
+                self._set_rate(self.rate + self.increase_step)
+                self.clean_streak = 0
+        else:
+            self.clean_streak = 0
+
+    def _set_rate(self, rate: float) -> None:
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+
+class RateLimiter:
+    """Token buckets by domain, with the current rate of each exposed as a metric."""
+
+    def __init__(
+        self,
+        initial_rate: float = 0.4,
+        *,
+        min_rate: float = 0.05,
+        max_rate: float | None = None,
+        **bucket_kwargs: float,
+    ) -> None:
+        """
+        Initialize RateLimiter.
+
+        Args:
+            initial_rate: Requests per second for a domain not seen before.
+            min_rate: Floor the rate never drops below.
+            max_rate: Ceiling the rate may grow to, defaults to initial_rate.
+            bucket_kwargs: Passed to each TokenBucket.
+
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min(min_rate, initial_rate)
+        self.max_rate = max(max_rate or initial_rate, initial_rate)
+        self.bucket_kwargs = bucket_kwargs
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, domain: str) -> TokenBucket:
+        """Return the bucket for domain, creating it on first use."""
+        if domain not in self.buckets:
+            self.buckets[domain] = TokenBucket(
+                self.initial_rate,
+                self.min_rate,
+                self.max_rate,
+                **self.bucket_kwargs,
+            )
+        return self.buckets[domain]
+
+    def next_allowed_time(self, domain: str, now: float | None = None) -> float:
+        """Return the earliest time a request to domain may start."""
+        now = time.monotonic() if now is None else now
+        return self.bucket(domain).next_allowed_time(now)
+
+    def consume(self, domain: str, now: float | None = None) -> None:
+        """Spend a token for a request to domain."""
+        self.bucket(domain).consume(time.monotonic() if now is None else now)
+
+    def record_response(
+        self,
+        domain: str,
+        status: int | None,
+        latency: float,
+        retry_after: float | None = None,
+    ) -> None:
+        """Feed one response back into the domain's bucket."""
+        bucket = self.bucket(domain)
+        old_rate = bucket.rate
+        bucket.record_response(status, latency, retry_after, time.monotonic())
+        if bucket.rate != old_rate:
+            logger.info(
+                f"[RATE LIMITER]: {domain} rate {old_rate:.2f} -> {bucket.rate:.2f} req/s"
+                f" (status {status}, latency {latency:.2f}s)",
+            )
+
+    def current_rates(self) -> dict[str, float]:
+        """Return the current requests per second of every known domain."""
+        return {domain: bucket.rate for domain, bucket in self.buckets.items()}
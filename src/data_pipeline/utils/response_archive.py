@@ -0,0 +1,59 @@
+"""On-disk archive of fetched responses, for offline replay of the pipeline."""
+
+import threading
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.data_pipeline.utils.html_store import HTMLStore
+from src.utils.json_lines import append_json_line, load_json_lines
+
+
+class ResponseArchive:
+    """
+    Record url, status, headers, body and fetch time of every response.
+
+    Records are appended to an index of JSON lines, the last record for a url wins.
+    Bodies are compressed in an HTMLStore, so unchanged pages share one blob.
+    """
+
+    def __init__(self, base_dir: Path, *, body_store: HTMLStore | None = None) -> None:
+        """Initialize ResponseArchive, loading the index of previous runs."""
+        self.base_dir = base_dir
+        self.path = base_dir / "index.jsonl"
+        self.body_store = body_store or HTMLStore(base_dir / "bodies")
+        self.lock = threading.Lock()
+        self.records: dict[str, dict] = load_json_lines(self.path)
+
+    def record(self, url: str, status: int, headers: Mapping[str, str], html: str) -> None:
+        """Archive one response."""
+        record = {
+            "url": url,
+            "status": status,
+            "headers": dict(headers),
+            "body": self.body_store.put(html),
+            "fetched_at": datetime.now(UTC).isoformat(),
+        }
+        with self.lock:
+            self.records[url] = record
+            append_json_line(self.path, record)
+
+    def lookup(self, url: str) -> dict | None:
+        """Return the latest record for url, or None if it was never archived."""
+        with self.lock:
+            return self.records.get(url)
+
+    def body(self, url: str) -> str | None:
+        """Return the archived body for url, or None if it was never archived."""
+        record = self.lookup(url)
+        return None if record is None else self.body_store.get(record["body"])
+
+    def urls(self) -> Iterator[str]:
+        """Iterate over archived urls."""
+        with self.lock:
+            return iter(list(self.records))
+
+    def __len__(self) -> int:
+        """Return the number of archived urls."""
+        with self.lock:
+            return len(self.records)
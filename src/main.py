@@ -4,9 +4,25 @@ __author__ = 'B W'
 from pathlib import Path
 
 from src.bootstrap_sessions import insert_sessions, sessions_data, sql_function
-from src.config.settings import PIPELINE_REGISTRY, known_links_cache_file, project_config
+from src.config.settings import (
+    PIPELINE_REGISTRY,
+    change_ledger_file,
+    fetch_replay,
+    html_store_dir,
+    http_cache_dir,
+    known_links_cache_file,
+    project_config,
+    response_archive_dir,
+    state_cache_file,
+    state_prune_completed,
+    state_snapshot_binary,
+)
 from src.data_pipeline.orchestrate import Orchestrator
-from src.services.db_connect import db_conn
+from src.data_pipeline.utils.change_ledger import ChangeLedger
+from src.data_pipeline.utils.html_store import HTMLStore
+from src.data_pipeline.utils.http_cache import HTTPCache
+from src.data_pipeline.utils.response_archive import ResponseArchive
+from src.services.db_connect import database_identity, db_conn
 from src.structures.directed_graph import DirectionalGraph
 from src.utils.logger import logger
 
@@ -23,6 +39,9 @@ class Main:
         """Create placeholders for state variables."""
         self.db_conn = db_conn
         self.state = DirectionalGraph()
+        self.state.enable_journal(state_cache_file)
+        self.state.binary_snapshot = state_snapshot_binary
+        self.state.prune_completed = state_prune_completed
         self.registry = PIPELINE_REGISTRY
 
         self.session_codes = None
@@ -50,11 +69,24 @@ class Main:
 
     def run(self):
         with db_conn() as conn:
+            # One body store, so each fetched page is compressed and written once
+            html_store = HTMLStore(html_store_dir)
             orchestrator = Orchestrator(
                 self.registry,
                 self.starting_links,
                 self.conn,
                 state=self.state,
+                html_store=html_store,
+                http_cache=(
+                    HTTPCache(http_cache_dir, body_store=html_store) if http_cache_dir else None
+                ),
+                archive=ResponseArchive(response_archive_dir, body_store=html_store),
+                replay=fetch_replay,
+                change_ledger=(
+                    ChangeLedger(change_ledger_file, db_identity=database_identity(conn))
+                    if change_ledger_file
+                    else None
+                ),
             )
             orchestrator.orchestrate()
 
@@ -26,6 +26,21 @@ class SelectorTemplate:
         """Return a copy of the selector template."""
         return self.selectors.copy()
 
+    def css_selectors(self) -> list[str]:
+        """
+        Return the CSS selector strings of the template.
+
+        A selector is the value itself or the first item of a (selector, attr) tuple, in
+        PROCESS templates the first item of the (selector, transformer) pair.
+        """
+        result = []
+        for value in self.selectors.values():
+            while isinstance(value, tuple) and value:
+                value = value[0]  # noqa: PLW2901
+            if isinstance(value, str):
+                result.append(value)
+        return result
+
     def get_dynamic_state(
         self,
         state: directed_graph.DirectionalGraph,
@@ -47,4 +47,20 @@ def db_conn() -> Generator:
     try:
         yield conn
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+def database_identity(conn: psycopg.Connection) -> str:
+    """
+    Return host, database and schema with their OIDs.
+
+    Dropping and recreating the database or the schema changes the identity, truncating
+    tables in place does not.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT current_database(), d.oid, current_schema(), n.oid "
+            "FROM pg_database d JOIN pg_namespace n ON n.nspname = current_schema() "
+            "WHERE d.datname = current_database();",
+        )
+        database, database_oid, schema, schema_oid = cur.fetchone()
+    return f"{DB_HOST}:{DB_PORT}/{database}:{database_oid}/{schema}:{schema_oid}"
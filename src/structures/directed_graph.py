@@ -3,22 +3,102 @@
 import json
 import threading
 from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from contextlib import nullcontext, suppress
 from html import unescape
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 from urllib.parse import unquote, urlparse
 
-from urllib3.util import parse_url
-
 from src.config.pipeline_enums import PipelineRegistryKeys
+from src.structures.graph_codec import SnapshotReader, encode_snapshot, is_binary_snapshot
+from src.structures.graph_journal import GraphJournal
+from src.structures.graph_traversal import incoming_edges, outgoing_edges, walk
 from src.structures.indexed_tree import PipelineStateEnum
 from src.utils.logger import logger
-from src.utils.strings.normalize_url import normalize_url
+from src.utils.strings.canonical_url import canonical_url_key, url_key_contains, url_key_terms
+
+# Data keys which are indexed by DirectionalGraph for fast dependency lookups.
+INDEXED_DATA_KEYS = ("legislator_id", "committee_id", "bill_id")
+
+def netloc_key(url: str) -> str:
+    """Return the normalized netloc of a url, or of a bare netloc."""
+    netloc = urlparse(url).netloc if "//" in url else url.split("/", 1)[0]
+    return unquote(netloc).strip().lower()
+
+
+# Placeholder for empty node data, the dict is only allocated once accessed.
+_NO_DATA = object()
+
+# Edges are stored as None (no edges), a single Node, or a set of Nodes, since most
+# nodes have zero or one parent and leaves have no children.
+type _Edges = Node | set[Node] | None
+
+
+def _edges_from(nodes: Any) -> _Edges:
+    """Build compact edge storage from an iterable of nodes."""
+    edges = None
+    for node in nodes or ():
+        edges = _edge_add(edges, node)
+    return edges
+
+
+def _edge_add(edges: _Edges, node: "Node") -> _Edges:
+    """Return edges with node added."""
+    if edges is None or edges is node:
+        return node
+    if isinstance(edges, set):
+        edges.add(node)
+        return edges
+    return {edges, node}
+
+
+def _edge_remove(edges: _Edges, node: "Node") -> _Edges:
+    """Return edges with node removed. Raises KeyError if absent, like set.remove."""
+    if isinstance(edges, set):
+        edges.remove(node)
+        if len(edges) == 1:
+            return next(iter(edges))
+        return edges
+    if edges is node:
+        return None
+    raise KeyError(node)
+
+
+def _edge_contains(edges: _Edges, node: "Node") -> bool:
+    """Return True if node is in edges."""
+    if isinstance(edges, set):
+        return node in edges
+    return edges is node
+
+
+def _edge_view(edges: _Edges) -> set["Node"]:
+    """Return edges as a set. A stored set is returned as is and must not be mutated."""
+    if edges is None:
+        return set()
+    if isinstance(edges, set):
+        return edges
+    return {edges}
 
 
 class Node:
     """Node for IndexedTree."""
 
+    __slots__ = (
+        "_data",
+        "_data_keys",
+        "_data_source",
+        "_incoming",
+        "_outgoing",
+        "_pending",
+        "_state",
+        "container",
+        "id",
+        "type",
+        "url",
+    )
+
     id_counter = 1
 
     def __init__(
@@ -44,20 +124,151 @@ class Node:
             self.id = Node.id_counter
             Node.id_counter += 1
 
-        self.outgoing = outgoing or set()
-        self.incoming = incoming or set()
-        self.data = data or {}
+        self.container = container
+        self._data_source: Callable[[], Any] | None = None
+        self._data_keys: tuple[str, ...] = ()
+        self._pending = 0
+        self._incoming = _edges_from(incoming)
+        self.outgoing = outgoing
         self.url = unquote(url)
         self.type = node_type
-        self.container = container
+        self.data = data or _NO_DATA
 
         # self.lock = threading.Lock()
 
+        self.state = state
+
+    @property
+    def outgoing(self) -> set["Node"]:
+        """Return outgoing nodes as a set, treat as read-only."""
+        return _edge_view(self._outgoing)
+
+    @outgoing.setter
+    def outgoing(self, nodes: Any) -> None:
+        self._outgoing = _edges_from(nodes)
+        self._pending = sum(
+            1 for child in self.outgoing if child.state != PipelineStateEnum.COMPLETED
+        )
+
+    @property
+    def pending_children(self) -> int:
+        """Return the number of outgoing nodes which are not COMPLETED."""
+        return self._pending
+
+    @property
+    def incoming(self) -> set["Node"]:
+        """Return incoming nodes as a set, treat as read-only."""
+        return _edge_view(self._incoming)
+
+    @incoming.setter
+    def incoming(self, nodes: Any) -> None:
+        self._incoming = _edges_from(nodes)
+
+    @property
+    def state(self) -> PipelineStateEnum:
+        """Return the node state."""
+        return self._state
+
+    @state.setter
+    def state(self, state: PipelineStateEnum | int) -> None:
+        """
+        Set the node state, keeping the container's state index current.
+
+        Entering or leaving COMPLETED updates the parents' pending child counts. A node
+        AWAITING_CHILDREN with no pending children becomes COMPLETED, which bubbles up.
+        Bubbling uses a worklist, so completing the leaf of a deep chain does not recurse.
+        If the container prunes completed subtrees, the newly completed nodes are offered to it.
+
+        The first assignment, in __init__, only records the state: edges are attached after
+        construction, e.g. when loading, so the pending count is not known yet.
+        """
         # Handle state input as Int (from JSON) or Enum
-        if isinstance(state, int):
-            self.state = PipelineStateEnum(state)
-        else:
-            self.state = state
+        if not isinstance(state, PipelineStateEnum):
+            state = PipelineStateEnum(state)
+        if getattr(self, "_state", None) is None:
+            self._apply_state(state)
+            return
+        container = self.container if isinstance(self.container, DirectionalGraph) else None
+        with container.lock if container else nullcontext():
+            worklist = self._apply_state(state)
+            completed = [self] if state == PipelineStateEnum.COMPLETED else []
+            while worklist:
+                node = worklist.pop()
+                if node._pending == 0 and node._state == PipelineStateEnum.AWAITING_CHILDREN:  # noqa: SLF001
+                    worklist.extend(node._apply_state(PipelineStateEnum.COMPLETED))  # noqa: SLF001
+                    completed.append(node)
+            if completed and container and container.prune_completed:
+                container.prune_completed_subtrees(completed)
+
+    def _apply_state(self, state: PipelineStateEnum) -> list["Node"]:
+        """Set the state of this node only and return the nodes which may now auto-complete."""
+        old_state = getattr(self, "_state", None)
+        self._state = state
+        if isinstance(self.container, DirectionalGraph):
+            self.container.reindex_state(self, old_state)
+        completed = PipelineStateEnum.COMPLETED
+        if old_state is None or (old_state == completed) == (state == completed):
+            return [self]
+        delta = -1 if state == completed else 1
+        parents = list(self.incoming)
+        for parent in parents:
+            parent._pending += delta  # noqa: SLF001
+        return [*parents, self]
+
+    def _child_completion_changed(self, delta: int) -> None:
+        """Adjust the pending child count after a child enters (-1) or leaves (+1) COMPLETED."""
+        self._pending += delta
+        self._complete_if_done()
+
+    def _complete_if_done(self) -> None:
+        """Mark the node COMPLETED if it only awaits children and none are pending."""
+        if self._pending == 0 and self._state == PipelineStateEnum.AWAITING_CHILDREN:
+            self.state = PipelineStateEnum.COMPLETED
+
+    @property
+    def data(self) -> dict:
+        """Return the node data, loading it on first access if it is lazy."""
+        if self._data_source is not None:
+            source, self._data_source = self._data_source, None
+            self._data = source()
+        elif self._data is _NO_DATA:
+            self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, data: dict | None) -> None:
+        """
+        Replace the node data, keeping the container's data key index current.
+
+        In-place mutation of the dict is not tracked by the index.
+        """
+        self._data_source = None
+        self._data = data
+        if isinstance(self.container, DirectionalGraph):
+            self.container.reindex_data(self)
+
+    def set_lazy_data(self, source: Callable[[], Any], data_keys: tuple[str, ...]) -> None:
+        """Defer loading data until first access. data_keys lists the indexed keys present."""
+        self._data_source = source
+        self._data_keys = data_keys
+        self._data = None
+
+    def peek_data(self) -> Any:
+        """Return the node data without keeping lazily loaded data in memory."""
+        if self._data_source is not None:
+            return self._data_source()
+        return {} if self._data is _NO_DATA else self._data
+
+    def data_ref(self) -> Any:
+        """Return the node data, or the loader of lazy data, without loading it."""
+        return self._data_source if self._data_source is not None else self.peek_data()
+
+    def has_data_key(self, key: str) -> bool:
+        """Check for a data key, without loading lazy data for indexed keys."""
+        if self._data_source is not None and key in INDEXED_DATA_KEYS:
+            return key in self._data_keys
+        data = self._data
+        return data is not None and data is not _NO_DATA and key in data
 
     def set_state(self, state: PipelineStateEnum) -> None:
         """Set state."""
@@ -72,12 +283,16 @@ class Node:
     def add_incoming(self, incoming_ref: Any) -> None:
         """Add incoming reference."""
         # with self.lock:
-        self.incoming.add(incoming_ref)
+        self._incoming = _edge_add(self._incoming, incoming_ref)
 
     def add_outgoing(self, outgoing_ref: Any) -> None:
         """Add outgoing reference."""
         # with self.lock:
-        self.outgoing.add(outgoing_ref)
+        if _edge_contains(self._outgoing, outgoing_ref):
+            return
+        self._outgoing = _edge_add(self._outgoing, outgoing_ref)
+        if outgoing_ref.state != PipelineStateEnum.COMPLETED:
+            self._pending += 1
 
     def remove_container(self, container_ref: Any) -> None:
         """Remove container reference."""
@@ -87,20 +302,24 @@ class Node:
 
     def remove_incoming(self, incoming_ref: Any) -> None:
         """Remove incoming reference."""
-        self.incoming.remove(incoming_ref)
+        self._incoming = _edge_remove(self._incoming, incoming_ref)
 
     def remove_outgoing(self, outgoing_ref: Any) -> None:
         """Remove outgoing reference."""
-        self.outgoing.remove(outgoing_ref)
+        self._outgoing = _edge_remove(self._outgoing, outgoing_ref)
+        if outgoing_ref.state != PipelineStateEnum.COMPLETED:
+            self._child_completion_changed(-1)
 
     def _compare(self, val1: Any, val2: Any) -> bool:
         """Compare two values safely, with partial URL match."""
         if isinstance(val1, str) and isinstance(val2, str):
             # Treat strings starting with "/" or "http" as URLs
             if val1.startswith("http") or val2.startswith("/"):
-                nval2 = normalize_url(val2)
-                nval1 = normalize_url(val1)
-                return nval2 in nval1
+                # Links without a session match the same page in any session, and a node url
+                # may carry query parameters the link does not
+                key1, session1 = canonical_url_key(val1)
+                key2, session2 = canonical_url_key(val2)
+                return url_key_contains(key1, key2) and session2 in (None, session1)
             return val1 == val2
         if isinstance(val1, (int, float, bool)):
             return val1 == val2
@@ -191,61 +410,312 @@ class DirectionalGraph:
         self.name = name
         self.nodes: OrderedDict[str, Node] = OrderedDict()
         self.roots: set[Node] = set()
+        self.lock = threading.RLock()
+        # Structural versions, bumped under the lock. Read snapshots are reused until they change.
+        self._version = 0
+        self._roots_version = 0
+        self._nodes_snapshot: tuple[int, Mapping[str, Node]] | None = None
+        self._roots_snapshot: tuple[int, frozenset[Node]] | None = None
+        # Secondary indexes, dicts used as insertion-ordered sets
+        self._state_index: dict[PipelineStateEnum, dict[Node, None]] = {}
+        self._type_index: dict[PipelineRegistryKeys, dict[Node, None]] = {}
+        self._data_key_index: dict[str, dict[Node, None]] = {
+            key: {} for key in INDEXED_DATA_KEYS
+        }
+        self._url_index: dict[str, dict[Node, None]] = {}
+        # Canonical url key terms, see url_key_terms, for urls with extra query parameters
+        self._url_term_index: dict[str, dict[Node, None]] = {}
+        # Root indexes by normalized netloc and by session code
+        self._root_netloc_index: dict[str, dict[Node, None]] = {}
+        self._root_session_index: dict[str, dict[Node, None]] = {}
+        # Write-ahead journal, disabled until enable_journal is called
+        self._journal: GraphJournal | None = None
+        self._pending_records: list[dict] = []
+        self._flush_lock = threading.Lock()
+        self.compact_every = 0
+        # Write snapshots with the binary codec instead of JSON
+        self.binary_snapshot = False
+        # Replace completed non-root subtrees with tombstones as soon as they complete
+        self.prune_completed = False
+        # url -> (node id, type, loaded ids) of pruned nodes, and their canonical url index
+        self._tombstones: dict[str, tuple[int, Any, dict | None]] = {}
+        self._tombstone_url_index: dict[str, dict[str, None]] = {}
         if nodes is not None:
             self.load_node_list(nodes)
-        self.lock = threading.RLock()
+
+    def enable_journal(self, snapshot_path: Path, compact_every: int = 1000) -> None:
+        """
+        Persist changes as an append-only journal next to snapshot_path.
+
+        save_file then appends only the changes recorded since the last call, and rewrites
+        the full snapshot once the journal holds compact_every records.
+        """
+        with self.lock:
+            self._journal = GraphJournal(snapshot_path)
+            self._pending_records = []
+            self.compact_every = compact_every
+
+    def _record(self, op: str, **fields: Any) -> None:
+        """Queue a journal record for the next save_file call."""
+        if self._journal is None:
+            return
+        with self.lock:
+            self._pending_records.append({"op": op, **fields})
+
+    def _index_node(self, node: Node) -> None:
+        """Add node to all secondary indexes."""
+        with self.lock:
+            self._version += 1
+            self._state_index.setdefault(node.state, {})[node] = None
+            self._type_index.setdefault(node.type, {})[node] = None
+            url_key = canonical_url_key(node.url)[0]
+            self._url_index.setdefault(url_key, {})[node] = None
+            for term in url_key_terms(url_key):
+                self._url_term_index.setdefault(term, {})[node] = None
+            self._index_data(node)
+
+    def _unindex_node(self, node: Node) -> None:
+        """Remove node from all secondary indexes."""
+        with self.lock:
+            self._version += 1
+            self._state_index.get(node.state, {}).pop(node, None)
+            self._type_index.get(node.type, {}).pop(node, None)
+            url_key = canonical_url_key(node.url)[0]
+            self._url_index.get(url_key, {}).pop(node, None)
+            if not self._url_index.get(url_key, True):
+                del self._url_index[url_key]
+            for term in url_key_terms(url_key):
+                self._url_term_index.get(term, {}).pop(node, None)
+                if not self._url_term_index.get(term, True):
+                    del self._url_term_index[term]
+            for index in self._data_key_index.values():
+                index.pop(node, None)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all secondary indexes from the nodes dict."""
+        with self.lock:
+            self._version += 1
+            self._state_index = {}
+            self._type_index = {}
+            self._data_key_index = {key: {} for key in INDEXED_DATA_KEYS}
+            self._url_index = {}
+            self._url_term_index = {}
+            for node in self.nodes.values():
+                self._index_node(node)
+
+    def reindex_state(self, node: Node, old_state: PipelineStateEnum | None) -> None:
+        """Move node between state index buckets. Called by Node on state change."""
+        with self.lock:
+            if self.nodes.get(unquote(unescape(node.url))) is not node:
+                return
+            if old_state is not None:
+                self._state_index.get(old_state, {}).pop(node, None)
+            self._state_index.setdefault(node.state, {})[node] = None
+            self._record("state", id=node.id, state=node.state.value)
+
+    def reindex_data(self, node: Node) -> None:
+        """Update the data key index for node. Called by Node on data replacement."""
+        with self.lock:
+            if self.nodes.get(unquote(unescape(node.url))) is not node:
+                return
+            self._index_data(node)
+            self._record("data", id=node.id, data=node.data)
+
+    def _index_data(self, node: Node) -> None:
+        """Place node in the data key index buckets matching its data."""
+        for key, index in self._data_key_index.items():
+            if node.has_data_key(key):
+                index[node] = None
+            else:
+                index.pop(node, None)
+
+    def get_nodes_by_state(self, state: PipelineStateEnum) -> list[Node]:
+        """Return all nodes currently in state."""
+        with self.lock:
+            return list(self._state_index.get(state, {}))
+
+    def get_nodes_by_type(self, node_type: PipelineRegistryKeys) -> list[Node]:
+        """Return all nodes of node_type."""
+        with self.lock:
+            return list(self._type_index.get(node_type, {}))
+
+    def get_nodes_with_data_key(self, key: str) -> list[Node]:
+        """Return all nodes whose data contains an indexed key."""
+        with self.lock:
+            return list(self._data_key_index.get(key, {}))
+
+    def find_nodes_by_url_match(self, url: str) -> list[Node]:
+        """
+        Return nodes whose canonical url matches url.
+
+        A url without a session parameter matches nodes from any session. Without an exact
+        match, nodes whose url has the same path and further query parameters match.
+        """
+        url_key, session = canonical_url_key(url)
+        with self.lock:
+            candidates = list(self._url_index.get(url_key, {}))
+            if not candidates:
+                buckets = [self._url_term_index.get(term, {}) for term in url_key_terms(url_key)]
+                smallest = min(buckets, key=len)
+                candidates = [node for node in smallest if all(node in b for b in buckets)]
+        if session is None:
+            return candidates
+        return [node for node in candidates if canonical_url_key(node.url)[1] == session]
+
+    def _get_candidates(
+        self,
+        data_attrs: dict | None,
+        node_attrs: dict | None,
+    ) -> list[Node]:
+        """Return the smallest indexed candidate set for a query, or all nodes."""
+        with self.lock:
+            candidate_sets = []
+            if node_attrs:
+                if node_attrs.get("state") is not None:
+                    candidate_sets.append(self._state_index.get(node_attrs["state"], {}))
+                if node_attrs.get("type") is not None:
+                    candidate_sets.append(self._type_index.get(node_attrs["type"], {}))
+                url = node_attrs.get("url")
+                if isinstance(url, str) and (url.startswith(("http", "/"))):
+                    candidate_sets.append(self.find_nodes_by_url_match(url))
+            if data_attrs:
+                candidate_sets.extend(
+                    self._data_key_index[key] for key in data_attrs if key in self._data_key_index
+                )
+            if not candidate_sets:
+                return list(self.nodes.values())
+            return list(min(candidate_sets, key=len))
 
     def add_node(self, node: Node) -> None:
         """Add node to nodes list."""
         with self.lock:
             self.nodes.update({unquote(unescape(node.url)): node})
+            self._index_node(node)
 
     def set_nodes(self, nodes: OrderedDict[str, Node] | None) -> None:
         """Set all nodes using an ordered dict of [url, Node]."""
         with self.lock:
             self.nodes = nodes
+            self._rebuild_indexes()
+
+    def get_nodes(self) -> Mapping[str, Node]:
+        """
+        Get a read-only snapshot of all nodes.
 
-    def get_nodes(self) -> OrderedDict:
-        """Get all nodes."""
+        The snapshot is copied once per structural change and shared by all readers,
+        which do not take the lock while it is current.
+        """
+        snapshot = self._nodes_snapshot
+        if snapshot is not None and snapshot[0] == self._version:
+            return snapshot[1]
         with self.lock:
-            return self.nodes.copy()
+            view = MappingProxyType(self.nodes.copy())
+            self._nodes_snapshot = (self._version, view)
+            return view
 
     def remove_node(self, node: Node) -> Node:
         """Remove node from nodes dict."""
         with self.lock:
+            self._unindex_node(node)
             return self.nodes.pop(node.url)
 
-    def get_roots(self) -> set[Node]:
-        """Get seed urls."""
+    def get_roots(self) -> frozenset[Node]:
+        """Get a read-only snapshot of the seed urls, shared until the roots change."""
+        snapshot = self._roots_snapshot
+        if snapshot is not None and snapshot[0] == self._roots_version:
+            return snapshot[1]
         with self.lock:
-            return self.roots.copy()
+            roots = frozenset(self.roots or ())
+            self._roots_snapshot = (self._roots_version, roots)
+            return roots
 
     def remove_root(self, node: Node) -> None:
         """Remove seed url."""
         with self.lock:
-            return self.roots.remove(node)
+            self._untrack_root(node)
+            self._record("unroot", id=node.id)
 
     def add_root(self, node: Node) -> None:
         """Add seed url."""
         with self.lock:
-            self.roots.add(node)
+            self._track_root(node)
+            self._record("root", id=node.id)
 
     def set_root(self, nodes: set[Node] | None) -> None:
         """Set seed url."""
         with self.lock:
             self.roots = nodes
+            self._rebuild_root_index()
+
+    def _track_root(self, node: Node) -> None:
+        """Add node to roots and the root indexes."""
+        self._roots_version += 1
+        self.roots.add(node)
+        self._root_netloc_index.setdefault(netloc_key(node.url), {})[node] = None
+        session = canonical_url_key(node.url)[1]
+        if session is not None:
+            self._root_session_index.setdefault(session, {})[node] = None
+
+    def _untrack_root(self, node: Node) -> None:
+        """Remove node from roots and the root indexes. Raises KeyError if not a root."""
+        self.roots.remove(node)
+        self._roots_version += 1
+        for index, key in (
+            (self._root_netloc_index, netloc_key(node.url)),
+            (self._root_session_index, canonical_url_key(node.url)[1]),
+        ):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(node, None)
+                if not bucket:
+                    del index[key]
+
+    def _rebuild_root_index(self) -> None:
+        """Rebuild the root indexes from the roots set."""
+        with self.lock:
+            self._roots_version += 1
+            roots = self.roots or set()
+            self.roots = set()
+            self._root_netloc_index = {}
+            self._root_session_index = {}
+            for node in roots:
+                self._track_root(node)
+
+    def has_active_root(self, domain: str) -> bool:
+        """Return True if a root is active for the domain (a url or a bare netloc)."""
+        with self.lock:
+            return bool(self._root_netloc_index.get(netloc_key(domain)))
+
+    def get_root_for_domain(self, domain: str) -> Node | None:
+        """Return the first active root for the domain (a url or a bare netloc)."""
+        with self.lock:
+            return next(iter(self._root_netloc_index.get(netloc_key(domain), {})), None)
+
+    def get_active_root_netlocs(self) -> set[str]:
+        """Return the normalized netlocs which have an active root."""
+        with self.lock:
+            return set(self._root_netloc_index)
+
+    def get_roots_for_session(self, session_code: str) -> list[Node]:
+        """Return the active roots for a session code, e.g. '2025/2025R'."""
+        with self.lock:
+            return list(self._root_session_index.get(session_code, {}))
 
     def load_node_list(self, nodes: list[Node]) -> None:
         """Input a list of nodes into the graph."""
         with self.lock:
             for node in nodes:
                 self.nodes[node.url] = node
+                self._index_node(node)
 
     def reset(self) -> None:
         """Reset graph."""
         with self.lock:
             self.nodes = OrderedDict()
             self.roots = set()
+            self._set_tombstones({})
+            self._rebuild_indexes()
+            self._rebuild_root_index()
 
     def add_new_node(
         self,
@@ -294,19 +764,21 @@ class DirectionalGraph:
             if unquote(unescape(node.url)) in self.nodes:
                 return None
             self.nodes.update({unquote(unescape(node.url)): node})
-            if isRoot:
-                if self.roots:
-                    self.roots.add(node)
-                else:
-                    self.roots = {node}
-            if len(node.incoming) == 0 and node not in self.roots:
-                self.roots.add(node)
+            self._index_node(node)
+            self._record("node", **node.to_dict())
+            if (isRoot or len(node.incoming) == 0) and node not in self.roots:
+                self.add_root(node)
             return node
 
     def find_node_by_url(self, url: str) -> Node | None:
         """Find node by url."""
         return self.nodes.get(unquote(url), None)
 
+    def has_url(self, url: str) -> bool:
+        """Return True if url is in the graph or was pruned from it."""
+        key = unquote(unescape(url))
+        return key in self.nodes or key in self._tombstones
+
     def delete_node(self, node: Node) -> None:
         """Remove node from graph."""
         with self.lock:
@@ -315,8 +787,10 @@ class DirectionalGraph:
             delnode = self.nodes.pop(unquote(unescape(node.url)))
             if delnode is None:
                 return
+            self._unindex_node(delnode)
+            self._record("delete", id=delnode.id)
             if delnode in self.roots:
-                self.roots.remove(delnode)
+                self._untrack_root(delnode)
             for outnode in list(delnode.outgoing):
                 outnode.remove_incoming(delnode)
             for innode in list(delnode.incoming):
@@ -333,35 +807,19 @@ class DirectionalGraph:
 
     def _propagate_completion(self, node: Node) -> bool:
         """
-        Recursively checks child states and updates the current node's state
-        if all necessary children have COMPLETED their work.
+        Check whether the node and its whole subtree have COMPLETED.
+
+        Completion is tracked incrementally by each node's pending child count and bubbles
+        up as children complete, so this no longer walks the subtree.
 
         Returns:
             True: If the node's state is now COMPLETED.
             False: If the node is still busy, either locally or because a descendant is busy.
 
-        """  # noqa: D205
-        if node.state not in (PipelineStateEnum.AWAITING_CHILDREN, PipelineStateEnum.COMPLETED):
-            return False
-
-        if node.state == PipelineStateEnum.COMPLETED:
-            return True
-
-        is_subtree_clean = True
+        """
         with self.lock:
-            for child in node.outgoing:
-                child_is_completed = self._propagate_completion(child)
-
-                if not child_is_completed:
-                    is_subtree_clean = False
-                    break
-            if is_subtree_clean:
-                # All children and their descendants are COMPLETED.
-                node.set_state(PipelineStateEnum.COMPLETED)
-
-                return True
-
-            return False
+            node._complete_if_done()  # noqa: SLF001
+            return node.state == PipelineStateEnum.COMPLETED
 
     def safe_remove_root(self, root_url: str, known_roots_cache_file: Path | None) -> bool:
         """
@@ -370,15 +828,9 @@ class DirectionalGraph:
         If the entire subtree is complete and removed, the root key is removed from
         the Orchestrator's internal roots tracking.
         """
-        parsed_netloc = parse_url(root_url).netloc
-        domain_key = unquote(parsed_netloc)
-        root_node = None
+        domain_key = netloc_key(root_url)
         with self.lock:
-            for node in self.roots:
-                if unquote(urlparse(node.url).netloc).strip() == domain_key.strip():
-                    root_node = node
-                    break
-
+            root_node = self.get_root_for_domain(domain_key)
             if root_node is None:
                 return False
 
@@ -393,13 +845,92 @@ class DirectionalGraph:
                 return True
             return False
 
+    def prune_completed_subtrees(self, nodes: list[Node]) -> int:
+        """
+        Replace completed subtrees with tombstones, keeping the graph to the in-flight frontier.
+
+        A node is pruned together with everything below it once the whole subtree is COMPLETED
+        and holds no root. Roots are left to safe_remove_root. Each pruned url keeps its node id,
+        type and indexed data keys, so url lookups through has_url and find_in_graph still resolve.
+
+        Returns:
+            The number of nodes removed.
+
+        """
+        removed = 0
+        with self.lock:
+            # Bubbled ancestors come last, pruning them first covers their subtree in one walk
+            for node in reversed(nodes):
+                if self.nodes.get(unquote(unescape(node.url))) is not node:
+                    continue
+                subtree = [n for n, _ in walk(node, outgoing_edges, postorder=True)]
+                if any(
+                    n.state != PipelineStateEnum.COMPLETED or n in self.roots for n in subtree
+                ):
+                    continue
+                for subtree_node in subtree:
+                    self._add_tombstone(subtree_node)
+                    self.delete_node(subtree_node)
+                removed += len(subtree)
+        return removed
+
+    def _add_tombstone(self, node: Node) -> None:
+        """Remember a pruned node's url, id, type and indexed data keys."""
+        ids = None
+        if any(node.has_data_key(key) for key in INDEXED_DATA_KEYS):
+            data = node.peek_data()
+            ids = {key: data[key] for key in INDEXED_DATA_KEYS if key in data}
+        url = unquote(unescape(node.url))
+        self._set_tombstone(url, node.id, node.type, ids)
+        self._record("tombstone", url=url, id=node.id, type=node.type.value, ids=ids)
+
+    def _set_tombstone(self, url: str, node_id: int, node_type: Any, ids: dict | None) -> None:
+        """Store a tombstone. node_type may be the enum or its stored value."""
+        with suppress(ValueError):
+            node_type = PipelineRegistryKeys(node_type)
+        self._tombstones[url] = (node_id, node_type, ids)
+        self._tombstone_url_index.setdefault(canonical_url_key(url)[0], {})[url] = None
+
+    def _set_tombstones(self, tombstones: dict[str, list]) -> None:
+        """Replace all tombstones with serialized [id, type, ids] entries keyed by url."""
+        with self.lock:
+            self._tombstones = {}
+            self._tombstone_url_index = {}
+            for url, (node_id, node_type, ids) in tombstones.items():
+                self._set_tombstone(url, node_id, node_type, ids)
+
+    def _serialize_tombstones(self) -> dict[str, list]:
+        """Return tombstones as [id, type value, ids] entries keyed by url."""
+        return {
+            url: [node_id, getattr(node_type, "value", node_type), ids]
+            for url, (node_id, node_type, ids) in self._tombstones.items()
+        }
+
+    def _tombstone_nodes(self, url: str) -> list[Node]:
+        """Return detached COMPLETED nodes for the tombstones matching url."""
+        url_key, session = canonical_url_key(url)
+        with self.lock:
+            matches = [
+                (tomb_url, self._tombstones[tomb_url])
+                for tomb_url in self._tombstone_url_index.get(url_key, {})
+                if session is None or canonical_url_key(tomb_url)[1] == session
+            ]
+        return [
+            Node(
+                node_type,
+                tomb_url,
+                data=dict(ids) if ids else None,
+                state=PipelineStateEnum.COMPLETED,
+                override_id=node_id,
+            )
+            for tomb_url, (node_id, node_type, ids) in matches
+        ]
+
     def propogate_downward_deletion(self, node: Node) -> None:
-        """Recursively delete all outgoing nodes."""
-        if node.outgoing:
-            with self.lock:
-                for outnode in node.outgoing.copy():
-                    self.propogate_downward_deletion(outnode)
-        self.delete_node(node)
+        """Delete node and everything reachable through its outgoing nodes, leaves first."""
+        with self.lock:
+            for subtree_node, _ in walk(node, outgoing_edges, postorder=True):
+                self.delete_node(subtree_node)
 
     def find_in_graph(
         self,
@@ -408,12 +939,24 @@ class DirectionalGraph:
         *,
         find_single: bool = True,
     ) -> Node | None | list[Node]:
-        """Find node by node attrs or node data attrs."""
+        """
+        Find node by node attrs or node data attrs.
+
+        Narrows the search with the state, type and data key indexes when the query allows.
+        A url query with no live match falls back to the tombstones of pruned nodes,
+        returned as detached COMPLETED nodes.
+        """
         result = [
             node
-            for node in self.get_nodes().values()
+            for node in self._get_candidates(data_attrs, node_attrs)
             if node.isMatch(data_attrs=data_attrs, node_attrs=node_attrs)
         ]
+        if not result and node_attrs and isinstance(node_attrs.get("url"), str):
+            result = [
+                node
+                for node in self._tombstone_nodes(node_attrs["url"])
+                if node.isMatch(data_attrs=data_attrs, node_attrs=node_attrs)
+            ]
         if result:
             return result[0] if find_single else result
         return None
@@ -423,18 +966,34 @@ class DirectionalGraph:
         node: Node,
         data_attrs: dict | None = None,
         node_attrs: dict | None = None,
+        *,
+        max_depth: int | None = None,
     ) -> Node | None:
-        """Search recursively through incoming nodes."""
-        return self._directional_search(node, data_attrs, node_attrs, searchUp=True)
+        """Search through incoming nodes, up to max_depth hops away."""
+        return self._directional_search(
+            node,
+            data_attrs,
+            node_attrs,
+            searchUp=True,
+            max_depth=max_depth,
+        )
 
     def search_descendants(
         self,
         node: Node,
         data_attrs: dict | None = None,
         node_attrs: dict | None = None,
+        *,
+        max_depth: int | None = None,
     ) -> Node | None:
-        """Search recursively through outgoing nodes."""
-        return self._directional_search(node, data_attrs, node_attrs, searchUp=False)
+        """Search through outgoing nodes, up to max_depth hops away."""
+        return self._directional_search(
+            node,
+            data_attrs,
+            node_attrs,
+            searchUp=False,
+            max_depth=max_depth,
+        )
 
     def _directional_search(
         self,
@@ -443,32 +1002,51 @@ class DirectionalGraph:
         node_attrs: dict | None = None,
         *,
         searchUp: bool = True,
-        searched_nodes: set[Node] | None = None,
+        max_depth: int | None = None,
     ) -> Node | None:
-
-        searched_nodes = searched_nodes or set()
-        if node in searched_nodes:
-            return None
-
-        if node.isMatch(data_attrs=data_attrs, node_attrs=node_attrs):
-            return node
-
-        searched_nodes.add(node)
-        next_search = node.incoming if searchUp else node.outgoing
-        for next_node in next_search:
-            result = self._directional_search(
-                next_node,
-                data_attrs,
-                node_attrs,
-                searched_nodes=searched_nodes,
-                searchUp=searchUp,
-            )
-            if result:
-                return result
+        """Return the first node matching the attrs, depth first, starting with node itself."""
+        neighbours = incoming_edges if searchUp else outgoing_edges
+        for found, _ in walk(node, neighbours, max_depth=max_depth):
+            if found.isMatch(data_attrs=data_attrs, node_attrs=node_attrs):
+                return found
         return None
 
     def to_JSON(self) -> str:
         """Serialize DirectionalGraph to a JSON string."""
+        return self._encode_snapshot(self._snapshot_records(), binary=False)
+
+    def _snapshot_records(self) -> dict[str, Any]:
+        """
+        Copy what a snapshot needs, holding the lock only for the copy.
+
+        Node data is taken by reference, lazy data as its loader, and is encoded later
+        outside the lock.
+        """
+        with self.lock:
+            return {
+                "name": self.name,
+                # store nodes as list of dicts
+                "nodes": [
+                    {
+                        "id": node.id,
+                        "outgoing_ids": [out.id for out in node.outgoing],
+                        "incoming_ids": [inc.id for inc in node.incoming],
+                        "type": node.type.value,  # Store Enum as int
+                        "url": node.url,
+                        "data": node.data_ref(),
+                        "state": node.state.value,  # Store Enum as int
+                        "container": [type(node.container).__name__],
+                    }
+                    for node in self.nodes.values()
+                ],
+                # store roots as list of node ids (simpler to restore)
+                "roots": [node.id for node in self.roots],
+                "tombstones": self._serialize_tombstones(),
+            }
+
+    @staticmethod
+    def _encode_snapshot(records: dict[str, Any], *, binary: bool) -> str | bytes:
+        """Encode records from _snapshot_records as JSON or with the binary codec."""
 
         def _json_default(obj: Any) -> Any:
             """Convert DirectionalGraph to JSON string."""
@@ -476,20 +1054,24 @@ class DirectionalGraph:
                 return obj.isoformat()
             return str(obj)
 
-        data = {
-            "name": self.name,
-            # store nodes as list of dicts
-            "nodes": [node.to_dict() for node in self.nodes.values()],
-            # store roots as list of node ids (simpler to restore)
-            "roots": [node.id for node in self.roots],
-        }
-        return json.dumps(data, indent=4, default=_json_default)
+        for record in records["nodes"]:
+            if callable(record["data"]):
+                record["data"] = record["data"]()
+        if not binary:
+            return json.dumps(records, indent=4, default=_json_default)
+        return encode_snapshot(
+            records["name"],
+            records["nodes"],
+            records["roots"],
+            INDEXED_DATA_KEYS,
+            tombstones=records["tombstones"],
+        )
 
     def from_JSON(self, json_str: str) -> None:  # noqa: C901
         """Load graph from JSON string (replaces current graph)."""
         data = json.loads(json_str)
         # clear current state
-        self.nodes.clear()
+        self.set_nodes(OrderedDict())
         self.roots = set()
         self.name = data.get("name", "Directional Graph")
 
@@ -547,11 +1129,61 @@ class DirectionalGraph:
         for rid in root_ids:
             if rid in node_map:
                 self.roots.add(node_map[rid])
+        self._rebuild_root_index()
+        self._set_tombstones(data.get("tombstones", {}))
+
+        for node in self.nodes.values():
+            node.add_container(self)
+        self._rebuild_indexes()
 
         # Restore Node.id_counter to avoid ID collisions
         if self.nodes:
             Node.id_counter = max(node.id for node in self.nodes.values()) + 1
 
+    def from_binary(self, filepath: Path) -> None:
+        """
+        Load graph from a binary snapshot (replaces current graph).
+
+        Topology is loaded eagerly, node data is read from the mapped file on first access.
+        """
+        reader = SnapshotReader(filepath, INDEXED_DATA_KEYS)
+        with self.lock:
+            self.set_nodes(OrderedDict())
+            self.roots = set()
+            self.name = reader.name
+            node_map: dict[int, Node] = {}
+            links: list[tuple[Node, list[int]]] = []
+            for record in reader.iter_nodes():
+                node = Node(
+                    PipelineRegistryKeys(record.type),
+                    record.url,
+                    state=record.state,
+                    override_id=record.id,
+                )
+                node.set_lazy_data(record.load_data, record.data_keys)
+                self.nodes[unquote(unescape(node.url))] = node
+                node_map[node.id] = node
+                links.append((node, record.outgoing_ids))
+
+            for node, out_ids in links:
+                for out_id in out_ids:
+                    if out_id in node_map:
+                        node.add_outgoing(node_map[out_id])
+                        node_map[out_id].add_incoming(node)
+
+            for rid in reader.root_ids:
+                if rid in node_map:
+                    self.roots.add(node_map[rid])
+            self._rebuild_root_index()
+            self._set_tombstones(reader.tombstones)
+
+            for node in self.nodes.values():
+                node.add_container(self)
+            self._rebuild_indexes()
+
+            if self.nodes:
+                Node.id_counter = max(node_map) + 1
+
     def save_completed_root_url(self, nodeurl: str, filepath: Path) -> None:
         """Append deleted root url to a file."""
         filepath.parent.mkdir(parents=True, exist_ok=True)
@@ -564,32 +1196,163 @@ class DirectionalGraph:
             logger.error(f"Error saving file: {e}")
 
     def save_file(self, filepath: Path) -> None:
-        """Save tree to a file."""
+        """
+        Save tree to a file.
+
+        With a journal enabled, only the changes since the last save are appended,
+        and the snapshot is rewritten once the journal reaches compact_every records.
+        """
+        if self._journal is None:
+            self._write_snapshot(filepath)
+            return
+        with self._flush_lock:
+            with self.lock:
+                records, self._pending_records = self._pending_records, []
+            self._journal.append(records)
+            if self._journal.record_count >= self.compact_every:
+                self._compact(filepath)
+
+    def _compact(self, filepath: Path) -> None:
+        """Rewrite the snapshot and truncate the journal. Caller holds _flush_lock."""
         with self.lock:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                with filepath.open("w", encoding="utf-8") as f:
-                    f.write(self.to_JSON())
-                logger.info(f"Tree saved to {filepath}")
-            except OSError as e:
-                logger.error(f"Error saving file: {e}")
+            self._pending_records = []
+            records = self._snapshot_records()
+        payload = self._encode_snapshot(records, binary=self.binary_snapshot)
+        if self._write_snapshot(filepath, payload):
+            self._journal.truncate()
+
+    def _serialize_snapshot(self) -> str | bytes:
+        """Serialize the graph with the configured snapshot codec, encoding outside the lock."""
+        return self._encode_snapshot(self._snapshot_records(), binary=self.binary_snapshot)
+
+    def _write_snapshot(self, filepath: Path, payload: str | bytes | None = None) -> bool:
+        """Write a full snapshot atomically. Returns True on success."""
+        if payload is None:
+            payload = self._serialize_snapshot()
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        try:
+            if isinstance(payload, bytes):
+                tmp_path.write_bytes(payload)
+            else:
+                tmp_path.write_text(payload, encoding="utf-8")
+            tmp_path.replace(filepath)
+            logger.info(f"Tree saved to {filepath}")
+        except OSError as e:
+            logger.error(f"Error saving file: {e}")
+            return False
+        return True
+
+    def _replay_journal(self, journal_path: Path) -> int:
+        """Apply journal records on top of the loaded snapshot. Returns records applied."""
+        records = GraphJournal.read(journal_path)
+        if not records:
+            return 0
+        journal, self._journal = self._journal, None  # do not re-record replayed changes
+        try:
+            node_map = {node.id: node for node in self.nodes.values()}
+            for record in records:
+                self._apply_record(record, node_map)
+        finally:
+            self._journal = journal
+        if self.nodes:
+            Node.id_counter = max(Node.id_counter, max(node_map, default=0) + 1)
+        return len(records)
+
+    def _apply_record(self, record: dict, node_map: dict[int, Node]) -> None:
+        """Apply a single journal record."""
+        op = record.get("op")
+        if op in self._RECORD_HANDLERS:
+            self._RECORD_HANDLERS[op](self, record, node_map)
+            return
+        node = node_map.get(record.get("id"))
+        if node is not None and op in self._NODE_RECORD_HANDLERS:
+            self._NODE_RECORD_HANDLERS[op](self, node, record, node_map)
+
+    def _replay_tombstone(self, record: dict, _node_map: dict[int, Node]) -> None:
+        """Replay a tombstone record."""
+        self._set_tombstone(record["url"], record["id"], record["type"], record.get("ids"))
+
+    def _replay_node(self, record: dict, node_map: dict[int, Node]) -> None:
+        """Replay a node record, linking it to the nodes already replayed."""
+        node = Node(
+            PipelineRegistryKeys(record["type"]),
+            record["url"],
+            data=record.get("data") or {},
+            state=record.get("state", PipelineStateEnum.CREATED),
+            override_id=record["id"],
+        )
+        for in_id in record.get("incoming_ids", []):
+            if in_id in node_map:
+                node.add_incoming(node_map[in_id])
+                node_map[in_id].add_outgoing(node)
+        for out_id in record.get("outgoing_ids", []):
+            if out_id in node_map:
+                node.add_outgoing(node_map[out_id])
+                node_map[out_id].add_incoming(node)
+        if self.add_existing_node(node) is not None:
+            node_map[node.id] = node
+
+    def _replay_state(self, node: Node, record: dict, _node_map: dict[int, Node]) -> None:
+        """Replay a state change."""
+        node.state = record["state"]
+
+    def _replay_data(self, node: Node, record: dict, _node_map: dict[int, Node]) -> None:
+        """Replay a data replacement."""
+        node.data = record["data"]
+
+    def _replay_delete(self, node: Node, _record: dict, node_map: dict[int, Node]) -> None:
+        """Replay a node deletion."""
+        self.delete_node(node)
+        node_map.pop(node.id, None)
+
+    def _replay_root(self, node: Node, _record: dict, _node_map: dict[int, Node]) -> None:
+        """Replay a node becoming a root."""
+        if node not in self.roots:
+            self._track_root(node)
+
+    def _replay_unroot(self, node: Node, _record: dict, _node_map: dict[int, Node]) -> None:
+        """Replay a root being removed."""
+        if node in self.roots:
+            self._untrack_root(node)
+
+    # Journal op -> replay handler, for records about the graph and records about one node
+    _RECORD_HANDLERS: ClassVar[dict[str, Callable[..., None]]] = {
+        "tombstone": _replay_tombstone,
+        "node": _replay_node,
+    }
+    _NODE_RECORD_HANDLERS: ClassVar[dict[str, Callable[..., None]]] = {
+        "state": _replay_state,
+        "data": _replay_data,
+        "delete": _replay_delete,
+        "root": _replay_root,
+        "unroot": _replay_unroot,
+    }
 
     def load_from_file(self, filepath: Path) -> None | int:
         """Load tree from a file. Returns 1 on success, None on failure."""
         with self.lock:
-            if not filepath.exists():
+            journal_path = GraphJournal.path_for(filepath)
+            if not filepath.exists() and not journal_path.exists():
                 msg = f"{filepath} does not exist."
                 logger.warning(msg)
                 return None
 
-            try:
-                with filepath.open("r", encoding="utf-8") as f:
-                    json_str = f.read()
-            except OSError as e:
-                logger.error(f"Error reading file {filepath}: {e}")
-                return None
-
-            self.from_JSON(json_str)
+            if filepath.exists() and is_binary_snapshot(filepath):
+                self.from_binary(filepath)
+            elif filepath.exists():
+                try:
+                    with filepath.open("r", encoding="utf-8") as f:
+                        json_str = f.read()
+                except OSError as e:
+                    logger.error(f"Error reading file {filepath}: {e}")
+                    return None
+                self.from_JSON(json_str)
+            else:
+                self.reset()
+            replayed = self._replay_journal(journal_path)
+            if replayed:
+                logger.info(f"Replayed {replayed} journal records from {journal_path}")
             if self.nodes:
                 logger.info(
                     f"Tree loaded from {filepath} with {len(self.nodes)} nodes,"
@@ -0,0 +1,211 @@
+"""Crawl frontier for the FETCH stage, a Queue with pluggable ordering and disk spill."""
+
+import heapq
+import itertools
+import json
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from pathlib import Path
+from queue import Queue
+from typing import Any
+
+from src.utils.logger import logger
+from src.utils.strings.canonical_url import canonical_url_key
+
+# Fetch order of page types for the priority strategy, by PipelineRegistryKeys name.
+# Legislators and committees come before the bills and votes which reference their ids.
+TYPE_PRIORITY = {
+    "ARK_LEG_SEEDER": 0,
+    "LEGISLATOR_LIST": 1,
+    "COMMITTEES_CAT": 1,
+    "COMMITTEES_LIST": 1,
+    "LEGISLATOR": 2,
+    "COMMITTEE": 2,
+    "BILLS_SECTION": 3,
+    "BILL_CATEGORIES": 3,
+    "BILL_LIST": 4,
+    "BILL": 5,
+    "BILL_VOTE": 6,
+}
+
+# Returned by Frontier._get when every spilled url it read back had left the graph.
+_VANISHED = object()
+
+
+class _LifoOrder:
+    """Depth first, the order of the previous LifoQueue."""
+
+    def __init__(self) -> None:
+        self.items: deque = deque()
+
+    def put(self, item: Any) -> None:
+        self.items.append(item)
+
+    def get(self) -> Any:
+        return self.items.pop()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class _FifoOrder(_LifoOrder):
+    """Breadth first."""
+
+    def get(self) -> Any:
+        return self.items.popleft()
+
+
+class _PriorityOrder:
+    """Lowest TYPE_PRIORITY rank first, depth first within a rank."""
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[int, int, Any]] = []
+        self.seq = itertools.count()
+
+    def put(self, item: Any) -> None:
+        node_type = getattr(item, "type", None)
+        rank = TYPE_PRIORITY.get(getattr(node_type, "name", None), len(TYPE_PRIORITY))
+        heapq.heappush(self.heap, (rank, -next(self.seq), item))
+
+    def get(self) -> Any:
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class _RoundRobinOrder:
+    """One item per legislative session in turn, depth first within a session."""
+
+    def __init__(self) -> None:
+        self.sessions: OrderedDict[str | None, deque] = OrderedDict()
+        self.count = 0
+
+    def put(self, item: Any) -> None:
+        session = canonical_url_key(getattr(item, "url", "") or "")[1]
+        self.sessions.setdefault(session, deque()).append(item)
+        self.count += 1
+
+    def get(self) -> Any:
+        session, items = next(iter(self.sessions.items()))
+        item = items.pop()
+        self.count -= 1
+        del self.sessions[session]
+        if items:
+            self.sessions[session] = items  # back of the rotation
+        return item
+
+    def __len__(self) -> int:
+        return self.count
+
+
+FRONTIER_STRATEGIES = {
+    "lifo": _LifoOrder,
+    "fifo": _FifoOrder,
+    "priority": _PriorityOrder,
+    "round_robin": _RoundRobinOrder,
+}
+
+
+class Frontier(Queue):
+    """
+    Queue of nodes awaiting fetch, ordered by a strategy from FRONTIER_STRATEGIES.
+
+    The None shutdown sentinel is always returned first, as it was from the LifoQueue.
+    With max_in_memory and resolve, nodes beyond max_in_memory are spilled to spill_dir as
+    urls and resolved back to nodes once there is room. Spilled nodes come after the
+    in-memory ones, so ordering is approximate while spilling. Spilled urls which left the
+    graph meanwhile are skipped and marked done.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *,
+        strategy: str = "lifo",
+        max_in_memory: int | None = None,
+        spill_dir: Path | None = None,
+        resolve: Callable[[str], Any] | None = None,
+    ) -> None:
+        """Initialize Frontier."""
+        if strategy not in FRONTIER_STRATEGIES:
+            msg = f"Unknown frontier strategy {strategy}, expected {list(FRONTIER_STRATEGIES)}"
+            raise ValueError(msg)
+        self.strategy = strategy
+        self.max_in_memory = None
+        self.spill_path = None
+        if max_in_memory and spill_dir and resolve:
+            self.max_in_memory = max(1, max_in_memory)
+            self.spill_path = spill_dir / "frontier_spill.jsonl"
+            self.spill_path.unlink(missing_ok=True)  # nodes are requeued from the state cache
+        self.resolve = resolve
+        super().__init__(maxsize)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:  # noqa: FBT001, FBT002
+        """Remove and return the next item, see Queue.get."""
+        while True:
+            item = super().get(block, timeout)
+            with self.mutex:
+                vanished, self.vanished = self.vanished, 0
+            for _ in range(vanished):
+                self.task_done()
+            if item is not _VANISHED:
+                return item
+
+    # Queue hooks, called with self.mutex held
+    def _init(self, maxsize: int) -> None:
+        self.order = FRONTIER_STRATEGIES[self.strategy]()
+        self.sentinels = 0
+        self.spilled = 0
+        self.spill_offset = 0
+        self.vanished = 0
+
+    def _qsize(self) -> int:
+        return self.sentinels + len(self.order) + self.spilled
+
+    def _put(self, item: Any) -> None:
+        if item is None:
+            self.sentinels += 1
+        elif self.max_in_memory is not None and len(self.order) >= self.max_in_memory:
+            self._spill(item)
+        else:
+            self.order.put(item)
+
+    def _get(self) -> Any:
+        if self.sentinels:
+            self.sentinels -= 1
+            return None
+        if self.spilled and len(self.order) <= self.max_in_memory // 2:
+            self._unspill(self.max_in_memory - len(self.order))
+        while self.spilled and not self.order:
+            self._unspill(self.max_in_memory)
+        if not self.order:
+            return _VANISHED
+        return self.order.get()
+
+    def _spill(self, item: Any) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.spill_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(item.url) + "\n")
+        self.spilled += 1
+
+    def _unspill(self, count: int) -> None:
+        """Move up to count spilled urls back into memory, oldest first."""
+        with self.spill_path.open("r", encoding="utf-8") as f:
+            f.seek(self.spill_offset)
+            while count > 0 and self.spilled:
+                line = f.readline()
+                if not line:
+                    break
+                self.spilled -= 1
+                node = self.resolve(json.loads(line))
+                if node is None:
+                    logger.warning(f"[FRONTIER]: Spilled url no longer in graph: {line.strip()}")
+                    self.vanished += 1
+                    continue
+                self.order.put(node)
+                count -= 1
+            self.spill_offset = f.tell()
+        if not self.spilled:
+            self.spill_path.unlink(missing_ok=True)
+            self.spill_offset = 0
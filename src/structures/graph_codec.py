@@ -0,0 +1,180 @@
+"""Binary snapshot codec for DirectionalGraph, with lazily loaded node data."""
+
+import json
+import mmap
+import struct
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"DGB1"
+
+# magic, header length
+_PREAMBLE = struct.Struct("<4sI")
+# id, state, type index, indexed data key mask, url length, outgoing count
+_NODE_HEAD = struct.Struct("<IbHBII")
+# data offset (relative to data section), data length
+_NODE_DATA = struct.Struct("<QI")
+_ID = struct.Struct("<I")
+
+
+@dataclass
+class NodeRecord:
+    """Topology of a single node, as read from a binary snapshot."""
+
+    id: int
+    state: int
+    type: Any
+    url: str
+    outgoing_ids: list[int]
+    data_keys: tuple[str, ...]
+    load_data: Callable[[], Any]
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert non-JSON-native values, matching DirectionalGraph.to_JSON."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def is_binary_snapshot(filepath: Path) -> bool:
+    """Return True if filepath starts with the binary snapshot magic."""
+    try:
+        with filepath.open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def encode_snapshot(
+    name: str,
+    nodes: list[dict],
+    root_ids: list[int],
+    indexed_keys: tuple[str, ...],
+    *,
+    tombstones: dict[str, list] | None = None,
+) -> bytes:
+    """
+    Encode graph nodes into the binary snapshot layout.
+
+    Layout: preamble, JSON header (name, type table, roots, tombstones, topology size),
+    fixed width topology records, then the JSON encoded data of every node.
+    Each node dict needs id, state, type, url, outgoing_ids and data.
+    """
+    types: list[Any] = []
+    type_idx: dict[Any, int] = {}
+    topology = bytearray()
+    data_section = bytearray()
+
+    for node in nodes:
+        node_type = node["type"]
+        if node_type not in type_idx:
+            type_idx[node_type] = len(types)
+            types.append(node_type)
+        data = node["data"]
+        key_mask = 0
+        if isinstance(data, dict):
+            for bit, key in enumerate(indexed_keys):
+                if key in data:
+                    key_mask |= 1 << bit
+        url = node["url"].encode("utf-8")
+        out_ids = node["outgoing_ids"]
+        data_bytes = json.dumps(data, default=_json_default).encode("utf-8")
+
+        topology += _NODE_HEAD.pack(
+            node["id"],
+            node["state"],
+            type_idx[node_type],
+            key_mask,
+            len(url),
+            len(out_ids),
+        )
+        topology += url
+        topology += struct.pack(f"<{len(out_ids)}I", *out_ids)
+        topology += _NODE_DATA.pack(len(data_section), len(data_bytes))
+        data_section += data_bytes
+
+    header = json.dumps(
+        {
+            "name": name,
+            "types": types,
+            "roots": root_ids,
+            "tombstones": tombstones or {},
+            "node_count": len(nodes),
+            "topology_size": len(topology),
+        },
+    ).encode("utf-8")
+    return _PREAMBLE.pack(MAGIC, len(header)) + header + bytes(topology) + bytes(data_section)
+
+
+class SnapshotReader:
+    """
+    Memory map a binary snapshot, read topology eagerly and data on demand.
+
+    The reader must stay alive as long as any node may still load its data,
+    each NodeRecord.load_data holds a reference to it.
+    """
+
+    def __init__(self, filepath: Path, indexed_keys: tuple[str, ...]) -> None:
+        """Open and map the snapshot file."""
+        self.indexed_keys = indexed_keys
+        with filepath.open("rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_len = _PREAMBLE.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            msg = f"{filepath} is not a binary graph snapshot"
+            raise ValueError(msg)
+        header_start = _PREAMBLE.size
+        self.header = json.loads(self._buf[header_start : header_start + header_len])
+        self._topology_start = header_start + header_len
+        self._data_start = self._topology_start + self.header["topology_size"]
+
+    @property
+    def name(self) -> str:
+        """Return the stored graph name."""
+        return self.header["name"]
+
+    @property
+    def root_ids(self) -> list[int]:
+        """Return the stored root ids."""
+        return self.header["roots"]
+
+    @property
+    def tombstones(self) -> dict[str, list]:
+        """Return the stored tombstones of pruned nodes, keyed by url."""
+        return self.header.get("tombstones", {})
+
+    def read_data(self, offset: int, length: int) -> Any:
+        """Decode the data blob of one node."""
+        start = self._data_start + offset
+        return json.loads(self._buf[start : start + length])
+
+    def iter_nodes(self) -> Iterator[NodeRecord]:
+        """Yield the topology of every node without decoding its data."""
+        types = self.header["types"]
+        pos = self._topology_start
+        for _ in range(self.header["node_count"]):
+            node_id, state, type_i, key_mask, url_len, out_count = _NODE_HEAD.unpack_from(
+                self._buf,
+                pos,
+            )
+            pos += _NODE_HEAD.size
+            url = self._buf[pos : pos + url_len].decode("utf-8")
+            pos += url_len
+            out_ids = list(struct.unpack_from(f"<{out_count}I", self._buf, pos))
+            pos += _ID.size * out_count
+            offset, length = _NODE_DATA.unpack_from(self._buf, pos)
+            pos += _NODE_DATA.size
+            yield NodeRecord(
+                id=node_id,
+                state=state,
+                type=types[type_i],
+                url=url,
+                outgoing_ids=out_ids,
+                data_keys=tuple(
+                    key for bit, key in enumerate(self.indexed_keys) if key_mask & (1 << bit)
+                ),
+                load_data=lambda o=offset, n=length: self.read_data(o, n),
+            )
@@ -0,0 +1,82 @@
+"""Append-only journal of DirectionalGraph mutations."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.utils.logger import logger
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert non-JSON-native values, matching DirectionalGraph.to_JSON."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+class GraphJournal:
+    """
+    Write-ahead journal stored as JSON lines next to the graph snapshot.
+
+    Each record is a dict with an "op" key:
+        node   - node creation, serialized with Node.to_dict
+        state  - {"id", "state"}
+        data   - {"id", "data"}
+        delete - {"id"}
+        root   - {"id"}
+        unroot - {"id"}
+        tombstone - {"url", "id", "type", "ids"}
+    """
+
+    def __init__(self, snapshot_path: Path) -> None:
+        """Initialize the journal for a snapshot file."""
+        self.path = self.path_for(snapshot_path)
+        self.lock = threading.Lock()
+        self.record_count = self._count_records()
+
+    @staticmethod
+    def path_for(snapshot_path: Path) -> Path:
+        """Return the journal path belonging to a snapshot file, e.g. state_cache.json.journal."""
+        return snapshot_path.with_name(snapshot_path.name + ".journal")
+
+    def _count_records(self) -> int:
+        """Count records already on disk."""
+        if not self.path.exists():
+            return 0
+        with self.path.open("r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def append(self, records: list[dict]) -> None:
+        """Append records to the journal file."""
+        if not records:
+            return
+        lines = "".join(json.dumps(r, default=_json_default) + "\n" for r in records)
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(lines)
+                self.record_count += len(records)
+            except OSError as e:
+                logger.error(f"Error appending to journal {self.path}: {e}")
+
+    def truncate(self) -> None:
+        """Remove all records, after they have been compacted into a snapshot."""
+        with self.lock:
+            self.path.unlink(missing_ok=True)
+            self.record_count = 0
+
+    @staticmethod
+    def read(journal_path: Path) -> list[dict]:
+        """Read all records from a journal file, skipping a torn final line."""
+        if not journal_path.exists():
+            return []
+        records = []
+        with journal_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal record in {journal_path}")
+        return records
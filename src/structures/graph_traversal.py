@@ -0,0 +1,54 @@
+"""Iterative, explicit-stack traversal shared by DirectionalGraph search and deletion."""
+
+from collections.abc import Callable, Iterable, Iterator
+from operator import attrgetter
+from typing import Any
+
+incoming_edges: Callable[[Any], Iterable[Any]] = attrgetter("incoming")
+outgoing_edges: Callable[[Any], Iterable[Any]] = attrgetter("outgoing")
+
+
+def walk(
+    start: Any,
+    neighbours: Callable[[Any], Iterable[Any]],
+    *,
+    max_depth: int | None = None,
+    postorder: bool = False,
+) -> Iterator[tuple[Any, int]]:
+    """
+    Depth-first walk from start, yielding (node, depth) once per reachable node.
+
+    Cycles are visited once. Stop iterating to end the walk early. In postorder a node
+    is yielded after everything reached through it, and its edges are read before any
+    of those descendants are yielded, so callers may detach yielded nodes.
+
+    Args:
+        start: Node to start from, yielded at depth 0.
+        neighbours: Returns the nodes to continue to, e.g. outgoing_edges.
+        max_depth: Do not expand nodes at this depth. None walks without limit.
+        postorder: Yield descendants before the node that reached them.
+
+    """
+    seen: set[Any] = set()
+    # (node, depth, expanded)
+    stack: list[tuple[Any, int, bool]] = [(start, 0, False)]
+    while stack:
+        node, depth, expanded = stack.pop()
+        if expanded:
+            yield node, depth
+            continue
+        if node in seen:
+            continue
+        seen.add(node)
+        if postorder:
+            stack.append((node, depth, True))
+        else:
+            yield node, depth
+        if max_depth is not None and depth >= max_depth:
+            continue
+        # Reversed so the first neighbour is walked first, as recursion would.
+        stack.extend(
+            (next_node, depth + 1, False)
+            for next_node in reversed(tuple(neighbours(node)))
+            if next_node not in seen
+        )
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 from src.config.pipeline_enums import PipelineRegistries, PipelineRegistryKeys
+from src.data_pipeline.extract.html_parser import compile_selector
 from src.data_pipeline.load.pipeline_loader import PipelineLoader
 
 if TYPE_CHECKING:
@@ -116,6 +117,17 @@ class ProcessorRegistry:
         for key, stage_map in config.items():
             for stage, processor in stage_map.items():
                 self.register(key, stage)(processor)
+                self.prepare_selectors(processor)
+
+    @staticmethod
+    def prepare_selectors(processor: ProcessorType) -> None:
+        """Compile the CSS selectors of a selector template once, ahead of the first page."""
+        template = processor() if isinstance(processor, type) else processor
+        css_selectors = getattr(template, "css_selectors", None)
+        if css_selectors is None:
+            return
+        for selector in css_selectors():
+            compile_selector(selector)
 
     def load_l_config(self, config: dict) -> None:
         """
@@ -0,0 +1,70 @@
+"""Utility functions for append-only JSON lines indexes, where the last line for a key wins."""
+
+import json
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from src.utils.logger import logger
+
+
+def load_json_lines(
+    file_path: Path,
+    key: str = "url",
+    *,
+    is_removal: Callable[[dict], bool] | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> dict[str, dict]:
+    """
+    Load a JSON lines index as a dict of the last record per key.
+
+    Records for which is_removal returns True drop their key. A torn final line is skipped.
+    The file is rewritten with one line per key once superseded lines outnumber the live ones.
+    Returns an empty dict if the file does not exist.
+    """
+    records: dict[str, dict] = {}
+    if not file_path.exists():
+        return records
+    lines = 0
+    with file_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            lines += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line
+            if is_removal is not None and is_removal(record):
+                records.pop(record[key], None)
+            else:
+                records[record[key]] = record
+    if lines > 2 * len(records):
+        write_json_lines(file_path, records.values(), default=default)
+    return records
+
+
+def write_json_lines(
+    file_path: Path,
+    records: Iterable[dict],
+    *,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Replace the file with one line per record, through a temporary file."""
+    tmp_path = file_path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.writelines(json.dumps(record, default=default) + "\n" for record in records)
+    tmp_path.replace(file_path)
+
+
+def append_json_line(
+    file_path: Path,
+    record: dict,
+    *,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Append one record, creating the file and its directory if needed. Errors are logged."""
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=default) + "\n")
+    except OSError as e:
+        logger.error(f"[JSON LINES]: Error writing {file_path}: {e}")
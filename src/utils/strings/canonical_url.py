@@ -0,0 +1,49 @@
+"""Utility function for building a canonical lookup key from a url."""
+
+import html
+from urllib.parse import unquote, urlparse
+
+SESSION_PARAM = "ddBienniumSession"
+
+
+def canonical_url_key(url: str) -> tuple[str, str | None]:
+    """
+    Return (canonical path+query, session code) for a url.
+
+    The key ignores scheme, netloc, path case and query parameter order, and
+    excludes the session parameter, which is returned separately so that
+    links without a session can match any session.
+    """
+    if not url:
+        return "", None
+    parsed = urlparse(unquote(html.unescape(url)))
+    session = None
+    params = []
+    for param in parsed.query.split("&"):
+        if not param:
+            continue
+        name, _, value = param.partition("=")
+        if name == SESSION_PARAM:
+            session = value
+            continue
+        params.append(param)
+    key = parsed.path.lower()
+    if params:
+        key += "?" + "&".join(sorted(params))
+    return key, session
+
+
+def url_key_terms(url_key: str) -> list[str]:
+    """
+    Return the path of a canonical url key followed by one path?param term per parameter.
+
+    A url whose key has all the terms of another's carries the same path and at least its
+    query parameters.
+    """
+    path, _, query = url_key.partition("?")
+    return [path, *(f"{path}?{param}" for param in query.split("&") if param)]
+
+
+def url_key_contains(url_key: str, partial_key: str) -> bool:
+    """Return True if url_key has the path and every query parameter of partial_key."""
+    return set(url_key_terms(partial_key)) <= set(url_key_terms(url_key))
@@ -9,6 +9,25 @@ from src.structures.indexed_tree import PipelineStateEnum
 from src.utils.logger import logger
 
 
+class SentinelBarrier:
+    """Forward the shutdown sentinel of a stage once, after every producer of it has stopped."""
+
+    def __init__(self, producers: int, consumers: int = 1) -> None:
+        """Initialize the barrier, consumers is the number of workers reading the next queue."""
+        self.lock = threading.Lock()
+        self.remaining = producers
+        self.consumers = consumers
+
+    def arrive(self, output_queue: Queue) -> None:
+        """Count a stopped producer, the last one puts one sentinel per consumer."""
+        with self.lock:
+            self.remaining -= 1
+            if self.remaining:
+                return
+        for _ in range(self.consumers):
+            output_queue.put(None)
+
+
 class BaseWorker(threading.Thread):
     """Base worker class."""
 
@@ -24,6 +43,8 @@ class BaseWorker(threading.Thread):
         super().__init__(name=name, daemon=isDaemon)
         self.input_queue = input_queue
         self.output_queue = output_queue
+        # Shared by the workers feeding output_queue, set by the orchestrator
+        self.sentinel_barrier: SentinelBarrier | None = None
 
     def fetch_next(self) -> Any:
         """Fetch the next item from the input queue."""
@@ -43,8 +64,7 @@ class BaseWorker(threading.Thread):
             item = self.fetch_next()
             logger.info(f"{self.name.upper()}: Processing item: {item}")
             if item is None:
-                if self.output_queue:
-                    self.output_queue.put(item)
+                self.forward_sentinel()
                 break
             if getattr(item, "state", None) == PipelineStateEnum.ERROR:
                 self.mark_done()
@@ -59,6 +79,15 @@ class BaseWorker(threading.Thread):
                 logger.info(f"[{self.name.upper()}]: Finished processing item: {item}")
                 self.mark_done()
 
+    def forward_sentinel(self) -> None:
+        """Pass the shutdown sentinel on, once per stage if the worker has a sentinel_barrier."""
+        if not self.output_queue:
+            return
+        if self.sentinel_barrier is None:
+            self.output_queue.put(None)
+        else:
+            self.sentinel_barrier.arrive(self.output_queue)
+
     def process(self, item: Any) -> Never:
         """Process the item."""
         raise NotImplementedError
@@ -68,7 +97,6 @@ class BaseWorker(threading.Thread):
         # optional logging or state update
         self._set_state(item, PipelineStateEnum.ERROR)
         logger.exception(f"[{self.name.upper()}]: Exception while processing item: {item}\t")
-        self.input_queue.put(None)
 
     def _set_state(self, node: directed_graph.Node, state: PipelineStateEnum) -> None:
         node.set_state(state)
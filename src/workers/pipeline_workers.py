@@ -1,8 +1,11 @@
 """Thread workers for pipeline tasks."""
 
+import asyncio
+import contextlib
+import inspect
 import time
 from dataclasses import dataclass
-from queue import LifoQueue, Queue
+from queue import Queue
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
@@ -10,11 +13,17 @@ import psycopg
 
 from src.config.pipeline_enums import PipelineRegistries, PipelineRegistryKeys
 from src.config.settings import known_links_cache_file, state_cache_file
+from src.data_pipeline.extract.crawler_pool import CrawlerPool
 from src.data_pipeline.extract.html_parser import HTMLParser
 from src.data_pipeline.extract.webcrawler import Crawler
 from src.data_pipeline.transform.pipeline_transformer import PipelineTransformer
 from src.data_pipeline.transform.utils.strip_session_from_string import strip_session_from_link
+from src.data_pipeline.utils.change_ledger import ChangeLedger
 from src.data_pipeline.utils.fetch_scheduler import FetchScheduler
+from src.data_pipeline.utils.html_store import HTMLStore
+from src.data_pipeline.utils.http_cache import HTTPCache
+from src.data_pipeline.utils.parsed_pages import ParsedPages
+from src.data_pipeline.utils.response_archive import ResponseArchive
 from src.structures import directed_graph
 from src.structures.directed_graph import DirectionalGraph
 from src.structures.indexed_tree import PipelineStateEnum
@@ -26,8 +35,6 @@ from src.utils.logger import logger
 from src.utils.strings.get_url_base_path import get_url_base_path
 from src.workers.base_worker import BaseWorker
 
-MAX_WAIT_TIME = 0.005  # Max wait time for a domain from fetch scheduler
-
 
 @dataclass
 class LoaderObj:
@@ -52,75 +59,87 @@ def get_registry_template(
         raise
 
 
-class CrawlerWorker(BaseWorker):
-    """Thread to consume the crawler queue and fetch external data."""
+def split_processing_template(templates: dict) -> tuple[dict, dict, dict]:
+    """Split a PROCESS template into selector, transformer and state key templates."""
+    parsing_templates = templates.copy()
+    state_key_pairs = {}
+    for key in parsing_templates.copy():
+        if "state" in key:
+            state_key_pairs.update({key: parsing_templates.pop(key, (None, None))})
+
+    # Separate selectors and transformers from parsing templates
+    selector_template = {key: val[0] for key, val in parsing_templates.items()}
+    transformer_template = {key: val[1] for key, val in parsing_templates.items()}
+
+    return selector_template, transformer_template, state_key_pairs
+
+
+class PageWorker(BaseWorker):
+    """Base for workers which handle fetched pages: enqueue their links and pass them on."""
 
     def __init__(
         self,
-        input_queue: LifoQueue,
+        input_queue: Queue,
         output_queue: Queue,
         state: DirectionalGraph,
-        crawler_cls: type[Crawler],
         parser: HTMLParser,
         fun_registry: ProcessorRegistry,
         *,
-        fetch_scheduler: FetchScheduler,
-        strict: bool = False,
-        name: str = "Crawler Worker",
+        links_queue: Queue | None = None,
+        html_store: HTMLStore | None = None,
+        change_ledger: ChangeLedger | None = None,
+        parsed_pages: ParsedPages | None = None,
+        name: str = "Page Worker",
     ) -> None:
-        """Initialize the crawler worker."""
+        """
+        Initialize the page worker, discovered links go to links_queue, else input_queue.
+
+        With parsed_pages, the data selectors of pages passed on to PROCESS run on the
+        document parsed for links, and the result is left in parsed_pages for the processor.
+        """
         super().__init__(input_queue, output_queue, name=name)
         self.state = state
-        self.running = True
-        self.strict = strict
-        self.crawler_cls = crawler_cls
-        self.crawlers = {}
         self.parser = parser
         self.fun_registry = fun_registry
-        self.fetch_scheduler = fetch_scheduler
-
-    def process(self, node: directed_graph.Node) -> None:
-        """Process the node."""
-        unqueued_nodes = self.state.find_in_graph(
-            None,
-            {"state": PipelineStateEnum.CREATED},
-            find_single=False,
-        )
-        if unqueued_nodes:
-            node = self._process_unqueued_nodes(unqueued_nodes, node)
+        self.links_queue = input_queue if links_queue is None else links_queue
+        self.html_store = html_store
+        self.change_ledger = change_ledger
+        self.parsed_pages = parsed_pages
+
+    def _handle_page(self, working_node: directed_graph.Node, html: str) -> None:
+        """Enqueue the page's links, store its html and pass the node on."""
+        document = self.parser.parse(html, working_node.type)
+        links: dict = self._parse_html(working_node.url, document)
+        if links:
+            self._enqueue_links(working_node, links)
+
+        if self.html_store:
+            working_node.data = {
+                **working_node.data,
+                "html_ref": self.html_store.put(html),
+            }
+        else:
+            working_node.data = {**working_node.data, "html": html}
+        self.resolve_node(working_node, html, document)
 
-        final_flag = False
-        self.create_crawlers(self.state.roots)
-        while True:  # loop to try to keep order while using scheduler
-            working_node = self._check_scheduler(node)
-            if working_node is node:
-                final_flag = True
-            if not working_node:
-                if self.fetch_scheduler.time_until_next():
-                    logger.info(f"[{self.name.upper()}]: Going to sleep until next node ready.")
-                    time.sleep(self.fetch_scheduler.time_until_next())
-                continue
-            try:
-                self._set_state(working_node, PipelineStateEnum.FETCHING)
-                html = self._fetch_html(working_node.url)
-                links: dict = self._parse_html(working_node.url, html)
-                if links:
-                    self._enqueue_links(node, links)
-
-                working_node.data["html"] = html
-                self.resolve_node(working_node)
-
-            except Exception as e:
-                logger.error(f"[{self.name.upper()}]: {e}")
-                self._set_state(working_node, PipelineStateEnum.ERROR)
-                raise
-            if final_flag:
-                break
+    def resolve_node(
+        self,
+        working_node: directed_graph.Node,
+        html: str | None = None,
+        document: Any = None,
+    ) -> None:
+        """
+        Determine whether to put the node on the next queue and what to mark its state.
 
-    def resolve_node(self, working_node: directed_graph.Node) -> None:
-        """Determine whether to put the node on the next queue and what to mark its state."""
+        A page unchanged since its last load skips PROCESS and LOAD, see _restore_unchanged.
+        """
         links = [n.url for n in working_node.outgoing]
-        if self._check_processing_step(working_node.url):
+        if self._check_processing_step(working_node.url) and not self._restore_unchanged(
+            working_node,
+            html,
+        ):
+            if document is not None and self.parsed_pages is not None:
+                self._extract_data(working_node.url, document)
             self._set_state(working_node, PipelineStateEnum.AWAITING_PROCESSING)
             self.output_queue.put(working_node)
         elif links and any(
@@ -131,10 +150,24 @@ class CrawlerWorker(BaseWorker):
             self._set_state(working_node, PipelineStateEnum.COMPLETED)
             self.state.safe_remove_root(working_node.url, known_links_cache_file)
 
-    def create_crawlers(self, unique_domains: set[directed_graph.Node]) -> None:
-        """Create a crawler instance or each unique domain."""
-        for key in unique_domains:
-            self.crawlers[urlparse(key.url).netloc] = self.crawler_cls(key.url, strict=self.strict)
+    def _restore_unchanged(self, working_node: directed_graph.Node, html: str | None) -> bool:
+        """Give an unchanged page its last loader result as data, return whether it was."""
+        if self.change_ledger is None or html is None:
+            return False
+        if not self.change_ledger.unchanged(working_node.url, html):
+            return False
+        working_node.data = self.change_ledger.loaded_result(working_node.url)
+        logger.info(f"[{self.name.upper()}]: Unchanged since last load: {working_node.url}")
+        return True
+
+    def _extract_data(self, url: str, document: Any) -> None:
+        """Run the PROCESS data selectors of url on the parsed document, for the processor."""
+        p_enum = get_enum_by_url(get_url_base_path(url))
+        template = get_registry_template(self.fun_registry, p_enum, PipelineRegistries.PROCESS)
+        if not template:
+            return
+        selector_template, _, _ = split_processing_template(template)
+        self.parsed_pages.put(url, self.parser.get_content(selector_template, document))
 
     def _check_processing_step(self, url: str) -> bool:
         parsed_url = get_url_base_path(url)
@@ -156,7 +189,7 @@ class CrawlerWorker(BaseWorker):
 
             for it in item:
                 nit = urljoin(base_url, it)
-                if nit in self.state.nodes:
+                if self.state.has_url(nit):
                     continue
                 url_type = get_url_base_path(nit)
                 url_enum = get_enum_by_url(url_type)
@@ -167,47 +200,136 @@ class CrawlerWorker(BaseWorker):
                     state=PipelineStateEnum.AWAITING_FETCH,
                 )
                 if new_node:
-                    self.input_queue.put(new_node)
+                    self.links_queue.put(new_node)
         self.state.save_file(state_cache_file)
 
-    def _parse_html(self, url: str, html: str) -> dict | None:
+    def _parse_html(self, url: str, html: Any) -> dict | None:
+        """Run the FETCH link selectors of url on html or a document parsed from it."""
         parsed_url = get_url_base_path(url)
         parser_enum = get_enum_by_url(parsed_url)
         template = get_registry_template(self.fun_registry, parser_enum, PipelineRegistries.FETCH)
         return self.parser.get_content(template.copy(), html) if template else None
 
-    def _check_scheduler(self, node: directed_graph.Node) -> directed_graph.Node | None:
 
-        domain = urlparse(node.url).netloc
+class CrawlerWorker(PageWorker):
+    """Thread to consume the crawler queue and fetch external data."""
 
-        priority_item: directed_graph.Node = self.fetch_scheduler.pop_due()
-        if not priority_item and self.fetch_scheduler.can_fetch_now(domain):
-            return node
-        if (
-            not priority_item
-            and self.fetch_scheduler.time_until_next()
-            and self.fetch_scheduler.time_until_next() < MAX_WAIT_TIME
-        ):
-            while not self.fetch_scheduler.can_fetch_now(domain):
-                continue
-            return node
-        if priority_item:
-            domain = urlparse(node.url).netloc
-            self.fetch_scheduler.schedule_retry(
-                node,
-                self.fetch_scheduler.next_allowed_time(domain),
+    def __init__(
+        self,
+        input_queue: Queue,
+        output_queue: Queue,
+        state: DirectionalGraph,
+        crawler_cls: type[Crawler],
+        parser: HTMLParser,
+        fun_registry: ProcessorRegistry,
+        *,
+        fetch_scheduler: FetchScheduler,
+        crawlers: CrawlerPool | None = None,
+        html_store: HTMLStore | None = None,
+        http_cache: HTTPCache | None = None,
+        archive: ResponseArchive | None = None,
+        change_ledger: ChangeLedger | None = None,
+        parsed_pages: ParsedPages | None = None,
+        discover_queue: Queue | None = None,
+        strict: bool = False,
+        name: str = "Crawler Worker",
+    ) -> None:
+        """
+        Initialize the crawler worker.
+
+        Several workers may share one fetch_scheduler and crawlers pool, so each politeness slot
+        is taken by whichever worker is free. Without a pool, one is built from crawler_cls,
+        http_cache and archive. With a discover_queue, fetched pages are handed to a
+        LinkDiscoveryWorker instead of being parsed on this thread.
+        """
+        super().__init__(
+            input_queue,
+            output_queue,
+            state,
+            parser,
+            fun_registry,
+            html_store=html_store,
+            change_ledger=change_ledger,
+            parsed_pages=parsed_pages,
+            name=name,
+        )
+        self.running = True
+        self.strict = strict
+        self.crawler_cls = crawler_cls
+        if crawlers is None:
+            crawlers = CrawlerPool(
+                crawler_cls,
+                strict=strict,
+                response_hook=fetch_scheduler.record_response,
+                http_cache=http_cache,
+                archive=archive,
             )
-            pi_domain = urlparse(priority_item.url).netloc
-            self.fetch_scheduler.mark_fetched(pi_domain)
-            return priority_item
-        return None
+        self.crawlers = crawlers
+        self.fetch_scheduler = fetch_scheduler
+        self.discover_queue = discover_queue
+        self._handed_off = 0
+
+    def process(self, node: directed_graph.Node) -> None:
+        """
+        Process the node.
+
+        The node is submitted to the shared scheduler, then the next fetchable node is fetched,
+        which may be one submitted by another worker. Every call fetches exactly one node.
+        """
+        self._submit(node)
+        working_node = self.fetch_scheduler.next_fetchable()
+        if working_node is None:  # scheduler closed
+            return
+        try:
+            self._set_state(working_node, PipelineStateEnum.FETCHING)
+            html = self._fetch_html(working_node.url)
+            if not self._hand_off(working_node, html):
+                self._handle_page(working_node, html)
+
+        except Exception as e:
+            logger.error(f"[{self.name.upper()}]: {e}")
+            self._set_state(working_node, PipelineStateEnum.ERROR)
+            # Another worker's node failed, this worker's node is still scheduled
+            if working_node is node:
+                raise
+
+    def _submit(self, node: directed_graph.Node) -> None:
+        """Submit the node, or an unqueued node in its place, to the fetch scheduler."""
+        with self.state.lock:  # claim CREATED nodes before another worker does
+            unqueued_nodes = self.state.find_in_graph(
+                None,
+                {"state": PipelineStateEnum.CREATED},
+                find_single=False,
+            )
+            if unqueued_nodes:
+                node = self._process_unqueued_nodes(unqueued_nodes, node)
+
+        self.fetch_scheduler.submit(node, urlparse(node.url).netloc)
+
+    def _hand_off(self, working_node: directed_graph.Node, html: str) -> bool:
+        """Pass the page to link discovery, if there is a discover_queue. Return whether it was."""
+        if self.discover_queue is None:
+            return False
+        self._handed_off += 1
+        self.discover_queue.put((working_node, html))
+        return True
+
+    def mark_done(self) -> None:
+        """Mark the input queue task done, unless link discovery does once the page is handled."""
+        if self._handed_off:
+            self._handed_off -= 1
+            return
+        super().mark_done()
+
+    def create_crawlers(self, unique_domains: set[directed_graph.Node]) -> None:
+        """Create crawlers ahead of the first fetch for each unique domain not yet in the pool."""
+        for key in unique_domains:
+            self.crawlers.get(key.url)
 
     def _fetch_html(self, url: str) -> str:
         """Get html response from a page."""
         parsed_url = urlparse(url)
-        html = self.crawlers[parsed_url.netloc].get_page(parsed_url.geturl())
-        self.fetch_scheduler.mark_fetched(parsed_url.netloc)
-        return html
+        return self.crawlers.get(url).get_page(parsed_url.geturl())
 
     def _process_unqueued_nodes(
         self,
@@ -225,6 +347,154 @@ class CrawlerWorker(BaseWorker):
         return node
 
 
+class AsyncCrawlerWorker(CrawlerWorker):
+    """
+    Crawler worker driving many fetches from one asyncio event loop, use with AsyncCrawler.
+
+    Nodes from the input queue are submitted to the fetch scheduler and each node it releases
+    is fetched in its own task, up to max_in_flight at once. A retrying or throttled domain
+    only holds its own tasks, other domains keep their slots.
+    """
+
+    def __init__(self, *args: Any, max_in_flight: int = 8, **kwargs: Any) -> None:
+        """Initialize the async crawler worker, args as CrawlerWorker."""
+        super().__init__(*args, **kwargs)
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight: set[asyncio.Task] = set()
+        self._wakeup: asyncio.Event | None = None
+        self._stopping = False
+
+    def run(self) -> None:
+        """Run the event loop until the input queue sentinel, then pass it on."""
+        asyncio.run(self._run_async())
+        self.forward_sentinel()
+
+    async def _run_async(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        feeder = asyncio.create_task(self._feed())
+        await self._dispatch()
+        await feeder
+
+    async def _feed(self) -> None:
+        """Submit items from the input queue until the sentinel."""
+        while True:
+            item = await asyncio.to_thread(self.fetch_next)
+            logger.info(f"{self.name.upper()}: Processing item: {item}")
+            if item is None:
+                self._stopping = True
+                self._wakeup.set()
+                return
+            if getattr(item, "state", None) == PipelineStateEnum.ERROR:
+                self.mark_done()
+                continue
+            try:
+                self._submit(item)
+            except Exception as e:  # noqa: BLE001
+                msg = f"[{self.name.upper()}]: Exception while processing item: {item}\t: {e}"
+                logger.warning(msg)
+                self.handle_error(item)
+                self.mark_done()
+            self._wakeup.set()
+
+    async def _dispatch(self) -> None:
+        """Start a fetch task for every due node, until stopped and no fetch is in flight."""
+        while not (self._stopping and not self.in_flight):
+            self._wakeup.clear()
+            timeout = None
+            if not self._stopping:
+                while len(self.in_flight) < self.max_in_flight:
+                    working_node = self.fetch_scheduler.pop_due()
+                    if working_node is None:
+                        break
+                    self.in_flight.add(asyncio.create_task(self._fetch(working_node)))
+                if len(self.in_flight) < self.max_in_flight:
+                    timeout = self.fetch_scheduler.time_until_next()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+        # Scheduled nodes keep their AWAITING_FETCH state for the next run
+        abandoned = len(self.fetch_scheduler)
+        if abandoned:
+            logger.info(f"[{self.name.upper()}]: Stopped with {abandoned} nodes awaiting fetch")
+        for _ in range(abandoned):
+            self.mark_done()
+
+    async def _fetch(self, working_node: directed_graph.Node) -> None:
+        """Fetch one node, then hand it off or parse and resolve it off the event loop."""
+        try:
+            self._set_state(working_node, PipelineStateEnum.FETCHING)
+            parsed_url = urlparse(working_node.url)
+            html = self.crawlers.get(working_node.url).get_page(parsed_url.geturl())
+            if inspect.isawaitable(html):  # sync crawlers, e.g. ReplayCrawler, return the page
+                html = await html
+            if not self._hand_off(working_node, html):
+                await asyncio.to_thread(self._handle_page, working_node, html)
+        except Exception as e:  # noqa: BLE001
+            msg = f"[{self.name.upper()}]: Exception while processing item: {working_node}\t: {e}"
+            logger.warning(msg)
+            self.handle_error(working_node)
+        finally:
+            logger.info(f"[{self.name.upper()}]: Finished processing item: {working_node}")
+            self.mark_done()
+            self.in_flight.discard(asyncio.current_task())
+            self._wakeup.set()
+
+
+class LinkDiscoveryWorker(PageWorker):
+    """
+    Thread to consume (node, html) pairs fetched by crawler workers and discover their links.
+
+    Parsing, graph updates and the state save run here, so the fetch threads only issue
+    requests. The fetch queue task of each page is marked done after its links are queued,
+    so joining the fetch queue still waits for every discovered link.
+    """
+
+    def __init__(
+        self,
+        input_queue: Queue,
+        output_queue: Queue,
+        state: DirectionalGraph,
+        parser: HTMLParser,
+        fun_registry: ProcessorRegistry,
+        *,
+        links_queue: Queue,
+        html_store: HTMLStore | None = None,
+        change_ledger: ChangeLedger | None = None,
+        parsed_pages: ParsedPages | None = None,
+        name: str = "Link Discovery Worker",
+    ) -> None:
+        """Initialize the link discovery worker, links_queue is the fetch queue."""
+        super().__init__(
+            input_queue,
+            output_queue,
+            state,
+            parser,
+            fun_registry,
+            links_queue=links_queue,
+            html_store=html_store,
+            change_ledger=change_ledger,
+            parsed_pages=parsed_pages,
+            name=name,
+        )
+
+    def process(self, item: tuple[directed_graph.Node, str]) -> None:
+        """Enqueue the page's links, store its html and pass the node on."""
+        working_node, html = item
+        self._handle_page(working_node, html)
+
+    def mark_done(self) -> None:
+        """Mark the page done on both the discover queue and the fetch queue."""
+        super().mark_done()
+        self.links_queue.task_done()
+
+    def handle_error(self, item: tuple[directed_graph.Node, str]) -> None:
+        """Mark the page's node as errored, without stopping discovery for other pages."""
+        working_node, _ = item
+        self._set_state(working_node, PipelineStateEnum.ERROR)
+        logger.exception(f"[{self.name.upper()}]: Exception while handling page: {working_node}")
+
+
 class ProcessorWorker(BaseWorker):
     """Thread to consume the processor queue and handle internal data processing."""
 
@@ -238,9 +508,11 @@ class ProcessorWorker(BaseWorker):
         fun_registry: ProcessorRegistry,
         *,
         strict: bool,
+        html_store: HTMLStore | None = None,
+        parsed_pages: ParsedPages | None = None,
         name: str = "Processor Worker",
     ) -> None:
-        """Initialize the processor worker."""
+        """Initialize the processor worker, parsed_pages holds data extracted at fetch time."""
         super().__init__(input_queue, name=name)
         self.output_queue = output_queue
         self.state = state
@@ -248,6 +520,8 @@ class ProcessorWorker(BaseWorker):
         self.transformer = transformer
         self.strict = strict
         self.fun_registry = fun_registry
+        self.html_store = html_store
+        self.parsed_pages = parsed_pages
 
     def process(self, node: directed_graph.Node) -> None:
         """Process the node."""
@@ -256,7 +530,9 @@ class ProcessorWorker(BaseWorker):
         if not t_parser or not t_transformer:
             msg = f"Expected parser and transformer templates for node {node} in processor worker"
             raise Exception(msg)  # noqa: TRY002
-        parsed_data = self._parse_html(node.data["html"], t_parser)
+        parsed_data = self.parsed_pages.get(node.url) if self.parsed_pages is not None else None
+        if parsed_data is None:
+            parsed_data = self._parse_html(self._get_html(node), t_parser, node.type)
 
         parsed_data, t_transformer = self.inject_session_code(parsed_data, t_transformer, node)
         transformed_data = self._transform_data(parsed_data, t_transformer)
@@ -268,8 +544,9 @@ class ProcessorWorker(BaseWorker):
             t_transformer,
             state_pairs,
         )
-        if temptemplates is None:
+        if temptemplates is None:  # requeued, the extracted data is kept for the retry
             return
+        self._discard_parsed(node)
         node.data = transformed_data
         if node.data:
             self._set_state(node, PipelineStateEnum.AWAITING_LOAD)
@@ -279,6 +556,15 @@ class ProcessorWorker(BaseWorker):
             logger.error(msg)
             raise Exception(msg)  # noqa: TRY002
 
+    def handle_error(self, item: directed_graph.Node) -> None:
+        """Mark the node as errored and drop its extracted data."""
+        self._discard_parsed(item)
+        super().handle_error(item)
+
+    def _discard_parsed(self, node: directed_graph.Node) -> None:
+        if self.parsed_pages is not None:
+            self.parsed_pages.discard(node.url)
+
     def _create_loader_object(self, transformed_data: dict, node: directed_graph.Node) -> LoaderObj:
         """Create the loader object from the transformed data."""
         if not transformed_data:
@@ -357,20 +643,16 @@ class ProcessorWorker(BaseWorker):
             __original_templates = url_or_templates
         if not __original_templates:
             return None, None, None
-        parsing_templates = __original_templates.copy()
-        state_key_pairs = {}
-        for key in parsing_templates.copy():
-            if "state" in key:
-                state_key_pairs.update({key: parsing_templates.pop(key, (None, None))})
-
-        # Separate selectors and transformers from parsing templates
-        selector_template = {key: val[0] for key, val in parsing_templates.items()}
-        transformer_template = {key: val[1] for key, val in parsing_templates.items()}
+        return split_processing_template(__original_templates)
 
-        return selector_template, transformer_template, state_key_pairs
+    def _get_html(self, node: directed_graph.Node) -> str:
+        """Return the node's html, reading through the html store if it holds a reference."""
+        if "html_ref" in node.data and self.html_store:
+            return self.html_store.get(node.data["html_ref"])
+        return node.data["html"]
 
-    def _parse_html(self, html: str, t_parse: dict) -> dict:
-        return self.parser.get_content(t_parse, html)
+    def _parse_html(self, html: str, t_parse: dict, key: Any = None) -> dict:
+        return self.parser.get_content(t_parse, html, key)
 
 
 class LoaderWorker(BaseWorker):
@@ -383,6 +665,7 @@ class LoaderWorker(BaseWorker):
         db_conn: psycopg.Connection,
         fun_registry: ProcessorRegistry,
         *,
+        change_ledger: ChangeLedger | None = None,
         strict: bool = False,
         name: str = "Loader Worker",
     ) -> None:
@@ -391,6 +674,7 @@ class LoaderWorker(BaseWorker):
         self.state = state
         self.db_conn = db_conn
         self.fun_registry = fun_registry
+        self.change_ledger = change_ledger
         self.strict = strict
 
     def process(self, item: directed_graph.Node) -> None:
@@ -409,7 +693,7 @@ class LoaderWorker(BaseWorker):
                 self._set_state(node, PipelineStateEnum.AWAITING_CHILDREN)
             with self.state.lock:
                 self._remove_nodes(node)
-                self.state.save_file(state_cache_file)
+            self.state.save_file(state_cache_file)
             logger.info(
                 f"[{self.name.upper()}]: Finished processing item: {item} with result: {result}",
             )
@@ -420,6 +704,8 @@ class LoaderWorker(BaseWorker):
             raise
         finally:
             self.db_conn.commit()
+        if self.change_ledger:
+            self.change_ledger.record_loaded(node.url, result)
 
     def _remove_nodes(self, node: directed_graph.Node) -> None:
         self.state.safe_remove_root(node.url, known_links_cache_file)
@@ -0,0 +1,133 @@
+"""
+Contention benchmark: shared read snapshots vs copying the graph under the lock on every read.
+
+Each thread runs one of two mixes: mostly snapshot reads and indexed lookups with occasional
+state changes and node inserts, or the write-heavy mix of FETCH, where most operations add
+discovered links or change states.
+
+Run with: python -m tests.benchmarks.graph_contention_bench [node_count] [ops_per_thread]
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from src.config.pipeline_enums import PipelineRegistryKeys
+from src.structures.directed_graph import DirectionalGraph, Node
+from src.structures.indexed_tree import PipelineStateEnum
+
+THREAD_COUNTS = (1, 4, 16)
+# Operations of each mix, repeated in order by every thread
+MIXES = {
+    "read-mostly": (
+        "state", "add", "roots", "roots", "by_state", "nodes", "nodes", "nodes", "nodes", "nodes",
+    ),
+    "write-heavy": (
+        "state", "add", "add", "state", "add", "add", "add", "roots", "by_state", "nodes",
+    ),
+}
+
+
+class CopyingGraph(DirectionalGraph):
+    """Previous read path: every call copies the nodes and roots while holding the lock."""
+
+    def get_nodes(self) -> OrderedDict:
+        """Copy all nodes under the lock."""
+        with self.lock:
+            return self.nodes.copy()
+
+    def get_roots(self) -> set[Node]:
+        """Copy all roots under the lock."""
+        with self.lock:
+            return self.roots.copy()
+
+
+def _build(graph_cls: type[DirectionalGraph], count: int) -> DirectionalGraph:
+    """Build a graph with one root per session and count children spread over them."""
+    graph = graph_cls()
+    roots = [
+        graph.add_new_node(
+            f"https://arkleg.state.ar.us/Bills/ViewBills?ddBienniumSession=20{i:02d}%2F{i:02d}R",
+            PipelineRegistryKeys.BILL_LIST,
+            None,
+            isRoot=True,
+        )
+        for i in range(8)
+    ]
+    for i in range(count):
+        graph.add_new_node(
+            f"https://arkleg.state.ar.us/Bills/Detail?id=HB{i}",
+            PipelineRegistryKeys.BILL,
+            [roots[i % len(roots)]],
+        )
+    return graph
+
+
+def _worker(
+    graph: DirectionalGraph,
+    worker_id: int,
+    ops: int,
+    mix: tuple[str, ...],
+    barrier: threading.Barrier,
+) -> None:
+    """Run ops graph operations, cycling through mix."""
+    barrier.wait()
+    for i in range(ops):
+        match mix[i % len(mix)]:
+            case "state":
+                node = graph.find_node_by_url(f"https://arkleg.state.ar.us/Bills/Detail?id=HB{i}")
+                if node is not None:
+                    graph.set_node_state(node, PipelineStateEnum.AWAITING_FETCH)
+            case "add":
+                graph.add_new_node(
+                    f"https://arkleg.state.ar.us/Bills/Detail?id=W{worker_id}-{i}",
+                    PipelineRegistryKeys.BILL,
+                    None,
+                )
+            case "roots":
+                len(graph.get_roots())
+            case "by_state":
+                graph.get_nodes_by_state(PipelineStateEnum.AWAITING_FETCH)
+            case "nodes":
+                len(graph.get_nodes())
+
+
+def _run(
+    graph_cls: type[DirectionalGraph],
+    count: int,
+    threads: int,
+    ops: int,
+    mix: tuple[str, ...],
+) -> float:
+    """Return operations per second for threads workers on a fresh graph."""
+    graph = _build(graph_cls, count)
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=_worker, args=(graph, t, ops, mix, barrier))
+        for t in range(threads)
+    ]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main(count: int = 5_000, ops: int = 500) -> None:
+    """Print throughput of both read paths for each mix and thread count."""
+    print(f"nodes: {count}, ops per thread: {ops}")  # noqa: T201
+    header = f"{'mix':<12} {'threads':>7} {'copying ops/s':>14} {'snapshot ops/s':>15}"
+    print(f"{header} {'speedup':>8}")  # noqa: T201
+    for name, mix in MIXES.items():
+        for threads in THREAD_COUNTS:
+            old = _run(CopyingGraph, count, threads, ops, mix)
+            new = _run(DirectionalGraph, count, threads, ops, mix)
+            row = f"{name:<12} {threads:>7} {old:>14.0f} {new:>15.0f}"
+            print(f"{row} {new / old:>7.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
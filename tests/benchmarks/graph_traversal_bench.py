@@ -0,0 +1,142 @@
+"""
+Deep chain benchmark: explicit-stack walk vs the previous recursive search and deletion.
+
+A chain mirrors paginated bill list pages, each linking to the next one.
+
+Run with: python -m tests.benchmarks.graph_traversal_bench [depth] [repeats]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from src.config.pipeline_enums import PipelineRegistryKeys
+from src.structures.directed_graph import DirectionalGraph, Node
+from src.structures.indexed_tree import PipelineStateEnum
+
+
+def _chain(depth: int) -> tuple[DirectionalGraph, list[Node]]:
+    """Build a chain of depth list pages."""
+    graph = DirectionalGraph()
+    nodes = [
+        graph.add_new_node(
+            "https://arkleg.state.ar.us/Bills/ViewBills?page=0",
+            PipelineRegistryKeys.BILL_LIST,
+            None,
+        ),
+    ]
+    for i in range(1, depth):
+        nodes.append(
+            graph.add_new_node(
+                f"https://arkleg.state.ar.us/Bills/ViewBills?page={i}",
+                PipelineRegistryKeys.BILL_LIST,
+                [nodes[-1]],
+            ),
+        )
+    return graph, nodes
+
+
+def _recursive_search(
+    node: Node,
+    node_attrs: dict,
+    searched_nodes: set[Node] | None = None,
+) -> Node | None:
+    """Previous recursive ancestor search."""
+    searched_nodes = searched_nodes or set()
+    if node in searched_nodes:
+        return None
+    if node.isMatch(node_attrs=node_attrs):
+        return node
+    searched_nodes.add(node)
+    for next_node in node.incoming:
+        result = _recursive_search(next_node, node_attrs, searched_nodes)
+        if result:
+            return result
+    return None
+
+
+def _recursive_delete(graph: DirectionalGraph, node: Node) -> None:
+    """Previous recursive downward deletion."""
+    if node.outgoing:
+        with graph.lock:
+            for outnode in node.outgoing.copy():
+                _recursive_delete(graph, outnode)
+    graph.delete_node(node)
+
+
+def _time(fn: Callable[[], object], repeats: int) -> float:
+    """Return the best wall time of repeats calls in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _time_fresh(
+    fn: Callable[[DirectionalGraph, list[Node]], object],
+    depth: int,
+    repeats: int,
+) -> float:
+    """Like _time, on a freshly built chain for every call."""
+    best = float("inf")
+    for _ in range(repeats):
+        graph, nodes = _chain(depth)
+        start = time.perf_counter()
+        fn(graph, nodes)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _complete_leaf(graph: DirectionalGraph, nodes: list[Node]) -> None:
+    """Mark every page AWAITING_CHILDREN, then complete the leaf so completion bubbles up."""
+    for node in nodes[:-1]:
+        node.state = PipelineStateEnum.AWAITING_CHILDREN
+    nodes[-1].state = PipelineStateEnum.COMPLETED
+    assert nodes[0].state == PipelineStateEnum.COMPLETED  # noqa: S101
+
+
+def main(depth: int = 10_000, repeats: int = 5) -> None:
+    """Print timings for search, deletion and completion on a chain of depth nodes."""
+    # The recursive versions need several frames per hop.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), depth * 4))
+    graph, nodes = _chain(depth)
+    attrs = {"url": nodes[0].url}
+    missing = {"url": "missing"}
+
+    rows = [
+        (
+            "ancestor search, hit",
+            _time(lambda: _recursive_search(nodes[-1], attrs), repeats),
+            _time(lambda: graph.search_ancestors(nodes[-1], node_attrs=attrs), repeats),
+        ),
+        (
+            "ancestor search, miss",
+            _time(lambda: _recursive_search(nodes[-1], missing), repeats),
+            _time(lambda: graph.search_ancestors(nodes[-1], node_attrs=missing), repeats),
+        ),
+        (
+            "ancestor search, depth 10",
+            _time(lambda: _recursive_search(nodes[-1], missing), repeats),
+            _time(
+                lambda: graph.search_ancestors(nodes[-1], node_attrs=missing, max_depth=10),
+                repeats,
+            ),
+        ),
+        (
+            "downward deletion",
+            _time_fresh(lambda g, n: _recursive_delete(g, n[0]), depth, repeats),
+            _time_fresh(lambda g, n: g.propogate_downward_deletion(n[0]), depth, repeats),
+        ),
+    ]
+    print(f"chain depth: {depth}, best of {repeats}")  # noqa: T201
+    print(f"{'operation':<26} {'recursive ms':>13} {'iterative ms':>13}")  # noqa: T201
+    for name, old, new in rows:
+        print(f"{name:<26} {old:>13.2f} {new:>13.2f}")  # noqa: T201
+    completion = _time_fresh(_complete_leaf, depth, repeats)
+    print(f"{'completion bubbling':<26} {'-':>13} {completion:>13.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
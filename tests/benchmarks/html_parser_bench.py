@@ -0,0 +1,69 @@
+"""
+Parse throughput of each installed BeautifulSoup backend.
+
+Pages are the downloaded html fixtures under tests/fixtures/html, or a synthetic bill
+detail page when none are present.
+
+Run with: python -m tests.benchmarks.html_parser_bench [repeats]
+"""
+
+import sys
+import time
+
+from src.data_pipeline.extract.html_parser import PARSER_BACKENDS, HTMLParser, backend_available
+from src.utils.paths import project_root
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "html"
+
+
+def _synthetic_bill_page(rows: int = 400) -> str:
+    """Build a page shaped like a bill detail page: label/value rows and document links."""
+    table_rows = "".join(
+        f'<div class="row"><div class="col-md-3"><b>Label {i}:</b></div>'
+        f'<div class="col-md-9"><a href="/Bills/FTPDocument?path=%2FBills%2F{i}.pdf">'
+        f"Value {i}</a> <span>&nbsp;note</span></div></div>\n"
+        for i in range(rows)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>HB1001</title>"
+        "<script>var token = 'x';</script></head><body><main><div id='bodyContent'>"
+        f"<h1>HB1001 - An Act</h1>{table_rows}</div></main></body></html>"
+    )
+
+
+def _pages() -> tuple[str, list[str]]:
+    """Return a description of the pages and their html."""
+    paths = sorted(FIXTURE_DIR.rglob("*.html")) if FIXTURE_DIR.exists() else []
+    if paths:
+        return f"{len(paths)} fixtures", [p.read_text(encoding="utf-8") for p in paths]
+    return "synthetic bill page", [_synthetic_bill_page()]
+
+
+def _best_time(parser: HTMLParser, pages: list[str], repeats: int) -> float:
+    """Return the best wall time in seconds of parsing every page once."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for html in pages:
+            parser.parse(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(repeats: int = 5) -> None:
+    """Print pages and megabytes parsed per second by each installed backend."""
+    description, pages = _pages()
+    megabytes = sum(len(html.encode("utf-8")) for html in pages) / 1_000_000
+    print(f"{description}, {megabytes:.2f} MB, best of {repeats}")  # noqa: T201
+    print(f"{'backend':<12} {'pages/s':>10} {'MB/s':>8}")  # noqa: T201
+    for backend in PARSER_BACKENDS:
+        if not backend_available(backend):
+            print(f"{backend:<12} {'not installed':>19}")  # noqa: T201
+            continue
+        seconds = _best_time(HTMLParser(backend=backend), pages, repeats)
+        rate = len(pages) / seconds
+        print(f"{backend:<12} {rate:>10.1f} {megabytes / seconds:>8.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
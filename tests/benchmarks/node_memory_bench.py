@@ -0,0 +1,64 @@
+"""
+Memory benchmark: slotted Node vs the previous dict-backed Node layout.
+
+Run with: python -m tests.benchmarks.node_memory_bench [node_count]
+"""
+
+import sys
+import tracemalloc
+
+from src.config.pipeline_enums import PipelineRegistryKeys
+from src.structures.directed_graph import Node
+from src.structures.indexed_tree import PipelineStateEnum
+
+
+class DictNode:
+    """Previous Node layout: instance __dict__ and two sets for edges."""
+
+    def __init__(self, node_type: PipelineRegistryKeys, url: str) -> None:
+        self.id = 0
+        self.outgoing = set()
+        self.incoming = set()
+        self.data = {}
+        self.url = url
+        self.type = node_type
+        self.container = None
+        self.state = PipelineStateEnum.CREATED
+
+
+def _measure(factory: type, urls: list[str]) -> float:
+    """Return bytes allocated per node for a root with one child per url."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    root = factory(PipelineRegistryKeys.BILL_LIST, "https://arkleg.state.ar.us/Bills/ViewBills")
+    nodes = []
+    for url in urls:
+        node = factory(PipelineRegistryKeys.BILL, url)
+        if isinstance(node, Node):
+            node.add_incoming(root)
+            root.add_outgoing(node)
+        else:
+            node.incoming.add(root)
+            root.outgoing.add(node)
+        nodes.append(node)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list holding the nodes and the root's child set, identical for both.
+    total -= sys.getsizeof(nodes) + sys.getsizeof(set(nodes))
+    return total / len(urls)
+
+
+def main(count: int = 100_000) -> None:
+    """Print per-node overhead for both layouts."""
+    urls = [f"https://arkleg.state.ar.us/Bills/Detail?id=HB{i}" for i in range(count)]
+    old = _measure(DictNode, urls)
+    new = _measure(Node, urls)
+    print(f"nodes: {count}")  # noqa: T201
+    print(f"dict Node:    {old:8.1f} bytes/node")  # noqa: T201
+    print(f"slotted Node: {new:8.1f} bytes/node")  # noqa: T201
+    print(f"reduction:    {old / new:8.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
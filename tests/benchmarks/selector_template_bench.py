@@ -0,0 +1,68 @@
+"""
+Per-page cost of each registered selector template's CSS selectors, as strings and prepared.
+
+Pages are the downloaded html fixtures under tests/fixtures/html, or a synthetic bill
+detail page when none are present.
+
+Run with: python -m tests.benchmarks.selector_template_bench [repeats]
+"""
+
+import sys
+import time
+
+from src.config.pipeline_enums import PipelineRegistries, PipelineRegistryKeys
+from src.config.settings import PIPELINE_REGISTRY
+from src.data_pipeline.extract.html_parser import HTMLParser, compile_selector
+from src.workers.pipeline_workers import get_registry_template
+from tests.benchmarks.html_parser_bench import _pages
+
+
+def _templates() -> list[tuple[str, list[str]]]:
+    """Return (name, css selectors) of every FETCH and PROCESS selector template."""
+    templates = []
+    for stage in (PipelineRegistries.FETCH, PipelineRegistries.PROCESS):
+        for key in PipelineRegistryKeys:
+            template = get_registry_template(PIPELINE_REGISTRY, key, stage)
+            if hasattr(template, "css_selectors") and template.css_selectors():
+                templates.append((f"{stage.name}/{key.name}", template.css_selectors()))
+    return templates
+
+
+def _best_time(run, documents: list, repeats: int) -> float:
+    """Return the best wall time in seconds of running run on every document once."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for document in documents:
+            run(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(repeats: int = 20) -> None:
+    """Print the microseconds per page of each template's selectors, uncompiled and prepared."""
+    description, pages = _pages()
+    parser = HTMLParser()
+    documents = [parser.parse(html) for html in pages]
+    print(f"{description}, best of {repeats}")  # noqa: T201
+    print(f"{'template':<28} {'string us':>10} {'prepared us':>12} {'saved us':>9}")  # noqa: T201
+    for name, selectors in _templates():
+        prepared = [compile_selector(selector) for selector in selectors]
+
+        def select_strings(document, selectors=selectors):
+            for selector in selectors:
+                document.select(selector)
+
+        def select_prepared(document, prepared=prepared):
+            for selector in prepared:
+                selector.select(document)
+
+        per_page = 1_000_000 / len(documents)
+        string_us = _best_time(select_strings, documents, repeats) * per_page
+        prepared_us = _best_time(select_prepared, documents, repeats) * per_page
+        saved_us = string_us - prepared_us
+        print(f"{name:<28} {string_us:>10.1f} {prepared_us:>12.1f} {saved_us:>9.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -2,7 +2,7 @@
 import unittest
 from pathlib import Path
 from queue import LifoQueue, Queue
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from urllib.parse import urlparse
 
 # Assuming src.data_pipeline.orchestrate is the module containing Orchestrator
@@ -236,6 +236,45 @@ class TestOrchestratorUnit(unittest.TestCase):
         worker1.join.assert_called_once()
         worker2.join.assert_called_once()
 
+    def test_shutdown_closes_the_fetch_scheduler_before_joining(self):
+        calls = MagicMock()
+        self.orchestrator.fetch_scheduler = calls.scheduler
+        worker = MagicMock(spec=BaseWorker)
+        worker.join = calls.join
+
+        self.orchestrator.shutdown_workers([Queue()], [worker])
+
+        recorded = calls.mock_calls
+        assert recorded.index(call.scheduler.close()) < recorded.index(call.join(timeout=5))
+
+    @patch("src.data_pipeline.orchestrate.logger")
+    def test_shutdown_logs_parsed_page_reuse(self, mock_logger):
+        self.orchestrator.parsed_pages.put("http://example.com/1", {})
+        self.orchestrator.parsed_pages.get("http://example.com/1")
+
+        self.orchestrator.shutdown_workers([], [])
+
+        mock_logger.info.assert_any_call(
+            "[ORCHESTRATOR]: PARSED PAGES: {'hits': 1, 'misses': 0, 'held': 1}",
+        )
+
+    def test_shutdown_leaves_fed_queues_to_their_producers(self):
+        """Only queues without producer workers get sentinels from shutdown_workers."""
+        fetch_q, process_q = Queue(), Queue()
+        fetchers = [MagicMock(input_queue=fetch_q, output_queue=process_q) for _ in range(3)]
+        processor = MagicMock(input_queue=process_q, output_queue=None)
+        workers = [*fetchers, processor]
+
+        self.orchestrator._share_sentinel_barriers(workers)
+        self.orchestrator.shutdown_workers([fetch_q, process_q], workers)
+
+        assert fetch_q.qsize() == 3
+        assert process_q.qsize() == 0
+        assert len({id(w.sentinel_barrier) for w in fetchers}) == 1
+        for _ in fetchers:
+            fetchers[0].sentinel_barrier.arrive(process_q)
+        assert process_q.qsize() == 1
+
 
 class SyncMockWorker:
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,53 @@
+from bs4 import BeautifulSoup
+
+from src.data_pipeline.extract.parsing_templates.arkleg.bill_selector import _BillParsers
+from src.data_pipeline.extract.parsing_templates.arkleg.legislator_selector import (
+    _LegislatorParsers,
+)
+from src.data_pipeline.extract.parsing_templates.label_index import cached_on_page
+
+BILL_PAGE = """
+<div class="row"><div><b>Bill Number:</b></div>
+<div><span>HB</span> <span>HB1001</span><a href="/Bills/HB1001.pdf">PDF</a></div></div>
+<div class="row"><div>Originating Chamber:</div><div>House</div></div>
+<div class="row"><div>COSPONSORS:</div><div><a href="/Legislators/Detail?member=C">C</a></div></div>
+"""
+LEGISLATOR_PAGE = """
+<div id="tableDataWrapper">
+<div class="row"><div class="d-lg-block"><b>Phone:</b></div><div>501-555-1234</div></div>
+<div class="row"><div class="d-lg-block"><b>District: </b></div><div> 12 </div></div>
+</div>
+"""
+
+
+def test_index_is_built_once_per_page():
+    soup = BeautifulSoup("<div>a</div>", "html.parser")
+    builds = []
+
+    def build(page):
+        builds.append(page)
+        return len(builds)
+
+    assert cached_on_page(soup, "labels", build) == 1
+    assert cached_on_page(soup, "labels", build) == 1
+    assert cached_on_page(BeautifulSoup("", "html.parser"), "labels", build) == 2
+
+
+def test_bill_labels_share_one_index():
+    soup = BeautifulSoup(BILL_PAGE, "html.parser")
+
+    assert _BillParsers.parse_bill_no(soup) == "HB1001"
+    assert _BillParsers.parse_bill_no_dwnld(soup) == ["/Bills/HB1001.pdf"]
+    assert _BillParsers.parse_orig_chamber(soup) == "House"
+    assert _BillParsers.parse_cosponsors(soup) == "/Legislators/Detail?member=C"  # any case
+    assert _BillParsers.parse_act_date(soup) is None
+    assert list(vars(soup)["_page_indexes"]) == ["bill_detail_labels"]
+
+
+def test_legislator_table_values():
+    soup = BeautifulSoup(LEGISLATOR_PAGE, "html.parser")
+
+    assert _LegislatorParsers.parse_phone(soup) == ["501-555-1234"]
+    assert _LegislatorParsers.parse_district(soup) == ["12"]
+    assert _LegislatorParsers.parse_seniority(soup) is None
+    assert _LegislatorParsers.parse_phone(BeautifulSoup("<p></p>", "html.parser")) is None
@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from requests import HTTPError
+
+from src.data_pipeline.extract.async_webcrawler import AsyncCrawler
+
+
+@pytest.fixture
+def crawler():
+    return AsyncCrawler("https://example.com", strict=True, max_retries=3, retry_backoff=0.1)
+
+
+def test_get_page_success(crawler):
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.text = "<html>ok</html>"
+
+    with patch.object(crawler.session, "get", return_value=mock_response):
+        assert asyncio.run(crawler.get_page("page")) == "<html>ok</html>"
+
+
+def test_get_page_retries_without_blocking(crawler):
+    mock_fail = MagicMock()
+    mock_fail.raise_for_status.side_effect = HTTPError("boom")
+    mock_success = MagicMock()
+    mock_success.raise_for_status.return_value = None
+    mock_success.text = "<html>final</html>"
+
+    with patch.object(
+        crawler.session,
+        "get",
+        side_effect=[mock_fail, mock_fail, mock_success],
+    ), patch("asyncio.sleep", new_callable=AsyncMock) as sleep_mock, patch(
+        "time.sleep",
+    ) as blocking_sleep:
+        result = asyncio.run(crawler.get_page("page"))
+
+    assert result == "<html>final</html>"
+    assert sleep_mock.await_count == 2
+    blocking_sleep.assert_not_called()
+
+
+def test_get_page_all_retries_fail(crawler):
+    mock_fail = MagicMock()
+    mock_fail.raise_for_status.side_effect = HTTPError("boom")
+
+    with patch.object(crawler.session, "get", return_value=mock_fail), patch(
+        "asyncio.sleep",
+        new_callable=AsyncMock,
+    ), pytest.raises(ConnectionError):
+        asyncio.run(crawler.get_page("page"))
+
+
+def test_get_page_does_not_retry_unexpected_errors(crawler):
+    with patch.object(crawler.session, "get", side_effect=TypeError("bug")) as get_mock, patch(
+        "asyncio.sleep",
+        new_callable=AsyncMock,
+    ) as sleep_mock, pytest.raises(TypeError):
+        asyncio.run(crawler.get_page("page"))
+
+    assert get_mock.call_count == 1
+    sleep_mock.assert_not_awaited()
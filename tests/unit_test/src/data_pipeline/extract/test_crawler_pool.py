@@ -0,0 +1,65 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data_pipeline.extract.crawler_pool import CrawlerPool
+from src.data_pipeline.extract.webcrawler import Crawler
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html>ok</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_one_crawler_per_netloc():
+    crawler_cls = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+    pool = CrawlerPool(crawler_cls, pool_size=3, strict=True)
+
+    first = pool.get("https://arkleg.state.ar.us/Bills/Detail?id=1")
+    second = pool.get("https://arkleg.state.ar.us/Legislators/List")
+    other = pool.get("https://example.com/page")
+
+    assert first is second
+    assert first is not other
+    assert "arkleg.state.ar.us" in pool
+    assert len(pool) == 2
+    crawler_cls.assert_any_call(
+        "https://arkleg.state.ar.us/Bills/Detail?id=1",
+        pool_size=3,
+        strict=True,
+    )
+
+
+def test_connections_are_reused(server):
+    pool = CrawlerPool(Crawler, pool_size=2, strict=True)
+
+    for i in range(5):
+        assert pool.get(f"{server}/page/{i}").get_page(f"{server}/page/{i}") == "<html>ok</html>"
+
+    stats = pool.metrics()["127.0.0.1:" + server.rsplit(":", 1)[1]]
+    assert stats["pages"] == 5
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reuse"] == pytest.approx(0.8)
+    pool.close()
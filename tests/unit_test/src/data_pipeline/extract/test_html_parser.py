@@ -0,0 +1,160 @@
+import pytest
+
+from src.config.pipeline_enums import PipelineRegistries, PipelineRegistryKeys
+from src.config.settings import PIPELINE_REGISTRY
+from src.data_pipeline.extract.html_parser import (
+    PARSER_BACKENDS,
+    HTMLParser,
+    backend_available,
+    compile_selector,
+)
+from src.models.selector_template import SelectorTemplate
+from src.structures.registries import ProcessorRegistry
+from src.workers.pipeline_workers import get_registry_template, split_processing_template
+
+PAGE = '<html><body><h1 id="t">HB1001</h1><a href="/Bills/Votes?id=1">v</a></body></html>'
+# Page holding the structures the registered selectors target, in markup the backends may
+# repair differently: unclosed td/li, entities, br and nested tables. A p left open before a
+# div is not, see test_unclosed_paragraph_diverges.
+SAMPLE_PAGE = """<!DOCTYPE html><html><head><title>HB1001</title></head><body><main>
+<div id="billTypesListWrapper"><ul><li><a href="/Bills/ViewBills?type=HB">House Bills</a>
+<li><a href="/Bills/ViewBills?type=SB&amp;ddBienniumSession=2025%2F2025R">Senate Bills</a></ul>
+</div>
+<div id="bodyContent"><h1>HB1001 - An Act &amp; More</h1>
+<p>500 Woodlane<br>Little Rock, AR</p><p>Second paragraph</p>
+<div class="measureTitle"><b><a href="/Bills/Detail?id=HB1001">HB1001</a></b></div>
+<div class="measureTitle"><b><a href="/Bills/Detail?id=HB1002&amp;ddBienniumSession=2025%2F2025R">
+HB1002</a></b></div>
+<div class="tableSectionFooter"><div><b>1</b> <a href="/Bills/ViewBills?start=20">2</a></div>
+</div>
+<div id="tableDataWrapper">
+<div class="row tableRow"><a href="/Legislators/Detail?member=Smith">Smith</a> <a href="#">x</a>
+</div>
+<div class="row tableRowAlt"><a href="/Legislators/Detail?member=O%27Neal">O'Neal</a></div>
+<table class="table"><tr><td><b>Yea</b>: 12<td>Nay: 3<tr><td><table><tr><td>nested</table>
+</table></div>
+</div></main></body></html>"""
+
+PAGE_KEYS = [
+    PipelineRegistryKeys.BILL_CATEGORIES,
+    PipelineRegistryKeys.BILL,
+    PipelineRegistryKeys.BILL_LIST,
+    PipelineRegistryKeys.BILL_VOTE,
+    PipelineRegistryKeys.LEGISLATOR,
+    PipelineRegistryKeys.LEGISLATOR_LIST,
+]
+CANDIDATE_BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(not backend_available(backend), reason=f"{backend} not installed"),
+    )
+    for backend in PARSER_BACKENDS
+    if backend != "html.parser"
+]
+
+
+def _templates(key: PipelineRegistryKeys) -> list[dict]:
+    """Return the link and data selector templates registered for key."""
+    templates = []
+    fetch = get_registry_template(PIPELINE_REGISTRY, key, PipelineRegistries.FETCH)
+    if fetch:
+        templates.append(fetch.copy())
+    process = get_registry_template(PIPELINE_REGISTRY, key, PipelineRegistries.PROCESS)
+    if process:
+        templates.append(split_processing_template(process)[0])
+    return templates
+
+
+def _raw_selectors(key: PipelineRegistryKeys) -> dict:
+    """Return the selector and (selector, attr) entries of the templates registered for key."""
+    return {
+        f"{i}-{field}": value
+        for i, template in enumerate(_templates(key))
+        for field, value in template.items()
+        if not callable(value)
+    }
+
+
+@pytest.mark.parametrize("backend", CANDIDATE_BACKENDS)
+@pytest.mark.parametrize("key", PAGE_KEYS)
+def test_backend_output_matches_html_parser_on_sample_page(key, backend):
+    template = _raw_selectors(key)
+    reference = HTMLParser()
+    candidate = HTMLParser(backends={key.name: backend})
+
+    expected = reference.get_content(template.copy(), SAMPLE_PAGE, key)
+    assert any(expected.values())
+    assert candidate.get_content(template.copy(), SAMPLE_PAGE, key) == expected
+
+
+@pytest.mark.skipif(not backend_available("lxml"), reason="lxml not installed")
+def test_unclosed_paragraph_diverges():
+    """html.parser keeps a p open across a following div, lxml closes it, e.g. for h1 + p."""
+    page = "<h1>Smith</h1><p>500 Woodlane<div>District 5</div>"
+
+    assert HTMLParser().safe_get(HTMLParser().parse(page), "h1 + p") == [
+        "500 WoodlaneDistrict 5",
+    ]
+    lxml_parser = HTMLParser(backend="lxml")
+    assert lxml_parser.safe_get(lxml_parser.parse(page), "h1 + p") == ["500 Woodlane"]
+
+
+def test_backend_per_page_type():
+    parser = HTMLParser(backends={"BILL": "html.parser"})
+
+    assert parser.backend_for(PipelineRegistryKeys.BILL) == "html.parser"
+    assert parser.backend_for("LEGISLATOR") == "html.parser"
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        HTMLParser(backend="xml.dom")
+
+
+def test_missing_backend_falls_back_to_html_parser(mocker):
+    mocker.patch(
+        "src.data_pipeline.extract.html_parser.backend_available",
+        return_value=False,
+    )
+
+    parser = HTMLParser(backends={"BILL": "lxml"})
+
+    assert parser.backend_for(PipelineRegistryKeys.BILL) == "html.parser"
+
+
+def test_get_content_accepts_parsed_document():
+    parser = HTMLParser()
+    document = parser.parse(PAGE, PipelineRegistryKeys.BILL)
+
+    assert parser.get_content({"title": "h1#t"}, document) == {"title": ["HB1001"]}
+    assert parser.get_content({"links": ("a", "href")}, document) == {
+        "links": ["/Bills/Votes?id=1"],
+    }
+
+
+def test_safe_get_accepts_compiled_selector():
+    parser = HTMLParser()
+    document = parser.parse(PAGE)
+
+    assert compile_selector("h1#t") is compile_selector("h1#t")
+    assert parser.safe_get(document, compile_selector("a"), "href") == ["/Bills/Votes?id=1"]
+    assert parser.safe_get(document, "a", "href") == ["/Bills/Votes?id=1"]
+
+
+def test_prepare_selectors_compiles_template_selectors():
+    class Template(SelectorTemplate):
+        def __init__(self):
+            self.selectors = {
+                "title": "h2.prepare-title",
+                "links": ("a.prepare-link", "href"),
+                "status": (("span.prepare-status", "text"), str.strip),
+                "parsed": lambda soup: soup,
+            }
+
+    compile_selector.cache_clear()
+
+    ProcessorRegistry.prepare_selectors(Template)
+
+    assert Template().css_selectors() == [
+        "h2.prepare-title",
+        "a.prepare-link",
+        "span.prepare-status",
+    ]
+    assert compile_selector.cache_info().currsize == 3
@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data_pipeline.extract.replay_crawler import ReplayCrawler
+from src.data_pipeline.extract.webcrawler import Crawler
+from src.data_pipeline.utils.response_archive import ResponseArchive
+
+URL = "https://example.com/page"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return ResponseArchive(tmp_path / "archive")
+
+
+def test_crawler_archives_responses(archive):
+    crawler = Crawler("https://example.com", strict=True, archive=archive)
+    response = MagicMock(status_code=200, headers={"ETag": '"v1"'}, text="<html>live</html>")
+
+    with patch.object(crawler.session, "get", return_value=response):
+        crawler.get_page(URL)
+
+    assert archive.lookup(URL)["headers"] == {"ETag": '"v1"'}
+    assert archive.body(URL) == "<html>live</html>"
+
+
+def test_replay_serves_archive_without_network(archive):
+    archive.record(URL, 200, {}, "<html>archived</html>")
+    crawler = ReplayCrawler("https://example.com", archive=archive, strict=True)
+
+    with patch.object(crawler.session, "get") as get_mock:
+        assert crawler.get_page(URL) == "<html>archived</html>"
+
+    get_mock.assert_not_called()
+
+
+def test_replay_missing_url_fails_like_a_fetch(archive):
+    crawler = ReplayCrawler("https://example.com", archive=archive, strict=True)
+
+    with pytest.raises(ConnectionError):
+        crawler.get_page(URL)
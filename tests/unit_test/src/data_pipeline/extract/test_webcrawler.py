@@ -1,8 +1,10 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from requests import HTTPError
 
 from src.data_pipeline.extract.webcrawler import Crawler
+from src.data_pipeline.utils.http_cache import HTTPCache
 
 
 @pytest.fixture
@@ -23,7 +25,7 @@ def test_get_page_success_on_first_attempt(crawler):
 def test_get_page_retries_then_succeeds(crawler):
     """Crawler should retry on failure, then succeed on a later attempt."""
     mock_fail = MagicMock()
-    mock_fail.raise_for_status.side_effect = Exception("boom")
+    mock_fail.raise_for_status.side_effect = HTTPError("boom")
 
     mock_success = MagicMock()
     mock_success.raise_for_status.return_value = None
@@ -44,7 +46,7 @@ def test_get_page_retries_then_succeeds(crawler):
 def test_get_page_all_retries_fail(crawler):
     """All retries exhausted → final ConnectionError."""
     mock_fail = MagicMock()
-    mock_fail.raise_for_status.side_effect = Exception("boom")
+    mock_fail.raise_for_status.side_effect = HTTPError("boom")
 
     with patch.object(
         crawler.session,
@@ -60,7 +62,7 @@ def test_get_page_all_retries_fail(crawler):
 def test_get_page_raises_for_status_triggers_retry(crawler):
     """raise_for_status failure should be treated like a failed fetch."""
     mock_fail = MagicMock()
-    mock_fail.raise_for_status.side_effect = Exception("bad-status")
+    mock_fail.raise_for_status.side_effect = HTTPError("bad-status")
 
     with patch.object(
         crawler.session,
@@ -70,6 +72,19 @@ def test_get_page_raises_for_status_triggers_retry(crawler):
         crawler.get_page("page")
 
 
+def test_get_page_does_not_retry_unexpected_errors(crawler):
+    """Errors other than failed requests reach the caller on the first attempt."""
+    with patch.object(
+        crawler.session,
+        "get",
+        side_effect=TypeError("bug"),
+    ) as get_mock, patch("time.sleep") as sleep_mock, pytest.raises(TypeError):
+        crawler.get_page("page")
+
+    assert get_mock.call_count == 1
+    sleep_mock.assert_not_called()
+
+
 def test_increment_session_called(crawler):
     """Ensure increment_session is called once per request attempt."""
     crawler.increment_session = MagicMock()
@@ -82,3 +97,43 @@ def test_increment_session_called(crawler):
         crawler.get_page("page")
 
     crawler.increment_session.assert_called_once()
+
+
+def test_response_hook_reports_status_and_retry_after(crawler):
+    """Each attempt is reported to the hook, and Retry-After stretches the retry sleep."""
+    hook = MagicMock()
+    crawler.response_hook = hook
+
+    mock_busy = MagicMock(status_code=429, headers={"Retry-After": "7"})
+    mock_busy.raise_for_status.side_effect = HTTPError("429")
+    mock_success = MagicMock(status_code=200, headers={}, text="<html></html>")
+
+    with patch.object(
+        crawler.session,
+        "get",
+        side_effect=[mock_busy, mock_success],
+    ), patch("time.sleep") as sleep_mock:
+        assert crawler.get_page("https://example.com/page") == "<html></html>"
+
+    sleep_mock.assert_called_once_with(7.0)
+    assert [c.args[:2] for c in hook.call_args_list] == [("example.com", 429), ("example.com", 200)]
+    assert hook.call_args_list[0].args[3] == 7.0
+
+
+def test_not_modified_is_served_from_http_cache(crawler, tmp_path):
+    """A 304 returns the stored body, the first response's validators are sent back."""
+    crawler.http_cache = HTTPCache(tmp_path / "http")
+    url = "https://example.com/page"
+    mock_full = MagicMock(status_code=200, headers={"ETag": '"v1"'}, text="<html>v1</html>")
+    mock_not_modified = MagicMock(status_code=304, headers={}, text="")
+
+    with patch.object(
+        crawler.session,
+        "get",
+        side_effect=[mock_full, mock_not_modified],
+    ) as get_mock:
+        assert crawler.get_page(url) == "<html>v1</html>"
+        assert crawler.get_page(url) == "<html>v1</html>"
+
+    assert get_mock.call_args_list[0].kwargs["headers"] == {}
+    assert get_mock.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
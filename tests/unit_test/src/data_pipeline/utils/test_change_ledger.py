@@ -0,0 +1,75 @@
+import pytest
+
+from src.data_pipeline.utils.change_ledger import ChangeLedger, page_fingerprint
+
+URL = "https://arkleg.state.ar.us/Bills/Detail?id=HB1001"
+PAGE = "<html><body><h1>HB1001</h1></body></html>"
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return ChangeLedger(tmp_path / "fingerprints.jsonl")
+
+
+def test_fingerprint_ignores_volatile_markup():
+    noisy = (
+        '<html><body><input type="hidden" name="__RequestVerificationToken" value="x1">'
+        "<script>var t = 1;</script><!-- rendered 10:01 -->\n  <h1>HB1001</h1></body></html>"
+    )
+
+    assert page_fingerprint(noisy) == page_fingerprint(PAGE)
+    assert page_fingerprint(PAGE.replace("HB1001", "HB1002")) != page_fingerprint(PAGE)
+
+
+def test_unseen_page_is_changed(ledger):
+    assert not ledger.unchanged(URL, PAGE)
+
+
+def test_loaded_page_is_unchanged_with_result(ledger, tmp_path):
+    ledger.unchanged(URL, PAGE)
+    ledger.record_loaded(URL, {"bill_id": 7})
+
+    reloaded = ChangeLedger(tmp_path / "fingerprints.jsonl")
+
+    assert reloaded.unchanged(URL, PAGE)
+    assert reloaded.loaded_result(URL) == {"bill_id": 7}
+    assert reloaded.skipped == 1
+
+
+def test_unloaded_page_is_not_recorded(ledger):
+    ledger.unchanged(URL, PAGE)
+
+    assert not ledger.unchanged(URL, PAGE)
+    ledger.record_loaded("https://arkleg.state.ar.us/other", {"bill_id": 1})
+    assert ledger.loaded_result("https://arkleg.state.ar.us/other") is None
+
+
+def test_changed_page_needs_a_new_load(ledger):
+    ledger.unchanged(URL, PAGE)
+    ledger.record_loaded(URL, {"bill_id": 7})
+
+    assert not ledger.unchanged(URL, PAGE.replace("HB1001", "HB1001 amended"))
+
+
+def test_entries_of_another_database_are_dropped(tmp_path):
+    path = tmp_path / "fingerprints.jsonl"
+    ledger = ChangeLedger(path, db_identity="db:1")
+    ledger.unchanged(URL, PAGE)
+    ledger.record_loaded(URL, {"bill_id": 7})
+
+    assert ChangeLedger(path, db_identity="db:1").unchanged(URL, PAGE)
+    recreated = ChangeLedger(path, db_identity="db:2")
+    assert not recreated.unchanged(URL, PAGE)
+    assert recreated.loaded_result(URL) is None
+    assert path.read_text(encoding="utf-8") == ""
+
+
+def test_ledger_is_compacted_on_load(ledger, tmp_path):
+    for bill_id in range(3):
+        ledger.unchanged(URL, PAGE.replace("HB1001", f"HB100{bill_id}"))
+        ledger.record_loaded(URL, {"bill_id": bill_id})
+
+    reloaded = ChangeLedger(tmp_path / "fingerprints.jsonl")
+
+    assert len(ledger.path.read_text(encoding="utf-8").splitlines()) == 1
+    assert reloaded.loaded_result(URL) == {"bill_id": 2}
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from src.data_pipeline.utils.fetch_scheduler import FetchScheduler
+
+
+@pytest.fixture
+def scheduler():
+    return FetchScheduler(min_delay=0.2)
+
+
+def test_first_fetch_of_domain_is_immediate(scheduler):
+    scheduler.submit("a", "example.com")
+
+    assert scheduler.next_fetchable(timeout=0) == "a"
+    assert not scheduler.can_fetch_now("example.com")
+
+
+def test_same_domain_waits_for_next_slot(scheduler):
+    scheduler.submit("a", "example.com")
+    scheduler.submit("b", "example.com")
+    assert scheduler.next_fetchable() == "a"
+
+    assert scheduler.pop_due() is None
+    assert 0 < scheduler.time_until_next() <= 0.2
+
+    start = time.monotonic()
+    assert scheduler.next_fetchable() == "b"
+    assert 0.15 <= time.monotonic() - start < 0.5
+
+
+def test_other_domain_is_not_held_back(scheduler):
+    scheduler.submit("a1", "a.com")
+    scheduler.submit("a2", "a.com")
+    scheduler.submit("b1", "b.com")
+
+    assert scheduler.next_fetchable(timeout=0) == "a1"
+    assert scheduler.next_fetchable(timeout=0) == "b1"
+    assert scheduler.next_fetchable(timeout=0) is None
+    assert len(scheduler) == 1
+
+
+def test_retry_time_is_respected(scheduler):
+    scheduler.schedule_retry("late", time.monotonic() + 0.1, "a.com")
+    scheduler.submit("now", "b.com")
+
+    assert scheduler.next_fetchable(timeout=0) == "now"
+    assert scheduler.next_fetchable(timeout=0.3) == "late"
+
+
+def test_blocked_worker_wakes_on_submit(scheduler):
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(scheduler.next_fetchable(timeout=2)))
+    waiter.start()
+    time.sleep(0.05)
+
+    scheduler.submit("a", "example.com")
+    waiter.join(timeout=1)
+
+    assert result == ["a"]
+
+
+def test_close_releases_waiters(scheduler):
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(scheduler.next_fetchable()))
+    waiter.start()
+    time.sleep(0.05)
+
+    scheduler.close()
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert result == [None]
+
+
+def test_retry_after_blocks_domain(scheduler):
+    scheduler.submit("a", "example.com")
+    assert scheduler.next_fetchable() == "a"
+
+    scheduler.record_response("example.com", 429, 0.1, retry_after=5)
+    scheduler.submit("b", "example.com")
+
+    assert scheduler.time_until_next() > 4
+    assert scheduler.current_rates()["example.com"] == pytest.approx(2.5)
+
+
+def test_zero_delay_disables_politeness():
+    scheduler = FetchScheduler(min_delay=0)
+    for item in ("a", "b", "c"):
+        scheduler.submit(item, "example.com")
+
+    assert [scheduler.pop_due() for _ in range(3)] == ["a", "b", "c"]
+    assert scheduler.current_rates() == {}
+
+
+def test_slot_utilization_counts_late_claims_as_idle(scheduler):
+    for item in ("a", "b", "c"):
+        scheduler.submit(item, "example.com")
+    assert scheduler.next_fetchable() == "a"
+    assert scheduler.next_fetchable() == "b"  # waiting when the slot opens
+    assert scheduler.slot_utilization()["example.com"] > 0.9
+
+    time.sleep(0.4)  # busy elsewhere when the slot opens
+    assert scheduler.next_fetchable() == "c"
+
+    assert 0.4 < scheduler.slot_utilization()["example.com"] < 0.7
@@ -0,0 +1,37 @@
+import pytest
+
+from src.data_pipeline.utils.html_store import HTMLStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HTMLStore(tmp_path / "html", cache_size=1)
+
+
+def test_put_get_roundtrip(store):
+    key = store.put("<html>bill</html>")
+    store._cache.clear()
+
+    assert store.get(key) == "<html>bill</html>"
+
+
+def test_identical_content_shares_one_blob(store, tmp_path):
+    key1 = store.put("<html>same</html>")
+    key2 = store.put("<html>same</html>")
+
+    assert key1 == key2
+    assert len(list((tmp_path / "html").rglob("*.html.z"))) == 1
+
+
+def test_lru_evicts_oldest(store):
+    key1 = store.put("<html>1</html>")
+    key2 = store.put("<html>2</html>")
+
+    assert key1 not in store._cache
+    assert key2 in store._cache
+    assert store.get(key1) == "<html>1</html>"
+
+
+def test_missing_key_raises(store):
+    with pytest.raises(FileNotFoundError):
+        store.get("ab" * 32)
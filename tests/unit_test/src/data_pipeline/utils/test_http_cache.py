@@ -0,0 +1,60 @@
+import pytest
+
+from src.data_pipeline.utils.http_cache import HTTPCache
+
+URL = "https://arkleg.state.ar.us/Bills/Detail?id=HB1001"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(tmp_path / "http")
+
+
+def test_no_headers_for_unknown_url(cache):
+    assert cache.request_headers(URL) == {}
+
+
+def test_store_sets_conditional_headers(cache):
+    cache.store(URL, {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, "<html>")
+
+    assert cache.request_headers(URL) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert cache.cached_body(URL) == "<html>"
+    assert cache.hits == 1
+
+
+def test_response_without_validators_is_not_stored(cache):
+    cache.store(URL, {}, "<html>")
+
+    assert cache.request_headers(URL) == {}
+    assert cache.cached_body(URL) is None
+
+
+def test_validators_persist_across_runs(cache, tmp_path):
+    cache.store(URL, {"ETag": '"v1"'}, "<html>1</html>")
+    cache.store(URL, {"ETag": '"v2"'}, "<html>2</html>")
+
+    reloaded = HTTPCache(tmp_path / "http")
+
+    assert reloaded.request_headers(URL) == {"If-None-Match": '"v2"'}
+    assert reloaded.cached_body(URL) == "<html>2</html>"
+
+
+def test_forget_survives_reload(cache, tmp_path):
+    cache.store(URL, {"ETag": '"v1"'}, "<html>")
+    cache.forget(URL)
+
+    assert HTTPCache(tmp_path / "http").request_headers(URL) == {}
+
+
+def test_missing_body_drops_entry(cache):
+    cache.store(URL, {"ETag": '"v1"'}, "<html>")
+    for blob in cache.body_store.base_dir.rglob("*.html.z"):
+        blob.unlink()
+    cache.body_store._cache.clear()
+
+    assert cache.request_headers(URL) == {}
+    assert cache.cached_body(URL) is None
+    assert URL not in cache.entries
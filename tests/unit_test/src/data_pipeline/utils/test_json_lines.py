@@ -0,0 +1,46 @@
+import json
+from datetime import date
+
+from src.utils.json_lines import append_json_line, load_json_lines
+
+
+def test_load_nonexistent_file_returns_empty_dict(tmp_path):
+    assert load_json_lines(tmp_path / "missing.jsonl") == {}
+
+
+def test_last_line_per_key_wins(tmp_path):
+    path = tmp_path / "index" / "index.jsonl"
+    append_json_line(path, {"url": "a", "n": 1})
+    append_json_line(path, {"url": "b", "n": 1})
+    append_json_line(path, {"url": "a", "n": 2})
+
+    assert load_json_lines(path) == {"a": {"url": "a", "n": 2}, "b": {"url": "b", "n": 1}}
+
+
+def test_removal_records_drop_their_key(tmp_path):
+    path = tmp_path / "index.jsonl"
+    append_json_line(path, {"url": "a", "body": "x"})
+    append_json_line(path, {"url": "a", "body": None})
+
+    assert load_json_lines(path, is_removal=lambda record: record["body"] is None) == {}
+
+
+def test_torn_final_line_is_skipped(tmp_path):
+    path = tmp_path / "index.jsonl"
+    append_json_line(path, {"url": "a"})
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"url": "b"')
+
+    assert list(load_json_lines(path)) == ["a"]
+
+
+def test_superseded_lines_are_compacted_on_load(tmp_path):
+    path = tmp_path / "index.jsonl"
+    for i in range(3):
+        append_json_line(path, {"url": "a", "n": i, "day": date(2025, 1, i + 1)}, default=str)
+
+    records = load_json_lines(path, default=str)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [records["a"]]
+    assert records["a"]["day"] == "2025-01-03"
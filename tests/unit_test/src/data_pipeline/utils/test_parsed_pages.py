@@ -0,0 +1,28 @@
+from src.data_pipeline.utils.parsed_pages import ParsedPages
+
+URL = "https://arkleg.state.ar.us/Bills/Detail?id=HB1001"
+
+
+def test_get_keeps_data_until_discarded():
+    pages = ParsedPages()
+    pages.put(URL, {"title": ["HB1001"]})
+
+    data = pages.get(URL)
+    data["session_code"] = URL
+
+    assert pages.get(URL) == {"title": ["HB1001"]}
+    pages.discard(URL)
+    assert pages.get(URL) is None
+    assert (pages.hits, pages.misses) == (2, 1)
+    assert len(pages) == 0
+
+
+def test_metrics():
+    pages = ParsedPages()
+    pages.put(URL, {"title": ["HB1001"]})
+    pages.put("https://arkleg.state.ar.us/other", {})
+    pages.get(URL)
+    pages.discard(URL)
+    pages.get(URL)
+
+    assert pages.metrics() == {"hits": 1, "misses": 1, "held": 1}
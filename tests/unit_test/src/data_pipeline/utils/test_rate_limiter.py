@@ -0,0 +1,73 @@
+import pytest
+
+from src.data_pipeline.utils.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+@pytest.fixture
+def bucket():
+    return TokenBucket(rate=0.5, min_rate=0.1, max_rate=1.0, success_window=3)
+
+
+def test_bucket_spaces_requests_by_rate(bucket):
+    assert bucket.next_allowed_time(100.0) == 100.0
+    bucket.consume(100.0)
+
+    assert bucket.next_allowed_time(100.0) == pytest.approx(102.0)
+    assert bucket.next_allowed_time(102.0) == pytest.approx(102.0)
+
+
+def test_backoff_on_429_and_retry_after(bucket):
+    bucket.consume(100.0)
+    bucket.record_response(429, 0.1, 30.0, 100.0)
+
+    assert bucket.rate == pytest.approx(0.25)
+    assert bucket.next_allowed_time(101.0) == pytest.approx(130.0)
+
+
+def test_backoff_on_503_and_missing_response(bucket):
+    bucket.record_response(503, 0.1, None, 100.0)
+    bucket.record_response(None, 5.0, None, 101.0)
+
+    assert bucket.rate == pytest.approx(0.125)
+    for _ in range(5):
+        bucket.record_response(503, 0.1, None, 102.0)
+    assert bucket.rate == pytest.approx(0.1)
+
+
+def test_rising_latency_slows_down(bucket):
+    bucket.record_response(200, 0.2, None, 100.0)
+    bucket.record_response(200, 1.0, None, 101.0)
+
+    assert bucket.rate == pytest.approx(0.375)
+
+
+def test_clean_fast_responses_speed_up_to_ceiling(bucket):
+    for i in range(3):
+        bucket.record_response(200, 0.2, None, 100.0 + i)
+    assert bucket.rate == pytest.approx(0.55)
+
+    for i in range(100):
+        bucket.record_response(200, 0.2, None, 200.0 + i)
+    assert bucket.rate == pytest.approx(1.0)
+
+
+def test_client_errors_do_not_count_as_clean(bucket):
+    for i in range(3):
+        bucket.record_response(404, 0.2, None, 100.0 + i)
+
+    assert bucket.rate == pytest.approx(0.5)
+
+
+def test_limiter_exposes_rates_per_domain():
+    limiter = RateLimiter(0.4, max_rate=1.0)
+    limiter.consume("a.com")
+    limiter.record_response("b.com", 429, 0.1)
+
+    assert limiter.current_rates() == {"a.com": 0.4, "b.com": pytest.approx(0.2)}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,46 @@
+import pytest
+
+from src.data_pipeline.utils.response_archive import ResponseArchive
+
+URL = "https://arkleg.state.ar.us/Bills/Detail?id=HB1001"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return ResponseArchive(tmp_path / "archive")
+
+
+def test_record_and_lookup(archive):
+    archive.record(URL, 200, {"Content-Type": "text/html"}, "<html>bill</html>")
+
+    record = archive.lookup(URL)
+    assert record["status"] == 200
+    assert record["headers"] == {"Content-Type": "text/html"}
+    assert record["fetched_at"]
+    assert archive.body(URL) == "<html>bill</html>"
+
+
+def test_unknown_url(archive):
+    assert archive.lookup(URL) is None
+    assert archive.body(URL) is None
+
+
+def test_latest_record_wins_after_reload(archive, tmp_path):
+    archive.record(URL, 200, {}, "<html>old</html>")
+    archive.record(URL, 200, {}, "<html>new</html>")
+
+    reloaded = ResponseArchive(tmp_path / "archive")
+
+    assert len(reloaded) == 1
+    assert list(reloaded.urls()) == [URL]
+    assert reloaded.body(URL) == "<html>new</html>"
+
+
+def test_superseded_records_are_compacted_on_load(archive, tmp_path):
+    for i in range(3):
+        archive.record(URL, 200, {}, f"<html>{i}</html>")
+
+    reloaded = ResponseArchive(tmp_path / "archive")
+
+    assert len(archive.path.read_text(encoding="utf-8").splitlines()) == 1
+    assert reloaded.body(URL) == "<html>2</html>"
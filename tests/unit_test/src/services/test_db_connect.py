@@ -0,0 +1,13 @@
+from unittest.mock import MagicMock
+
+from src.services import db_connect
+
+
+def test_database_identity_includes_database_and_schema_oids(monkeypatch):
+    monkeypatch.setattr(db_connect, "DB_HOST", "localhost")
+    monkeypatch.setattr(db_connect, "DB_PORT", "5432")
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = ("scraper", 16384, "public", 2200)
+
+    assert db_connect.database_identity(conn) == "localhost:5432/scraper:16384/public:2200"
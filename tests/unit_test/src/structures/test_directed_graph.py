@@ -58,6 +58,23 @@ class TestNode:
         node = self.Node(PipelineRegistryKeys.TYPE_A, "url", state=8)
         assert node.state == self.PipelineStateEnum.COMPLETED
 
+    def test_initialization_with_container(self, mock_logger):
+        """Test that a node can be built with its container and data, then added."""
+        from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+        from src.structures.directed_graph import DirectionalGraph
+
+        graph = DirectionalGraph()
+        node = self.Node(
+            Keys.BILL,
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1",
+            container=graph,
+            data={"bill_id": 1},
+        )
+        graph.add_existing_node(node)
+
+        assert node.container is graph
+        assert graph.get_nodes_with_data_key("bill_id") == [node]
+
     def test_is_match_logic(self, mock_logger):
         """Test the _isMatch filtering logic."""
         node = self.Node(PipelineRegistryKeys.TYPE_A, "url", data={"foo": "bar", "num": 10})
@@ -256,3 +273,616 @@ class TestDirectionalGraph:
     #
     #     assert result == 1
     #     assert graph.find_node_by_url("file_test") is not None
+
+
+@patch("src.utils.logger.logger")
+class TestDirectionalGraphIndexes:
+    """Unit tests for the state, type and data key secondary indexes."""
+
+    from src.structures.directed_graph import DirectionalGraph, Node, PipelineStateEnum
+
+    @pytest.fixture
+    def graph(self):
+        return self.DirectionalGraph(name="Index Graph")
+
+    def test_state_index_follows_set_state(self, mock_logger, graph):
+        node = self.Node(PipelineRegistryKeys.TYPE_A, "http://a")
+        graph.add_existing_node(node)
+        assert graph.get_nodes_by_state(self.PipelineStateEnum.CREATED) == [node]
+
+        node.set_state(self.PipelineStateEnum.AWAITING_FETCH)
+
+        assert graph.get_nodes_by_state(self.PipelineStateEnum.CREATED) == []
+        assert graph.get_nodes_by_state(self.PipelineStateEnum.AWAITING_FETCH) == [node]
+
+    def test_type_and_data_key_index(self, mock_logger, graph):
+        leg = self.Node(PipelineRegistryKeys.TYPE_A, "http://leg", data={"legislator_id": 7})
+        other = self.Node(PipelineRegistryKeys.TYPE_B, "http://other")
+        graph.add_existing_node(leg)
+        graph.add_existing_node(other)
+
+        assert graph.get_nodes_by_type(PipelineRegistryKeys.TYPE_B) == [other]
+        assert graph.get_nodes_with_data_key("legislator_id") == [leg]
+
+        other.data = {"bill_id": 3}
+        assert graph.get_nodes_with_data_key("bill_id") == [other]
+        assert graph.find_in_graph({"bill_id": 3}, None) is other
+
+    def test_delete_node_unindexes(self, mock_logger, graph):
+        node = self.Node(PipelineRegistryKeys.TYPE_A, "http://a", data={"bill_id": 1})
+        graph.add_existing_node(node)
+
+        graph.delete_node(node)
+
+        assert graph.get_nodes_by_state(self.PipelineStateEnum.CREATED) == []
+        assert graph.get_nodes_with_data_key("bill_id") == []
+        assert graph.find_in_graph(None, {"state": self.PipelineStateEnum.CREATED}) is None
+
+    def test_find_in_graph_by_state_returns_all_matches(self, mock_logger, graph):
+        n1 = self.Node(PipelineRegistryKeys.TYPE_A, "http://1")
+        n2 = self.Node(PipelineRegistryKeys.TYPE_A, "http://2")
+        n3 = self.Node(PipelineRegistryKeys.TYPE_A, "http://3")
+        for n in (n1, n2, n3):
+            graph.add_existing_node(n)
+        n2.set_state(self.PipelineStateEnum.COMPLETED)
+
+        result = graph.find_in_graph(
+            None,
+            {"state": self.PipelineStateEnum.CREATED},
+            find_single=False,
+        )
+
+        assert result == [n1, n3]
+
+    def test_url_lookup_relative_link_without_session(self, mock_logger, graph):
+        leg = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Legislators/Detail?member=D.+Altes&ddBienniumSession=2013%2F2013R",
+            data={"legislator_id": 4},
+        )
+        graph.add_existing_node(leg)
+
+        found = graph.find_in_graph(
+            {"legislator_id": None},
+            {"url": "/Legislators/Detail?member=D.+Altes"},
+        )
+
+        assert found is leg
+
+    def test_url_lookup_respects_session(self, mock_logger, graph):
+        old = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Committees/Detail?code=963&ddBienniumSession=2023%2F2023R",
+        )
+        new = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Committees/Detail?code=963&ddBienniumSession=2025%2F2025R",
+        )
+        graph.add_existing_node(old)
+        graph.add_existing_node(new)
+
+        found = graph.find_in_graph(
+            None,
+            {"url": "/Committees/Detail?code=963&amp;ddBienniumSession=2025%2F2025R"},
+        )
+
+        assert found is new
+        assert graph.find_nodes_by_url_match("/Committees/Detail?code=964") == []
+
+    def test_url_lookup_matches_node_with_extra_query_params(self, mock_logger, graph):
+        bill = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1001&ddBienniumSession=2025%2F2025R"
+            "&Search=",
+            data={"bill_id": 7},
+        )
+        graph.add_existing_node(bill)
+
+        found = graph.find_in_graph({"bill_id": None}, {"url": "/Bills/Detail?id=HB1001"})
+
+        assert found is bill
+        assert graph.find_nodes_by_url_match("/Bills/Detail?id=HB1002") == []
+        assert graph.find_nodes_by_url_match("/Bills/Detail?id=HB1001&Search=x") == []
+
+    def test_url_lookup_prefers_exact_match(self, mock_logger, graph):
+        extra = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1001&Search=",
+        )
+        exact = self.Node(
+            PipelineRegistryKeys.TYPE_A,
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1001",
+        )
+        graph.add_existing_node(extra)
+        graph.add_existing_node(exact)
+
+        assert graph.find_nodes_by_url_match("/Bills/Detail?id=HB1001") == [exact]
+        graph.delete_node(exact)
+        assert graph.find_nodes_by_url_match("/Bills/Detail?id=HB1001") == [extra]
+
+
+@patch("src.utils.logger.logger")
+class TestDirectionalGraphJournal:
+    """Unit tests for journal based persistence."""
+
+    from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+    from src.structures.directed_graph import DirectionalGraph, Node, PipelineStateEnum
+
+    def test_save_appends_journal_and_load_replays(self, mock_logger, tmp_path):
+        fpath = tmp_path / "state_cache.json"
+        graph = self.DirectionalGraph()
+        graph.enable_journal(fpath, compact_every=1000)
+
+        root = graph.add_new_node("https://arkleg.state.ar.us/", self.Keys.ARK_LEG_SEEDER, None)
+        child = graph.add_new_node(
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1",
+            self.Keys.BILL,
+            [root],
+        )
+        child.set_state(self.PipelineStateEnum.AWAITING_LOAD)
+        child.data = {"bill_id": 12}
+        graph.save_file(fpath)
+
+        assert not fpath.exists()
+        assert (tmp_path / "state_cache.json.journal").exists()
+
+        loaded = self.DirectionalGraph()
+        assert loaded.load_from_file(fpath) == 1
+        loaded_child = loaded.find_node_by_url(child.url)
+        assert loaded_child.state == self.PipelineStateEnum.AWAITING_LOAD
+        assert loaded_child.data == {"bill_id": 12}
+        assert [n.url for n in loaded_child.incoming] == [root.url]
+        assert [n.url for n in loaded.get_roots()] == [root.url]
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self, mock_logger, tmp_path):
+        fpath = tmp_path / "state_cache.json"
+        graph = self.DirectionalGraph()
+        graph.enable_journal(fpath, compact_every=3)
+
+        root = graph.add_new_node("https://arkleg.state.ar.us/", self.Keys.ARK_LEG_SEEDER, None)
+        graph.save_file(fpath)
+        root.set_state(self.PipelineStateEnum.COMPLETED)
+        graph.save_file(fpath)
+
+        assert fpath.exists()
+        assert not (tmp_path / "state_cache.json.journal").exists()
+
+        loaded = self.DirectionalGraph()
+        loaded.load_from_file(fpath)
+        assert loaded.find_node_by_url(root.url).state == self.PipelineStateEnum.COMPLETED
+
+    def test_each_snapshot_file_has_its_own_journal(self, mock_logger, tmp_path):
+        from src.structures.graph_journal import GraphJournal
+
+        json_journal = GraphJournal.path_for(tmp_path / "state_cache.json")
+        binary_journal = GraphJournal.path_for(tmp_path / "state_cache.bin")
+
+        assert json_journal.name == "state_cache.json.journal"
+        assert binary_journal.name == "state_cache.bin.journal"
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_compaction_encodes_outside_the_lock(self, mock_logger, tmp_path, binary):
+        fpath = tmp_path / "state_cache"
+        graph = self.DirectionalGraph()
+        graph.binary_snapshot = binary
+        graph.enable_journal(fpath, compact_every=1)
+        graph.add_new_node("https://arkleg.state.ar.us/", self.Keys.ARK_LEG_SEEDER, None)
+        encode = graph._encode_snapshot
+        held = []
+
+        def _encode(records, *, binary):
+            held.append(graph.lock._is_owned())
+            return encode(records, binary=binary)
+
+        with patch.object(graph, "_encode_snapshot", side_effect=_encode):
+            graph.save_file(fpath)
+
+        assert held == [False]
+        loaded = self.DirectionalGraph()
+        assert loaded.load_from_file(fpath) == 1
+        assert [n.url for n in loaded.get_roots()] == ["https://arkleg.state.ar.us/"]
+
+
+@patch("src.utils.logger.logger")
+class TestReloadKeepsAwaitingChildren:
+    """A node AWAITING_CHILDREN with unfinished children must survive a save and reload."""
+
+    from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+    from src.structures.directed_graph import DirectionalGraph, PipelineStateEnum
+
+    @pytest.mark.parametrize("codec", ["json", "binary", "journal"])
+    def test_reload_then_safe_remove_root(self, mock_logger, tmp_path, codec):
+        fpath = tmp_path / "state_cache"
+        graph = self.DirectionalGraph()
+        graph.binary_snapshot = codec == "binary"
+        if codec == "journal":
+            graph.enable_journal(fpath, compact_every=1000)
+        root = graph.add_new_node("https://arkleg.state.ar.us/", self.Keys.ARK_LEG_SEEDER, None)
+        child = graph.add_new_node(
+            "https://arkleg.state.ar.us/Bills/Detail?id=HB1",
+            self.Keys.BILL,
+            [root],
+        )
+        child.set_state(self.PipelineStateEnum.AWAITING_FETCH)
+        root.set_state(self.PipelineStateEnum.AWAITING_CHILDREN)
+        graph.save_file(fpath)
+
+        loaded = self.DirectionalGraph()
+        assert loaded.load_from_file(fpath) == 1
+        loaded_root = loaded.find_node_by_url(root.url)
+
+        assert loaded_root.state == self.PipelineStateEnum.AWAITING_CHILDREN
+        assert loaded_root.pending_children == 1
+        assert loaded.safe_remove_root("https://arkleg.state.ar.us", None) is False
+        assert loaded.find_node_by_url(child.url) is not None
+
+
+@patch("src.utils.logger.logger")
+class TestDirectionalGraphBinarySnapshot:
+    """Unit tests for the binary snapshot codec."""
+
+    from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+    from src.structures.directed_graph import DirectionalGraph, PipelineStateEnum
+
+    def test_binary_roundtrip_loads_data_lazily(self, mock_logger, tmp_path):
+        fpath = tmp_path / "state_cache.bin"
+        graph = self.DirectionalGraph(name="Bin Graph")
+        graph.binary_snapshot = True
+        root = graph.add_new_node("https://arkleg.state.ar.us/", self.Keys.ARK_LEG_SEEDER, None)
+        child = graph.add_new_node(
+            "https://arkleg.state.ar.us/Legislators/Detail?member=Smith",
+            self.Keys.LEGISLATOR,
+            [root],
+            data={"legislator_id": 5, "html": "<html></html>"},
+            state=self.PipelineStateEnum.AWAITING_LOAD,
+        )
+        graph.save_file(fpath)
+
+        loaded = self.DirectionalGraph()
+        assert loaded.load_from_file(fpath) == 1
+        loaded_child = loaded.find_node_by_url(child.url)
+
+        assert loaded.name == "Bin Graph"
+        assert loaded_child._data_source is not None
+        assert loaded.get_nodes_with_data_key("legislator_id") == [loaded_child]
+        assert loaded_child.state == self.PipelineStateEnum.AWAITING_LOAD
+        assert [n.url for n in loaded_child.incoming] == [root.url]
+        assert [n.url for n in loaded.get_roots()] == [root.url]
+
+        assert loaded_child.data == {"legislator_id": 5, "html": "<html></html>"}
+        assert loaded_child._data_source is None
+
+
+class TestNodeCompactEdges:
+    """Unit tests for the compact edge storage of slotted Nodes."""
+
+    from src.structures.directed_graph import Node
+
+    def test_edges_grow_and_shrink(self):
+        parent = self.Node(PipelineRegistryKeys.ROOT, "p")
+        c1 = self.Node(PipelineRegistryKeys.TYPE_A, "c1")
+        c2 = self.Node(PipelineRegistryKeys.TYPE_A, "c2")
+
+        parent.add_outgoing(c1)
+        assert parent._outgoing is c1
+        parent.add_outgoing(c2)
+        assert parent.outgoing == {c1, c2}
+
+        parent.remove_outgoing(c1)
+        assert parent._outgoing is c2
+        parent.remove_outgoing(c2)
+        assert parent.outgoing == set()
+
+    def test_remove_missing_edge_raises(self):
+        node = self.Node(PipelineRegistryKeys.TYPE_A, "n")
+        other = self.Node(PipelineRegistryKeys.TYPE_A, "o")
+        with pytest.raises(KeyError):
+            node.remove_incoming(other)
+
+    def test_node_has_no_instance_dict(self):
+        node = self.Node(PipelineRegistryKeys.TYPE_A, "n")
+        assert not hasattr(node, "__dict__")
+        assert node.data == {}
+
+
+@patch("src.utils.logger.logger")
+class TestCompletionCounters:
+    """Unit tests for incremental completion tracking."""
+
+    from src.structures.directed_graph import DirectionalGraph, Node, PipelineStateEnum
+
+    @pytest.fixture
+    def chain(self):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node("http://root", PipelineRegistryKeys.ROOT, None)
+        mid = graph.add_new_node("http://mid", PipelineRegistryKeys.TYPE_A, [root])
+        leaf1 = graph.add_new_node("http://leaf1", PipelineRegistryKeys.TYPE_B, [mid])
+        leaf2 = graph.add_new_node("http://leaf2", PipelineRegistryKeys.TYPE_B, [mid])
+        return graph, root, mid, leaf1, leaf2
+
+    def test_pending_counts_follow_child_states(self, mock_logger, chain):
+        _graph, root, mid, leaf1, _leaf2 = chain
+        assert root.pending_children == 1
+        assert mid.pending_children == 2
+
+        leaf1.set_state(self.PipelineStateEnum.COMPLETED)
+        assert mid.pending_children == 1
+
+        leaf1.set_state(self.PipelineStateEnum.ERROR)
+        assert mid.pending_children == 2
+
+    def test_completion_bubbles_to_root(self, mock_logger, chain):
+        graph, root, mid, leaf1, leaf2 = chain
+        root.set_state(self.PipelineStateEnum.AWAITING_CHILDREN)
+        mid.set_state(self.PipelineStateEnum.AWAITING_CHILDREN)
+
+        leaf1.set_state(self.PipelineStateEnum.COMPLETED)
+        assert mid.state == self.PipelineStateEnum.AWAITING_CHILDREN
+        assert graph._propagate_completion(root) is False
+
+        leaf2.set_state(self.PipelineStateEnum.COMPLETED)
+        assert mid.state == self.PipelineStateEnum.COMPLETED
+        assert root.state == self.PipelineStateEnum.COMPLETED
+        assert graph._propagate_completion(root) is True
+
+    def test_safe_remove_root_deletes_completed_subtree(self, mock_logger, chain):
+        graph, root, mid, leaf1, leaf2 = chain
+        for node in (root, mid):
+            node.set_state(self.PipelineStateEnum.AWAITING_CHILDREN)
+        for node in (leaf1, leaf2):
+            node.set_state(self.PipelineStateEnum.COMPLETED)
+
+        assert graph.safe_remove_root("http://root", None) is True
+        assert graph.nodes == {}
+
+
+@patch("src.utils.logger.logger")
+class TestRootIndex:
+    """Unit tests for the netloc and session root indexes."""
+
+    from src.structures.directed_graph import DirectionalGraph
+
+    def test_roots_indexed_by_netloc_and_session(self, mock_logger):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node(
+            "https://ArkLeg.state.ar.us/?ddBienniumSession=2025%2F2025R",
+            PipelineRegistryKeys.ROOT,
+            None,
+        )
+
+        assert graph.has_active_root("arkleg.state.ar.us")
+        assert graph.has_active_root("https://arkleg.state.ar.us/Bills/Detail?id=1")
+        assert not graph.has_active_root("example.com")
+        assert graph.get_roots_for_session("2025/2025R") == [root]
+        assert graph.get_active_root_netlocs() == {"arkleg.state.ar.us"}
+
+        graph.remove_root(root)
+
+        assert not graph.has_active_root("arkleg.state.ar.us")
+        assert graph.get_roots_for_session("2025/2025R") == []
+
+    def test_delete_node_clears_root_index(self, mock_logger):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node("https://example.com/", PipelineRegistryKeys.ROOT, None)
+
+        graph.delete_node(root)
+
+        assert graph.get_root_for_domain("example.com") is None
+
+
+@patch("src.utils.logger.logger")
+class TestReadSnapshots:
+    """Unit tests for the shared read-only node and root snapshots."""
+
+    from src.structures.directed_graph import DirectionalGraph, PipelineStateEnum
+
+    def test_snapshot_reused_until_structure_changes(self, mock_logger):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node("https://example.com/", PipelineRegistryKeys.ROOT, None)
+
+        first = graph.get_nodes()
+        root.state = self.PipelineStateEnum.AWAITING_FETCH
+        assert graph.get_nodes() is first
+        assert graph.get_roots() is graph.get_roots()
+
+        child = graph.add_new_node("https://example.com/a", PipelineRegistryKeys.TYPE_A, [root])
+
+        assert graph.get_nodes() is not first
+        assert "https://example.com/a" not in first
+        assert graph.get_nodes()["https://example.com/a"] is child
+
+        graph.delete_node(child)
+        assert "https://example.com/a" not in graph.get_nodes()
+
+    def test_snapshot_is_not_changed_by_later_writes(self, mock_logger):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node("https://example.com/", PipelineRegistryKeys.ROOT, None)
+        nodes = graph.nodes
+
+        view = graph.get_nodes()
+        graph.add_new_node("https://example.com/a", PipelineRegistryKeys.TYPE_A, [root])
+
+        assert graph.nodes is nodes
+        assert list(view) == ["https://example.com/"]
+        assert "https://example.com/a" in graph.get_nodes()
+
+    def test_snapshots_are_read_only(self, mock_logger):
+        graph = self.DirectionalGraph()
+        root = graph.add_new_node("https://example.com/", PipelineRegistryKeys.ROOT, None)
+
+        with pytest.raises(TypeError):
+            graph.get_nodes()["https://example.com/b"] = root
+        assert graph.get_roots() == frozenset({root})
+
+        graph.remove_root(root)
+        assert graph.get_roots() == frozenset()
+
+
+@patch("src.utils.logger.logger")
+class TestDeepChains:
+    """Traversal, deletion and completion on chains deeper than the recursion limit."""
+
+    from src.structures.directed_graph import DirectionalGraph, PipelineStateEnum
+
+    DEPTH = 5_000
+
+    def _chain(self, state=None):
+        graph = self.DirectionalGraph()
+        nodes = [graph.add_new_node("http://chain/0", PipelineRegistryKeys.ROOT, None)]
+        for i in range(1, self.DEPTH):
+            nodes.append(
+                graph.add_new_node(f"http://chain/{i}", PipelineRegistryKeys.TYPE_A, [nodes[-1]]),
+            )
+        if state is not None:
+            for node in nodes[:-1]:
+                node.state = state
+        return graph, nodes
+
+    def test_search_ancestors_through_deep_chain(self, mock_logger):
+        graph, nodes = self._chain()
+
+        assert graph.search_ancestors(nodes[-1], node_attrs={"url": "http://chain/0"}) is nodes[0]
+        assert graph.search_descendants(nodes[0], node_attrs={"url": "missing"}) is None
+
+    def test_search_respects_max_depth(self, mock_logger):
+        graph, nodes = self._chain()
+
+        attrs = {"url": "http://chain/0"}
+
+        assert graph.search_ancestors(nodes[10], node_attrs=attrs, max_depth=9) is None
+        assert graph.search_ancestors(nodes[10], node_attrs=attrs, max_depth=10) is nodes[0]
+
+    def test_downward_deletion_of_deep_chain(self, mock_logger):
+        graph, nodes = self._chain()
+
+        graph.propogate_downward_deletion(nodes[0])
+
+        assert len(graph.nodes) == 0
+        assert graph.get_roots() == frozenset()
+
+    def test_completion_bubbles_up_deep_chain(self, mock_logger):
+        graph, nodes = self._chain(self.PipelineStateEnum.AWAITING_CHILDREN)
+        nodes[-1].state = self.PipelineStateEnum.AWAITING_LOAD
+        assert nodes[0].state == self.PipelineStateEnum.AWAITING_CHILDREN
+
+        nodes[-1].state = self.PipelineStateEnum.COMPLETED
+
+        assert nodes[0].state == self.PipelineStateEnum.COMPLETED
+        assert graph.get_nodes_by_state(self.PipelineStateEnum.AWAITING_CHILDREN) == []
+
+
+@patch("src.utils.logger.logger")
+class TestCompletedSubtreePruning:
+    """Unit tests for pruning completed subtrees into tombstones."""
+
+    from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+    from src.structures.directed_graph import DirectionalGraph, PipelineStateEnum
+
+    ROOT_URL = "https://arkleg.state.ar.us/Legislators/List?ddBienniumSession=2025%2F2025R"
+    LEG_URL = (
+        "https://arkleg.state.ar.us/Legislators/Detail?member=Smith&ddBienniumSession=2025%2F2025R"
+    )
+
+    def _graph(self):
+        graph = self.DirectionalGraph()
+        graph.prune_completed = True
+        root = graph.add_new_node(self.ROOT_URL, self.Keys.LEGISLATOR_LIST, None)
+        root.state = self.PipelineStateEnum.AWAITING_CHILDREN
+        return graph, root
+
+    def _legislator(self, graph, root, url=LEG_URL):
+        return graph.add_new_node(
+            url,
+            self.Keys.LEGISLATOR,
+            [root],
+            state=self.PipelineStateEnum.AWAITING_LOAD,
+        )
+
+    def test_completed_leaf_is_replaced_by_tombstone(self, mock_logger):
+        graph, root = self._graph()
+        leg = self._legislator(graph, root)
+        other = self._legislator(graph, root, self.LEG_URL.replace("Smith", "Jones"))
+
+        leg.data = {"legislator_id": 5, "url": leg.url}
+        leg.state = self.PipelineStateEnum.COMPLETED
+
+        assert graph.find_node_by_url(leg.url) is None
+        assert set(graph.nodes.values()) == {root, other}
+        assert root.outgoing == {other}
+        assert graph.has_url(leg.url)
+
+        found = graph.find_in_graph(
+            {"legislator_id": None},
+            {"url": "/Legislators/Detail?member=Smith"},
+        )
+        assert found.data == {"legislator_id": 5}
+        assert found.id == leg.id
+        assert found.state == self.PipelineStateEnum.COMPLETED
+        assert graph.find_in_graph({"committee_id": None}, {"url": leg.url}) is None
+
+    def test_bubbled_completion_prunes_subtree_but_keeps_root(self, mock_logger):
+        graph, root = self._graph()
+        leg = self._legislator(graph, root)
+        vote = graph.add_new_node(
+            "https://arkleg.state.ar.us/Bills/Votes?id=HB1&rcs=1",
+            self.Keys.BILL_VOTE,
+            [leg],
+            state=self.PipelineStateEnum.AWAITING_LOAD,
+        )
+        leg.state = self.PipelineStateEnum.AWAITING_CHILDREN
+
+        vote.state = self.PipelineStateEnum.COMPLETED
+
+        assert root.state == self.PipelineStateEnum.COMPLETED
+        assert list(graph.nodes.values()) == [root]
+        assert graph.has_url(leg.url)
+        assert graph.has_url(vote.url)
+
+    def test_incomplete_subtree_is_not_pruned(self, mock_logger):
+        graph, root = self._graph()
+        leg = self._legislator(graph, root)
+        vote = graph.add_new_node(
+            "https://arkleg.state.ar.us/Bills/Votes?id=HB1&rcs=1",
+            self.Keys.BILL_VOTE,
+            [leg],
+            state=self.PipelineStateEnum.AWAITING_LOAD,
+        )
+
+        leg.state = self.PipelineStateEnum.COMPLETED
+
+        assert graph.find_node_by_url(leg.url) is leg
+        assert graph.find_node_by_url(vote.url) is vote
+
+    def test_graph_size_tracks_in_flight_nodes(self, mock_logger):
+        graph, root = self._graph()
+        for i in range(50):
+            leg = self._legislator(graph, root, self.LEG_URL.replace("Smith", f"M{i}"))
+            leg.data = {"legislator_id": i}
+            leg.state = self.PipelineStateEnum.COMPLETED
+            assert len(graph.nodes) == 1
+
+        assert len(graph.get_nodes_with_data_key("legislator_id")) == 0
+
+    def test_tombstones_survive_journal_and_snapshots(self, mock_logger, tmp_path):
+        for binary in (False, True):
+            fpath = tmp_path / f"state_cache_{binary}.json"
+            graph, root = self._graph()
+            graph.binary_snapshot = binary
+            graph.enable_journal(fpath, compact_every=1000)
+            leg = self._legislator(graph, root)
+            leg.data = {"legislator_id": 5}
+            leg.state = self.PipelineStateEnum.COMPLETED
+            graph.save_file(fpath)
+
+            replayed = self.DirectionalGraph()
+            replayed.load_from_file(fpath)
+            graph._compact(fpath)
+            compacted = self.DirectionalGraph()
+            compacted.load_from_file(fpath)
+
+            for loaded in (replayed, compacted):
+                assert loaded.find_node_by_url(leg.url) is None
+                assert loaded.has_url(leg.url)
+                found = loaded.find_in_graph({"legislator_id": None}, {"url": leg.url})
+                assert found.data == {"legislator_id": 5}
+                assert found.type == self.Keys.LEGISLATOR
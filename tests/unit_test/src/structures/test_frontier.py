@@ -0,0 +1,113 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.config.pipeline_enums import PipelineRegistryKeys as Keys
+from src.structures.frontier import Frontier
+
+
+def _node(name, node_type=Keys.BILL, session="2025/2025R"):
+    return SimpleNamespace(
+        url=f"https://arkleg.state.ar.us/{name}?ddBienniumSession={session}",
+        type=node_type,
+    )
+
+
+def _drain(frontier):
+    items = []
+    while frontier.qsize():
+        items.append(frontier.get_nowait())
+        frontier.task_done()
+    return items
+
+
+def test_lifo_is_depth_first():
+    frontier = Frontier(strategy="lifo")
+    nodes = [_node(i) for i in range(3)]
+    for node in nodes:
+        frontier.put(node)
+
+    assert _drain(frontier) == nodes[::-1]
+
+
+def test_fifo_is_breadth_first():
+    frontier = Frontier(strategy="fifo")
+    nodes = [_node(i) for i in range(3)]
+    for node in nodes:
+        frontier.put(node)
+
+    assert _drain(frontier) == nodes
+
+
+def test_priority_fetches_legislators_before_bills():
+    frontier = Frontier(strategy="priority")
+    vote = _node("vote", Keys.BILL_VOTE)
+    bill = _node("bill", Keys.BILL)
+    legislator = _node("legislator", Keys.LEGISLATOR)
+    committee = _node("committee", Keys.COMMITTEE)
+    for node in (vote, bill, legislator, committee):
+        frontier.put(node)
+
+    assert _drain(frontier) == [committee, legislator, bill, vote]
+
+
+def test_round_robin_alternates_sessions():
+    frontier = Frontier(strategy="round_robin")
+    a1, a2 = _node("a1", session="2023/2023R"), _node("a2", session="2023/2023R")
+    b1 = _node("b1", session="2025/2025R")
+    for node in (a1, a2, b1):
+        frontier.put(node)
+
+    assert _drain(frontier) == [a2, b1, a1]
+
+
+def test_sentinel_is_returned_first():
+    frontier = Frontier(strategy="fifo")
+    frontier.put(_node(1))
+    frontier.put(None)
+
+    assert frontier.get_nowait() is None
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown frontier strategy"):
+        Frontier(strategy="random")
+
+
+def test_spills_to_disk_beyond_max_in_memory(tmp_path):
+    nodes = {node.url: node for node in (_node(i) for i in range(10))}
+    frontier = Frontier(
+        strategy="fifo",
+        max_in_memory=4,
+        spill_dir=tmp_path,
+        resolve=nodes.get,
+    )
+    for node in nodes.values():
+        frontier.put(node)
+
+    assert len(frontier.order) == 4
+    assert frontier.qsize() == 10
+    assert _drain(frontier) == list(nodes.values())
+    assert not (tmp_path / "frontier_spill.jsonl").exists()
+
+
+def test_spilled_nodes_gone_from_graph_are_marked_done(tmp_path):
+    nodes = {node.url: node for node in (_node(i) for i in range(4))}
+    frontier = Frontier(strategy="fifo", max_in_memory=1, spill_dir=tmp_path, resolve=nodes.get)
+    first, *spilled = nodes.values()
+    for node in nodes.values():
+        frontier.put(node)
+    del nodes[spilled[0].url]
+
+    assert frontier.get() is first
+    frontier.task_done()
+    assert frontier.get() is spilled[1]
+    frontier.task_done()
+    assert frontier.get() is spilled[2]
+    frontier.task_done()
+
+    joined = threading.Thread(target=frontier.join)
+    joined.start()
+    joined.join(timeout=1)
+    assert not joined.is_alive()
@@ -0,0 +1,39 @@
+from src.structures.graph_traversal import walk
+
+
+def _neighbours(edges):
+    return lambda node: edges.get(node, [])
+
+
+class TestWalk:
+    """Unit tests for the iterative graph walk."""
+
+    def test_preorder_visits_first_neighbour_first(self):
+        edges = {"a": ["b", "c"], "b": ["d"]}
+
+        assert list(walk("a", _neighbours(edges))) == [("a", 0), ("b", 1), ("d", 2), ("c", 1)]
+
+    def test_postorder_yields_descendants_before_node(self):
+        edges = {"a": ["b", "c"], "b": ["d"]}
+
+        order = [node for node, _ in walk("a", _neighbours(edges), postorder=True)]
+
+        assert order == ["d", "b", "c", "a"]
+
+    def test_cycles_and_shared_nodes_visited_once(self):
+        edges = {"a": ["b", "c"], "b": ["c"], "c": ["a"]}
+
+        assert sorted(node for node, _ in walk("a", _neighbours(edges))) == ["a", "b", "c"]
+
+    def test_max_depth_stops_expansion(self):
+        edges = {"a": ["b"], "b": ["c"], "c": ["d"]}
+
+        assert [node for node, _ in walk("a", _neighbours(edges), max_depth=1)] == ["a", "b"]
+
+    def test_deep_chain_does_not_recurse(self):
+        depth = 20_000
+        edges = {i: [i + 1] for i in range(depth)}
+
+        *_, last = walk(0, _neighbours(edges))
+
+        assert last == (depth, depth)
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from queue import LifoQueue, Queue
 from typing import Never
 from unittest import mock
@@ -8,10 +10,15 @@ import pytest
 
 from src.data_pipeline.extract.html_parser import HTMLParser
 from src.data_pipeline.transform.pipeline_transformer import PipelineTransformer
+from src.data_pipeline.utils.change_ledger import ChangeLedger
 from src.data_pipeline.utils.fetch_scheduler import FetchScheduler
+from src.data_pipeline.utils.parsed_pages import ParsedPages
 from src.structures.indexed_tree import PipelineStateEnum
+from src.workers.base_worker import SentinelBarrier
 from src.workers.pipeline_workers import (
+    AsyncCrawlerWorker,
     CrawlerWorker,
+    LinkDiscoveryWorker,
     LoaderObj,
     LoaderWorker,
     ProcessorWorker,
@@ -82,6 +89,7 @@ def fake_graph(fake_node):
         return graph.nodes[url]
 
     graph.add_new_node.side_effect = _add_new_node
+    graph.has_url.side_effect = lambda url: url in graph.nodes
     return graph
 
 @pytest.fixture
@@ -245,6 +253,255 @@ class TestCrawlerWorker:
         assert process_q.get() is None
         assert process_q.qsize() == 0
 
+    def test_workers_share_crawler_pool(self, worker, fake_graph, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        worker.create_crawlers({fake_node})
+        other = CrawlerWorker(
+            input_queue=fetch_q,
+            output_queue=process_q,
+            state=fake_graph,
+            crawler_cls=worker.crawler_cls,
+            parser=MagicMock(spec=HTMLParser),
+            fun_registry=MagicMock(),
+            fetch_scheduler=worker.fetch_scheduler,
+            crawlers=worker.crawlers,
+        )
+
+        other.create_crawlers({fake_node})
+
+        assert worker.crawler_cls.call_count == 1
+        assert other.crawlers is worker.crawlers
+
+    def test_process_fetches_next_scheduled_node(self, worker, fake_node):
+        domain = urlparse(fake_node.url).netloc
+        worker.create_crawlers({fake_node})
+        worker.crawlers[domain].get_page.return_value = "<html>"
+        worker.parser.get_content.return_value = {"links": []}
+        worker.fun_registry.get_processor.return_value = None
+        queued = type(fake_node)()
+        queued.url = "arkleg.state.ar.us/Legislators/List?ddBienniumSession=2021%2F2021R"
+        queued.outgoing = set()
+        worker.fetch_scheduler.submit(queued, domain)  # submitted by another worker
+
+        worker.process(fake_node)
+
+        assert queued.state == PipelineStateEnum.COMPLETED
+        assert fake_node.state is None
+        assert len(worker.fetch_scheduler) == 1
+
+
+    def test_unchanged_page_skips_processing(self, worker, fake_node, lifoqueues, tmp_path):
+        _fetch_q, process_q = lifoqueues
+        fake_node.outgoing = set()
+        worker._check_processing_step = MagicMock(return_value=True)
+        worker.change_ledger = ChangeLedger(tmp_path / "fingerprints.jsonl")
+        worker.change_ledger.unchanged(fake_node.url, "<html>")
+        worker.change_ledger.record_loaded(fake_node.url, {"bill_id": 7})
+
+        worker.resolve_node(fake_node, "<html>")
+
+        assert fake_node.state == PipelineStateEnum.COMPLETED
+        assert fake_node.data == {"bill_id": 7}
+        assert process_q.qsize() == 0
+
+    def test_changed_page_is_processed(self, worker, fake_node, lifoqueues, tmp_path):
+        _fetch_q, process_q = lifoqueues
+        fake_node.outgoing = set()
+        worker._check_processing_step = MagicMock(return_value=True)
+        worker.change_ledger = ChangeLedger(tmp_path / "fingerprints.jsonl")
+
+        worker.resolve_node(fake_node, "<html>")
+
+        assert fake_node.state == PipelineStateEnum.AWAITING_PROCESSING
+        assert process_q.qsize() == 1
+        assert fake_node.url in worker.change_ledger.pending
+
+
+    def test_process_hands_page_to_discovery(self, worker, fake_node, lifoqueues):
+        fetch_q, _process_q = lifoqueues
+        worker.discover_queue = Queue()
+        worker.create_crawlers({fake_node})
+        worker.crawlers[urlparse(fake_node.url).netloc].get_page.return_value = "<html>"
+        fetch_q.put(fake_node)
+        fetch_q.get()
+
+        worker.process(fake_node)
+        worker.mark_done()
+
+        assert worker.discover_queue.get_nowait() == (fake_node, "<html>")
+        assert fake_node.state == PipelineStateEnum.FETCHING
+        assert fetch_q.unfinished_tasks == 1  # done by discovery
+        worker.parser.get_content.assert_not_called()
+
+
+    def test_error_does_not_inject_a_sentinel(self, worker, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        worker.sentinel_barrier = SentinelBarrier(2)
+        worker.create_crawlers({fake_node})
+        worker.crawlers[urlparse(fake_node.url).netloc].get_page.side_effect = Exception("boom")
+
+        fetch_q.put(None)
+        fetch_q.put(fake_node)
+        worker.start()
+        worker.join()
+
+        assert fake_node.state == PipelineStateEnum.ERROR
+        assert fetch_q.qsize() == 0
+        assert process_q.qsize() == 0  # the other producer of PROCESS is still running
+
+
+class TestSentinelBarrier:
+
+    def test_last_producer_forwards_one_sentinel_per_consumer(self):
+        output_queue = Queue()
+        barrier = SentinelBarrier(3, consumers=2)
+
+        barrier.arrive(output_queue)
+        barrier.arrive(output_queue)
+        assert output_queue.qsize() == 0
+
+        barrier.arrive(output_queue)
+        assert [output_queue.get_nowait(), output_queue.get_nowait()] == [None, None]
+        assert output_queue.qsize() == 0
+
+
+class TestLinkDiscoveryWorker:
+
+    def test_handles_page_then_marks_fetch_task_done(self, fake_graph, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        discover_q = Queue()
+        parser = MagicMock(spec=HTMLParser)
+        parser.get_content.return_value = {"links": ["/Bills/Detail?id=1"]}
+        discovery = LinkDiscoveryWorker(
+            discover_q,
+            process_q,
+            fake_graph,
+            parser,
+            MagicMock(),
+            links_queue=fetch_q,
+        )
+        discovery._check_processing_step = MagicMock(return_value=True)
+        fake_node.url = "https://arkleg.state.ar.us/Bills/List"
+        fake_node.outgoing = set()
+        fetch_q.put(fake_node)
+        fetch_q.get()  # taken by a crawler worker, which handed off the page
+        discover_q.put((fake_node, "<html>"))
+
+        discovery.start()
+        discover_q.join()
+        discover_q.put(None)
+        discovery.join(timeout=2)
+
+        assert not discovery.is_alive()
+        assert fetch_q.unfinished_tasks == 1  # the handed off page is done, its link is queued
+        assert fetch_q.get_nowait() is fake_graph.nodes["https://arkleg.state.ar.us/Bills/Detail?id=1"]
+        assert fake_node.state == PipelineStateEnum.AWAITING_PROCESSING
+        assert fake_node.data["html"] == "<html>"
+        assert process_q.get() is None  # sentinel passed on, LIFO
+        assert process_q.get() is fake_node
+
+    def test_error_does_not_stop_discovery(self, fake_graph, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        discover_q = Queue()
+        parser = MagicMock(spec=HTMLParser)
+        parser.get_content.side_effect = ValueError("bad page")
+        discovery = LinkDiscoveryWorker(
+            discover_q,
+            process_q,
+            fake_graph,
+            parser,
+            MagicMock(),
+            links_queue=fetch_q,
+        )
+        fetch_q.put(fake_node)
+        fetch_q.get()
+        discover_q.put((fake_node, "<html>"))
+
+        discovery.start()
+        fetch_q.join()
+
+        assert fake_node.state == PipelineStateEnum.ERROR
+        assert discovery.is_alive()
+        discover_q.put(None)
+        discovery.join(timeout=2)
+
+
+    def test_page_is_parsed_once_for_links_and_data(self, fake_graph, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        parser = MagicMock(wraps=HTMLParser())
+        registry = MagicMock()
+        registry.get_processor.side_effect = lambda _key, stage: (
+            {"links": ("a", "href")}
+            if stage.name == "FETCH"
+            else {"title": ("h1", lambda x: x), "state_x": (None, None)}
+        )
+        discovery = LinkDiscoveryWorker(
+            Queue(),
+            process_q,
+            fake_graph,
+            parser,
+            registry,
+            links_queue=fetch_q,
+            parsed_pages=ParsedPages(),
+        )
+        fake_node.url = "https://arkleg.state.ar.us/Bills/Detail?id=HB1001"
+        fake_node.outgoing = set()
+
+        discovery.process((fake_node, '<h1>HB1001</h1><a href="/Bills/Votes?id=1">v</a>'))
+
+        parser.parse.assert_called_once()
+        assert fetch_q.qsize() == 1
+        assert discovery.parsed_pages.get(fake_node.url) == {"title": ["HB1001"]}
+
+
+class TestAsyncCrawlerWorker:
+
+    def test_fetches_nodes_concurrently(self, fake_graph, fake_node, lifoqueues):
+        fetch_q, process_q = lifoqueues
+        started = []
+
+        async def get_page(url):
+            started.append(url)
+            await asyncio.sleep(0.1)
+            return f"<html>{url}</html>"
+
+        crawler_cls = MagicMock()
+        crawler_cls.return_value.get_page.side_effect = get_page
+        parser = MagicMock(spec=HTMLParser)
+        parser.get_content.return_value = None
+        worker = AsyncCrawlerWorker(
+            input_queue=fetch_q,
+            output_queue=process_q,
+            state=fake_graph,
+            crawler_cls=crawler_cls,
+            parser=parser,
+            fun_registry=MagicMock(),
+            fetch_scheduler=FetchScheduler(0.01, max_rate=1000),
+        )
+        worker._check_processing_step = MagicMock(return_value=True)
+        nodes = []
+        for i in range(3):
+            node = type(fake_node)()
+            node.url = f"https://arkleg.state.ar.us/Bills/Detail?id={i}"
+            node.outgoing = set()
+            nodes.append(node)
+            fetch_q.put(node)
+        fake_graph.roots = {nodes[0]}
+
+        start = time.monotonic()
+        worker.start()
+        fetch_q.join()
+        elapsed = time.monotonic() - start
+        fetch_q.put(None)
+        worker.join(timeout=2)
+
+        assert not worker.is_alive()
+        assert elapsed < 0.25  # three 0.1s fetches overlapped
+        assert all(node.state == PipelineStateEnum.AWAITING_PROCESSING for node in nodes)
+        assert nodes[0].data["html"] == f"<html>{nodes[0].url}</html>"
+        assert process_q.get() is None  # sentinel passed on, LIFO
+        assert {id(process_q.get()) for _ in range(3)} == {id(node) for node in nodes}
+
 
 @pytest.fixture
 def processor_worker(fake_graph):
@@ -293,6 +550,38 @@ class TestProcessorWorker:
         assert fake_node.data["transformed_key"] == "transformed_value"
         assert processor_worker.output_queue.get_nowait() == fake_node
 
+    def test_process_uses_data_extracted_at_fetch(self, processor_worker, fake_node):
+        processor_worker.parsed_pages = ParsedPages()
+        processor_worker.parsed_pages.put(fake_node.url, {"title": ["HB1001"]})
+        processor_worker.transformer.transform_content.return_value = {"title": "HB1001"}
+        processor_worker.fun_registry.get_processor.return_value = {"title": ("h1", "tr")}
+
+        processor_worker.process(fake_node)
+
+        processor_worker.parser.get_content.assert_not_called()
+        parsed = processor_worker.transformer.transform_content.call_args.args[1]
+        assert parsed["title"] == ["HB1001"]
+        assert fake_node.state == PipelineStateEnum.AWAITING_LOAD
+
+    def test_requeued_node_keeps_extracted_data(self, processor_worker, fake_node):
+        processor_worker.parsed_pages = ParsedPages()
+        processor_worker.parsed_pages.put(fake_node.url, {"title": ["HB1001"]})
+        processor_worker.transformer.transform_content.return_value = {"title": "HB1001"}
+        processor_worker.fun_registry.get_processor.return_value = {
+            "state_key": (lambda n, s, y: None, lambda x: "fn"),
+            "title": ("h1", "tr"),
+        }
+
+        with mock.patch("time.sleep"):
+            processor_worker.process(fake_node)
+
+        assert processor_worker.input_queue.get_nowait() is fake_node
+        assert processor_worker.parsed_pages.get(fake_node.url) == {"title": ["HB1001"]}
+        processor_worker.parser.get_content.assert_not_called()
+
+        processor_worker.handle_error(fake_node)
+        assert len(processor_worker.parsed_pages) == 0
+
     def test_process_raises_on_invalid_loader(self, processor_worker, fake_node):
         """
         Ensure ProcessorWorker.process raises an exception when the loader object
@@ -380,6 +669,17 @@ class TestLoaderWorker:
         fake_db_conn.rollback.assert_not_called()
         fake_graph.safe_remove_root.assert_called_with(fake_loader_obj.url, mock.ANY)
 
+    def test_process_records_load_in_change_ledger(self, loader_worker, fake_loader_obj, tmp_path):
+        fake_loader_obj.outgoing = set()
+        ledger = ChangeLedger(tmp_path / "fingerprints.jsonl")
+        ledger.unchanged(fake_loader_obj.url, "<html>")
+        loader_worker.change_ledger = ledger
+
+        loader_worker.process(fake_loader_obj)
+
+        assert ledger.unchanged(fake_loader_obj.url, "<html>")
+        assert ledger.loaded_result(fake_loader_obj.url) == {"db_result": "ok"}
+
     def test_process_load_returns_none(self, loader_worker, fake_loader_obj, fake_db_conn):
         fake_loader = MagicMock()
         fake_loader.execute.return_value = None  # simulate SQL execution returning None